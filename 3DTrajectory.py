@@ -3,10 +3,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from SharedDataset import load_frame
 
 # 1. VERİ HAZIRLIĞI
 #df = pd.read_csv('DetailToAnalyse.csv')
-df = pd.read_csv('DnzRec.csv')
+df, shared = load_frame('DnzRec.csv')   # SharedDataset.py ile paylaşıldıysa kopyasız bağlanır
 df.columns = [col.strip().replace('"', '') for col in df.columns]
 
 # Hız verilerini al (Feet/Saniye kabul ediyoruz)
@@ -0,0 +1,244 @@
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import subprocess
+import statistics
+from contextlib import redirect_stdout
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import numpy as np
+import pandas as pd
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import SyntheticFlight
+from HeaderParser import read_recording
+from DerivedCache import scaled_hypot, rolling_mean, scaled_abs_cummax, rate_of_change
+from KalmanSmooth import fused_attitude, fused_altitude
+import Derivatives
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+RESULTS_DIR = 'bench_results'
+DATA_DIR = 'bench_data'
+DEFAULT_HOURS = 1.0
+REPEAT = 5
+UI_FRAMES = 200
+PLOT_DOWNSAMPLE = 100
+
+
+def timed(func, repeat=REPEAT):
+    runs = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        func()
+        runs.append((time.perf_counter() - t) * 1000.0)
+    return runs
+
+def quiet(func):
+    # Yükleme fonksiyonlarının ekrana yazdıklarını bastır
+    def wrapped():
+        with redirect_stdout(io.StringIO()):
+            return func()
+    return wrapped
+
+
+# ---------------------------------------------------------
+# 1. ÖLÇÜMLER
+# ---------------------------------------------------------
+def bench_load(path, repeat):
+    import FlightDashboard_3D as F
+    cache_dir = path + '.cache'
+
+    def load():
+        app = F.CockpitApp.__new__(F.CockpitApp)
+        app.load_data(path)
+        return app
+
+    def cold():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        load()
+
+    results = {"load_cold": timed(quiet(cold), repeat)}
+    quiet(load)()  # önbelleği doldur
+    results["load_warm"] = timed(quiet(load), repeat)
+    return results, quiet(load)().df
+
+def bench_read(path, repeat):
+    # 22 sütunlu düzen: analiz betiklerinin yaptığı gibi tüm kaydı oku
+    results = {"read_all_columns": timed(lambda: read_recording(path), repeat)}
+    return results, read_recording(path)
+
+def bench_derived(path, repeat):
+    df = pd.read_csv(path)
+    vx, vy = df["VelocityX"].values, df["VelocityY"].values
+    alt = df["BlendedEllipsoidHeight"].values
+    rr, roll = df["RollRate"].values, df["RollAngle"].values
+    vz = df["VelocityZ"].values
+    return {
+        "derived_groundspeed": timed(lambda: scaled_hypot(vx, vy, 0.592484), repeat),
+        "derived_alt_smooth": timed(lambda: rolling_mean(alt, 20), repeat),
+        "derived_rate_max": timed(lambda: scaled_abs_cummax(rr, 180.0), repeat),
+        "derived_rate_of_change": timed(lambda: rate_of_change(roll, 0.05, 5), repeat),
+        # Türev motoru: tek geçiş Savitzky-Golay / merkezi fark
+        "deriv_savgol_d1": timed(lambda: Derivatives.savgol_rate(roll, 0.05, 9, 2), repeat),
+        "deriv_savgol_d1_d2": timed(lambda: Derivatives.derivatives(roll, 0.05, "savgol", 9, 2), repeat),
+        "deriv_central_d1": timed(lambda: Derivatives.central_rate(roll, 0.05, 3), repeat),
+        # Eski merkezli ortalama ile hız füzyonlu filtre karşılaştırması
+        "smooth_roll_rolling": timed(lambda: rolling_mean(roll, 10), repeat),
+        "smooth_roll_kalman": timed(lambda: fused_attitude(roll, rr), repeat),
+        "smooth_alt_kalman": timed(lambda: fused_altitude(alt, vz), repeat),
+    }
+
+def bench_update_ui(path, frames):
+    # Ekran (DISPLAY) yoksa atlanır
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        return {}, f"update_ui atlandı: {e}"
+    import FlightDashboard_3D as F
+    F.LAZY_START = False   # veri ve grafikler kurucu içinde yüklensin
+    with redirect_stdout(io.StringIO()):
+        app = F.CockpitApp(root, path)
+    step = max(1, app.total_frames // frames)
+    runs = []
+    for k in range(frames):
+        app.current_frame = k * step
+        t = time.perf_counter()
+        app.update_ui()
+        root.update()   # draw_idle ile ertelenen çizimler dahil
+        runs.append((time.perf_counter() - t) * 1000.0)
+    phases = {name: avg for name, (avg, _) in app.profiler.summary(last=frames).items()}
+    with redirect_stdout(io.StringIO()):
+        app.on_closing()
+    return {"update_ui_frame": runs}, phases
+
+def bench_startup(repeat):
+    # Ayrı süreçte modül yükleme süresi (pencereden önceki import maliyeti)
+    code = "import FlightDashboard_3D"
+    def run():
+        subprocess.run([sys.executable, "-c", code], check=True)
+    base = timed(lambda: subprocess.run([sys.executable, "-c", "pass"], check=True), repeat)
+    return {"startup_import": timed(run, repeat), "startup_python": base}
+
+def bench_render(df, repeat):
+    step = PLOT_DOWNSAMPLE
+    xs = df['BlendedLongitude'].values[::step]
+    ys = df['BlendedLatitude'].values[::step]
+    zs = df['Altitude'].values[::step]
+
+    def track():
+        fig = Figure(figsize=(8, 6), dpi=100)
+        ax = fig.add_subplot(111, projection='3d')
+        ax.plot(xs, ys, zs, linewidth=0.8)
+        FigureCanvasAgg(fig).draw()
+
+    def rates():
+        fig = Figure(figsize=(4, 3), dpi=100)
+        ax = fig.add_subplot(111)
+        x = np.arange(0, len(df), step)
+        for c in ['RollRate', 'PitchRate', 'YawRate']:
+            ax.plot(x, df[c].values[::step], linewidth=0.8)
+        FigureCanvasAgg(fig).draw()
+
+    return {"render_3d_track": timed(track, repeat), "render_rate_plot": timed(rates, repeat)}
+
+
+# ---------------------------------------------------------
+# 2. SONUÇLAR
+# ---------------------------------------------------------
+def git_info():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = "unknown", False
+    return commit, dirty
+
+def summarize(runs):
+    return {"median_ms": statistics.median(runs), "min_ms": min(runs), "runs": runs}
+
+def compare(old_path, new):
+    with open(old_path) as f:
+        old = json.load(f)
+    if old["meta"]["rows"] != new["meta"]["rows"]:
+        print("UYARI: Farklı veri boyutları karşılaştırılıyor!")
+    print(f"\n{'Ölçüm':<26}{old['meta']['commit']:>12}{new['meta']['commit']:>12}{'Oran':>8}")
+    for name, res in new["results"].items():
+        if name in old["results"]:
+            a, b = old["results"][name]["median_ms"], res["median_ms"]
+            print(f"{name:<26}{a:>10.2f}ms{b:>10.2f}ms{b / a if a else 0:>8.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik kayıtlarla performans ölçümü")
+    parser.add_argument("--hours", type=float, default=DEFAULT_HOURS)
+    parser.add_argument("--layout", choices=sorted(SyntheticFlight.LAYOUTS), default="extended")
+    parser.add_argument("--seed", type=int, default=SyntheticFlight.DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--frames", type=int, default=UI_FRAMES)
+    parser.add_argument("--compare", metavar="JSON", help="Önceki bir sonuç dosyası ile karşılaştır")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    print("Veri hazırlanıyor...")
+    path = SyntheticFlight.cached_path(DATA_DIR, args.hours * 3600, args.layout, args.seed)
+    commit, dirty = git_info()
+
+    results, notes = {}, {}
+    if args.layout == "extended":
+        res, df = bench_load(path, args.repeat)
+    else:
+        res, df = bench_read(path, args.repeat)
+    results.update(res)
+    if args.layout == "extended":
+        results.update(bench_derived(path, args.repeat))
+        # Türev doğruluğu (RMS, derece/sn): bilinen sinüs + kayıttaki PlatformAzimuth' <-> YawRate
+        acc = Derivatives.accuracy_synthetic() + Derivatives.accuracy_recording(
+            pd.read_csv(path, usecols=["PlatformAzimuth", "YawRate"]))
+        notes["derivative_rms"] = {f"{r['test']} | {r['method']}": round(r.get("rms_d1", r.get("rms_d2")), 5)
+                                   for r in acc}
+        res, phases = bench_update_ui(path, args.frames)
+        results.update(res)
+        notes["update_ui_phases_ms"] = phases
+        results.update(bench_render(df, args.repeat))
+        results.update(bench_startup(args.repeat))
+
+    report = {
+        "meta": {"commit": commit, "dirty": dirty, "hours": args.hours, "layout": args.layout,
+                 "seed": args.seed, "rows": len(df), "repeat": args.repeat,
+                 "python": platform.python_version(), "numpy": np.__version__,
+                 "pandas": pd.__version__, "matplotlib": matplotlib.__version__,
+                 "machine": platform.machine(), "cpus": os.cpu_count(),
+                 "date": time.strftime('%Y-%m-%d %H:%M:%S')},
+        "results": {k: summarize(v) for k, v in results.items()},
+        "notes": notes,
+    }
+
+    print(f"\n{len(df)} kayıt, commit {commit}{' (değişiklik var)' if dirty else ''}")
+    for name, r in report["results"].items():
+        print(f"{name:<26}{r['median_ms']:>10.2f} ms (min {r['min_ms']:.2f})")
+    for k, v in notes.items():
+        print(f"{k}: {v}")
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"{commit}_{args.layout}_{args.hours:g}h.json")
+        with open(out, 'w') as f:
+            json.dump(report, f, indent=1)
+        print(f"Kaydedildi: {out}")
+    if args.compare:
+        compare(args.compare, report)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+import io
+import os
+import sys
+import json
+import zlib
+import struct
+import argparse
+import numpy as np
+import pandas as pd
+from HeaderParser import read_recording, iter_recording, sniff_header
+from ParallelCsv import read_csv_auto
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+REC_EXT = '.nrec'
+SAMPLE_RATE = 20
+CHUNK_SECONDS = 10            # Her blok ~10 sn (200 satır)
+COMPRESS_LEVEL = 6
+TIME_COLUMN = 'TimeMarker'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+CSV_FLOAT_FORMAT = '%.9g'     # float32 hassasiyeti
+READ_CHUNK_ROWS = 200000      # CSV dönüşümünde parça boyu
+INTEGER_COLUMNS = ('Id',)     # Sadece bilinen sayaç/kimlik sütunları tamsayı saklanır
+
+MAGIC = b'NAVREC\x01\x00'
+MAGIC_END = b'NAVIDX\x01\x00'
+TAIL = struct.Struct('<QQ8s')  # index_offset, index_len, MAGIC_END
+NAT = np.iinfo(np.int64).min
+
+# Dosya düzeni:
+#   MAGIC | u32 başlık uzunluğu | başlık (JSON: sütunlar ve tipleri)
+#   blok 0 | blok 1 | ...      (her blok zlib; içinde sütunlar arka arkaya)
+#   indeks (npz) | TAIL
+# Sütun tipleri: 't' = TimeMarker (int64 epoch sn, fark kodlu),
+#                'i8' = INTEGER_COLUMNS (Id), 'f4' = diğer tüm kanallar.
+# Ölçüm kanalları ilk parçada tam sayı görünse de (ör. TrueAirSpeed "421")
+# float saklanır; sonraki parçalardaki kesirler ve boşluklar korunur.
+# Bloklar bayt karıştırma (shuffle) ile sıkıştırılır: float'ların üs baytları
+# yan yana gelir ve zlib çok daha iyi sıkıştırır.
+
+
+def _shuffle(arr):
+    a = np.ascontiguousarray(arr)
+    return a.view(np.uint8).reshape(-1, a.itemsize).T.tobytes()
+
+def _unshuffle(buf, dtype, n):
+    dtype = np.dtype(dtype)
+    raw = np.frombuffer(buf, np.uint8).reshape(dtype.itemsize, n)
+    return np.ascontiguousarray(raw.T).view(dtype).ravel()
+
+def _storage_dtype(kind):
+    return np.dtype('<i8') if kind in ('t', 'i8') else np.dtype('<f4')
+
+def infer_schema(df):
+    schema = []
+    for c in df.columns:
+        if c == TIME_COLUMN:
+            schema.append((c, 't'))
+        elif c in INTEGER_COLUMNS and pd.api.types.is_integer_dtype(df[c]):
+            schema.append((c, 'i8'))
+        else:
+            schema.append((c, 'f4'))
+    return schema
+
+def _encode_column(values, kind):
+    if kind == 't':
+        raw = pd.Series(values)
+        t = pd.to_datetime(raw, errors='coerce', format=TIME_FORMAT)
+        bad = t.isna() & raw.notna()
+        if bad.any():
+            t[bad] = pd.to_datetime(raw[bad], errors='coerce')
+        return t.values.astype('datetime64[s]').astype(np.int64)   # NaT -> NAT
+    if kind == 'i8':
+        v = pd.to_numeric(pd.Series(values), errors='coerce')
+        bad = v.isna() | (v != v.round())
+        if bad.any():
+            raise ValueError(f"Tamsayı sütunda boş veya kesirli değer: {values[bad.values][:3].tolist()}")
+        return v.values.astype('<i8')
+    return pd.to_numeric(pd.Series(values), errors='coerce').values.astype('<f4')
+
+
+class RecordingWriter:
+    def __init__(self, path, schema, chunk_rows=CHUNK_SECONDS * SAMPLE_RATE, sample_rate=SAMPLE_RATE):
+        self.path = path
+        self.schema = list(schema)
+        self.chunk_rows = chunk_rows
+        self.f = open(path, 'wb')
+        header = json.dumps({"columns": self.schema, "chunk_rows": chunk_rows,
+                             "sample_rate": sample_rate, "codec": "zlib+shuffle"}).encode('utf-8')
+        self.f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self.pending = []        # kodlanmış, henüz bloğa yazılmamış sütunlar
+        self.pending_rows = 0
+        self.offsets, self.lengths, self.row_starts = [], [], []
+        self.t_first, self.t_last = [], []
+        self.n_rows = 0
+
+    def write(self, df):
+        # Sütunlar gelen parça için bir kez kodlanır, bloklara sonra bölünür
+        n = len(df)
+        cols = {}
+        for name, kind in self.schema:
+            if name in df.columns:
+                cols[name] = _encode_column(df[name].values, kind)
+            else:
+                cols[name] = np.full(n, np.nan, '<f4') if kind == 'f4' else np.zeros(n, '<i8')
+        self.pending.append(cols)
+        self.pending_rows += n
+        if self.pending_rows >= self.chunk_rows:
+            self._drain(final=False)
+
+    def _drain(self, final):
+        if not self.pending: return
+        merged = {name: (np.concatenate([p[name] for p in self.pending]) if len(self.pending) > 1
+                         else self.pending[0][name]) for name, _ in self.schema}
+        n, pos = self.pending_rows, 0
+        while n - pos >= self.chunk_rows or (final and pos < n):
+            m = min(self.chunk_rows, n - pos)
+            self._flush({k: v[pos:pos + m] for k, v in merged.items()}, m)
+            pos += m
+        self.pending = [{k: v[pos:] for k, v in merged.items()}] if pos < n else []
+        self.pending_rows = n - pos
+
+    def _flush(self, block, n):
+        parts = []
+        t0 = t1 = NAT
+        for name, kind in self.schema:
+            vals = block[name]
+            if kind == 't':
+                valid = vals[vals != NAT]
+                if len(valid):
+                    t0, t1 = int(valid.min()), int(valid.max())
+                # Fark kodlama (int64 taşması modüler; cumsum ile birebir geri döner)
+                vals = np.diff(vals, prepend=np.int64(0))
+            parts.append(_shuffle(vals))
+        payload = zlib.compress(b''.join(parts), COMPRESS_LEVEL)
+        self.offsets.append(self.f.tell())
+        self.lengths.append(len(payload))
+        self.row_starts.append(self.n_rows)
+        self.t_first.append(t0)
+        self.t_last.append(t1)
+        self.f.write(payload)
+        self.n_rows += n
+
+    def close(self):
+        self._drain(final=True)
+        buf = io.BytesIO()
+        np.savez(buf, offsets=np.array(self.offsets, np.int64), lengths=np.array(self.lengths, np.int64),
+                 row_starts=np.array(self.row_starts + [self.n_rows], np.int64),
+                 t_first=np.array(self.t_first, np.int64), t_last=np.array(self.t_last, np.int64))
+        index_offset = self.f.tell()
+        self.f.write(buf.getvalue())
+        self.f.write(TAIL.pack(index_offset, len(buf.getvalue()), MAGIC_END))
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordingReader:
+    # Sadece istenen satır aralığına denk gelen bloklar açılır.
+    def __init__(self, path):
+        self.path = path
+        self.f = open(path, 'rb')
+        if self.f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: geçerli bir {REC_EXT} dosyası değil")
+        (hlen,) = struct.unpack('<I', self.f.read(4))
+        header = json.loads(self.f.read(hlen).decode('utf-8'))
+        self.schema = [tuple(c) for c in header["columns"]]
+        self.columns = [c for c, _ in self.schema]
+        self.chunk_rows = header["chunk_rows"]
+        self.sample_rate = header.get("sample_rate", SAMPLE_RATE)
+
+        self.f.seek(-TAIL.size, os.SEEK_END)
+        index_offset, index_len, magic = TAIL.unpack(self.f.read(TAIL.size))
+        if magic != MAGIC_END:
+            raise ValueError(f"{path}: indeks bulunamadı (dosya yarım kalmış olabilir)")
+        self.f.seek(index_offset)
+        idx = np.load(io.BytesIO(self.f.read(index_len)))
+        self.offsets, self.lengths = idx["offsets"], idx["lengths"]
+        self.row_starts = idx["row_starts"]
+        self.t_first, self.t_last = idx["t_first"], idx["t_last"]
+        self.n_rows = int(self.row_starts[-1])
+        self.n_chunks = len(self.offsets)
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.n_rows
+
+    def chunk_of_row(self, row):
+        return int(np.searchsorted(self.row_starts, row, side='right') - 1)
+
+    def _decode_chunk(self, k, wanted):
+        self.f.seek(int(self.offsets[k]))
+        raw = zlib.decompress(self.f.read(int(self.lengths[k])))
+        n = int(self.row_starts[k + 1] - self.row_starts[k])
+        out, pos = {}, 0
+        for name, kind in self.schema:
+            dt = _storage_dtype(kind)
+            size = n * dt.itemsize
+            if name in wanted:
+                vals = _unshuffle(raw[pos:pos + size], dt, n)
+                out[name] = np.cumsum(vals) if kind == 't' else vals
+            pos += size
+        return out
+
+    def read(self, columns=None, start=0, stop=None):
+        # -> {sütun: ndarray}; TimeMarker datetime64[s] olarak döner
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        start = max(0, start)
+        wanted = [c for c in (columns or self.columns) if c in self.columns]
+        kinds = dict(self.schema)
+        out = {c: np.empty(max(0, stop - start), _storage_dtype(kinds[c])) for c in wanted}
+        if stop > start:
+            for k in range(self.chunk_of_row(start), self.chunk_of_row(stop - 1) + 1):
+                block = self._decode_chunk(k, set(wanted))
+                r0 = int(self.row_starts[k])
+                a, b = max(start, r0) - r0, min(stop, int(self.row_starts[k + 1])) - r0
+                for c in wanted:
+                    out[c][r0 + a - start:r0 + b - start] = block[c][a:b]
+        for c in wanted:
+            if kinds[c] == 't':
+                out[c] = out[c].astype('datetime64[s]')   # NAT -> NaT
+        return out
+
+    def to_dataframe(self, columns=None, start=0, stop=None):
+        df = pd.DataFrame(self.read(columns, start, stop))
+        df.index = pd.RangeIndex(max(0, start), max(0, start) + len(df))
+        return df
+
+
+# ---------------------------------------------------------
+# DÖNÜŞTÜRÜCÜLER VE YÜKLEME
+# ---------------------------------------------------------
+def csv_to_rec(csv_path, rec_path, chunk_seconds=CHUNK_SECONDS):
+    header = sniff_header(csv_path)
+    writer = None
+    for df in iter_recording(csv_path, header=header, chunksize=READ_CHUNK_ROWS):
+        if writer is None:
+            writer = RecordingWriter(rec_path, infer_schema(df), chunk_rows=chunk_seconds * SAMPLE_RATE)
+        writer.write(df)
+    if writer is None:
+        writer = RecordingWriter(rec_path, [(c, 'f4') for c in header.columns])
+    writer.close()
+    return writer.n_rows
+
+def rec_to_csv(rec_path, csv_path):
+    with RecordingReader(rec_path) as rec, open(csv_path, 'w', newline='') as f:
+        f.write(",".join(f'"{c}"' for c in rec.columns) + "\n")
+        step = max(rec.chunk_rows, READ_CHUNK_ROWS // rec.chunk_rows * rec.chunk_rows)
+        for start in range(0, rec.n_rows, step):
+            df = rec.to_dataframe(start=start, stop=start + step)
+            if TIME_COLUMN in df.columns:
+                df[TIME_COLUMN] = df[TIME_COLUMN].dt.strftime(TIME_FORMAT)
+            df.to_csv(f, header=False, index=False, float_format=CSV_FLOAT_FORMAT)
+        return rec.n_rows
+
+def load_recording(path, columns=None, start=0, stop=None, parallel=False):
+    # Uzantıya göre: .nrec -> sadece gereken bloklar, diğerleri -> CSV (tek geçiş)
+    # parallel=True: büyük CSV'ler süreç havuzunda okunur. Sadece
+    # 'if __name__ == "__main__"' korumalı betiklerden açılmalı (Windows spawn).
+    if path.lower().endswith(REC_EXT):
+        with RecordingReader(path) as rec:
+            return rec.to_dataframe(columns, start, stop)
+    df = read_csv_auto(path, columns=columns) if parallel else read_recording(path, columns=columns)
+    return df.iloc[start:stop] if (start or stop is not None) else df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=f"CSV <-> {REC_EXT} dönüştürücü")
+    parser.add_argument("source")
+    parser.add_argument("target", nargs="?")
+    parser.add_argument("--chunk-seconds", type=int, default=CHUNK_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.source.lower().endswith(REC_EXT):
+        target = args.target or os.path.splitext(args.source)[0] + '.csv'
+        n = rec_to_csv(args.source, target)
+    else:
+        target = args.target or os.path.splitext(args.source)[0] + REC_EXT
+        n = csv_to_rec(args.source, target, args.chunk_seconds)
+    a, b = os.path.getsize(args.source), os.path.getsize(target)
+    print(f"{args.source} -> {target}: {n} kayıt, {a / 1e6:.1f} MB -> {b / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import os
+import sys
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from BinaryRecording import load_recording
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+ANGLE_SCALE = 180.0           # Normalize -> Derece
+DIST_UNIT_NM = 0.1            # DistanceToSteerpoint birimi (0.1 nm)
+MIN_TAS = 50.0                # kt; altında zaman/mesafe karşılaştırması anlamsız
+MIN_TTS_S = 60.0              # sn; bacak sonunda yuvarlama hatası yüzdeyi şişirir
+MIN_SEGMENT_S = 1.0           # Daha kısa aşımlar (tek örnek sıçramaları) raporlanmaz
+MERGE_GAP_S = 2.0             # Aradaki boşluk bundan kısaysa iki aşım birleştirilir
+FILE_PATTERN = '*.csv'
+WORKERS = None
+
+# Aynı büyüklüğü farklı yoldan veren kanal çiftleri. Her kontrol tüm kayıt
+# boyunca tek vektörel artık (residual) dizisi üretir; tolerans dışı
+# bölgeler satır aralığı ve zaman olarak listelenir.
+#   bias=True: kayda özgü sabit fark (ör. manyetik sapma, platform hizalaması) önce
+#   çıkarılır ve "median" sütununda raporlanır; geriye kalan geçici ayrılıklar bölge olur
+
+
+def _num(df, col):
+    return pd.to_numeric(df[col], errors='coerce').values.astype(np.float64)
+
+def _deg(df, col):
+    return _num(df, col) * ANGLE_SCALE
+
+def wrap180(deg):
+    return (deg + 180.0) % 360.0 - 180.0
+
+def ground_track(df):
+    # VelocityX doğu, VelocityY kuzey -> gerçek iz (derece)
+    return np.degrees(np.arctan2(_num(df, "VelocityX"), _num(df, "VelocityY"))) % 360.0
+
+
+def res_heading(df):
+    return wrap180(_deg(df, "PlatformAzimuth") - _deg(df, "PresentTrueHeading"))
+
+def res_magnetic_track(df):
+    return wrap180(_deg(df, "PresentMagneticGroundTrack") - ground_track(df))
+
+def res_steer_bearing(df):
+    return wrap180(_deg(df, "RelativeBearingToSteerpoint") - _deg(df, "RelativeBearingToNthWaypoint_Markpoint"))
+
+def res_time_to_steer(df):
+    # Yüzde fark: TimeToSteerpoint ile mesafe / hava hızı
+    tas = _num(df, "TrueAirSpeed")
+    expected = _num(df, "DistanceToSteerpoint") * DIST_UNIT_NM / np.where(tas > MIN_TAS, tas, np.nan) * 3600.0
+    expected[expected < MIN_TTS_S] = np.nan
+    return (_num(df, "TimeToSteerpoint") - expected) / expected * 100.0
+
+def res_drift(df):
+    drift = wrap180(ground_track(df) - _deg(df, "PresentTrueHeading"))
+    return wrap180(_deg(df, "PresentDriftAngle") - drift)
+
+# isim: (artık fonksiyonu, gereken sütunlar, tolerans, birim, bias)
+CHECKS = {
+    "heading":        (res_heading, ["PlatformAzimuth", "PresentTrueHeading"], 2.0, "deg", True),
+    "magnetic_track": (res_magnetic_track, ["PresentMagneticGroundTrack", "VelocityX", "VelocityY"],
+                       3.0, "deg", True),
+    "steer_bearing":  (res_steer_bearing, ["RelativeBearingToSteerpoint",
+                                           "RelativeBearingToNthWaypoint_Markpoint"], 1.0, "deg", False),
+    "time_to_steer":  (res_time_to_steer, ["TimeToSteerpoint", "DistanceToSteerpoint", "TrueAirSpeed"],
+                       5.0, "%", False),
+    "drift":          (res_drift, ["PresentDriftAngle", "VelocityX", "VelocityY", "PresentTrueHeading"],
+                       3.0, "deg", True),
+}
+
+
+# ---------------------------------------------------------
+# 1. AŞIM BÖLGELERİ
+# ---------------------------------------------------------
+def exceed_segments(residual, tol, min_len=int(MIN_SEGMENT_S * SAMPLE_RATE),
+                    merge_gap=int(MERGE_GAP_S * SAMPLE_RATE)):
+    # -> [(başlangıç, bitiş_hariç)] ; NaN aşım sayılmaz
+    over = np.abs(residual) > tol
+    edges = np.diff(np.concatenate(([0], over.view(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return starts, ends
+    # Kısa boşlukları birleştir
+    keep = np.concatenate(([True], starts[1:] - ends[:-1] > merge_gap))
+    ends = np.maximum.reduceat(ends, np.flatnonzero(keep))
+    starts = starts[keep]
+    long_enough = ends - starts >= min_len
+    return starts[long_enough], ends[long_enough]
+
+
+def check_frame(df, checks=None, name=""):
+    # -> (özet DataFrame, aşım bölgeleri DataFrame)
+    times = df["TimeMarker"].astype(str).values if "TimeMarker" in df.columns else None
+    summary, segments = [], []
+    for check in checks or CHECKS:
+        func, cols, tol, unit, bias = CHECKS[check]
+        missing = [c for c in cols if c not in df.columns]
+        if missing:
+            summary.append({"recording": name, "check": check, "status": f"eksik: {','.join(missing)}"})
+            continue
+        res = func(df)
+        ok = np.isfinite(res)
+        offset = float(np.median(res[ok])) if ok.any() else np.nan
+        if bias and ok.any():
+            res = res - offset
+            if unit == "deg": res = wrap180(res)
+        starts, ends = exceed_segments(res, tol)
+        a = np.abs(res[ok])
+        summary.append({"recording": name, "check": check, "status": "ok" if len(starts) == 0 else "aşım",
+                        "unit": unit, "tolerance": tol, "valid": int(ok.sum()), "median": offset,
+                        "bias_removed": bias, "rms": float(np.sqrt(np.mean(a ** 2))) if len(a) else np.nan,
+                        "p99_abs": float(np.percentile(a, 99)) if len(a) else np.nan,
+                        "out_pct": float((a > tol).mean() * 100) if len(a) else np.nan,
+                        "segments": len(starts),
+                        "out_s": float((ends - starts).sum() / SAMPLE_RATE)})
+        for s, e in zip(starts, ends):
+            seg = res[s:e]
+            k = int(np.nanargmax(np.abs(seg)))
+            segments.append({"recording": name, "check": check, "start_row": int(s), "end_row": int(e),
+                             "start_time": times[s] if times is not None else "",
+                             "end_time": times[e - 1] if times is not None else "",
+                             "duration_s": (e - s) / SAMPLE_RATE, "peak": float(seg[k]),
+                             "peak_row": int(s + k)})
+    return pd.DataFrame(summary), pd.DataFrame(segments)
+
+def check_recording(path, checks=None):
+    checks = list(checks or CHECKS)
+    cols = ["TimeMarker"] + sorted({c for ch in checks for c in CHECKS[ch][1]})
+    df = load_recording(path, columns=cols)
+    return check_frame(df, checks, os.path.basename(path))
+
+def check_fleet(paths, checks=None, workers=WORKERS):
+    # Kayıtlar süreç havuzunda paralel kontrol edilir
+    if len(paths) <= 1 or workers == 1:
+        results = [check_recording(p, checks) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(check_recording, paths, [checks] * len(paths)))
+    if not results:
+        return pd.DataFrame(), pd.DataFrame()
+    return (pd.concat([r[0] for r in results], ignore_index=True),
+            pd.concat([r[1] for r in results], ignore_index=True))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yedekli kanallar arası tutarlılık kontrolü")
+    parser.add_argument("inputs", nargs="+", help="Kayıtlar veya klasörler")
+    parser.add_argument("--pattern", default=FILE_PATTERN, help="Klasörlerde aranan dosyalar")
+    parser.add_argument("--checks", nargs="*", choices=list(CHECKS), help="Varsayılan: hepsi")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--summary", help="Özet tablo (CSV)")
+    parser.add_argument("--segments", help="Aşım bölgeleri (CSV)")
+    args = parser.parse_args(argv)
+
+    paths = []
+    for item in args.inputs:
+        paths += sorted(glob.glob(os.path.join(item, args.pattern))) if os.path.isdir(item) else [item]
+    summary, segments = check_fleet(paths, args.checks, args.workers)
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        print(summary)
+        if len(segments):
+            print(f"\n{len(segments)} aşım bölgesi, en uzunları:")
+            print(segments.sort_values("duration_s", ascending=False).head(10))
+    if args.summary:
+        summary.to_csv(args.summary, index=False, float_format='%.6g')
+    if args.segments:
+        segments.to_csv(args.segments, index=False, float_format='%.6g')
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+import os
+import sys
+import csv
+import time
+import socket
+import argparse
+import threading
+from collections import deque
+import numpy as np
+import pandas as pd
+from HeaderParser import iter_recording
+from BinaryRecording import REC_EXT, RecordingReader
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+TIME_COLUMN = 'TimeMarker'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+CHUNK_ROWS = 2000             # Dosya kaynaklarında bir seferde okunan satır
+BUFFER_ROWS = 4000            # Üretici ile arayüz arasındaki tampon (~200 sn @ 20 Hz)
+SOCKET_TIMEOUT = 0.5          # sn; durdurma isteği bu aralıkla kontrol edilir
+HEADER_EVERY = 100            # UDP yayınında başlık satırı kaç satırda bir tekrarlanır
+MAX_DATAGRAM = 65507
+REPLAY_HOST = '127.0.0.1'
+REPLAY_PORT = 5005
+
+# Kaynak (dosya, bellek eşlemeli önbellek, UDP/TCP) -> üretici iş parçacığı ->
+# sınırlı halka tampon -> arayüz (Tk 'after' döngüsünde bekleme yapmadan boşaltır).
+# Dosya kaynaklarında tampon dolunca üretici bekler (geri basınç); canlı
+# kaynaklarda akış durdurulamayacağı için en eski satırlar atılır.
+
+
+class RingBuffer:
+    def __init__(self, capacity=BUFFER_ROWS, drop_oldest=False):
+        self.capacity = capacity
+        self.drop_oldest = drop_oldest
+        self.items = deque()
+        self.cond = threading.Condition()
+        self.closed = False
+        self.dropped = 0
+        self.high_water = 0
+
+    def __len__(self):
+        with self.cond:
+            return len(self.items)
+
+    def put_many(self, rows):
+        # Üretici tarafı. Tampon doluysa yer açılana kadar bekler (drop_oldest hariç).
+        # -> False: tampon kapatıldı (tüketici gitti)
+        with self.cond:
+            if self.drop_oldest:
+                # Canlı akış: en yeni satırlar tutulur
+                rows = rows[-self.capacity:]
+                over = len(self.items) + len(rows) - self.capacity
+                for _ in range(max(0, over)):
+                    self.items.popleft()
+                self.dropped += max(0, over)
+                self.items.extend(rows)
+                self.high_water = max(self.high_water, len(self.items))
+                return not self.closed
+            k = 0
+            while k < len(rows):
+                if self.closed: return False
+                free = self.capacity - len(self.items)
+                if free <= 0:
+                    self.cond.wait(SOCKET_TIMEOUT)
+                    continue
+                part = rows[k:k + free]
+                self.items.extend(part)
+                k += len(part)
+                self.high_water = max(self.high_water, len(self.items))
+        return True
+
+    def get_many(self, max_n):
+        # Tüketici tarafı: asla beklemez; en fazla max_n satır (sıra korunur)
+        with self.cond:
+            n = min(max_n, len(self.items))
+            out = [self.items.popleft() for _ in range(n)]
+            if n: self.cond.notify_all()
+            return out
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+# ---------------------------------------------------------
+# KAYNAKLAR
+# ---------------------------------------------------------
+def _records(df):
+    # DataFrame -> satır sözlükleri; zaman her kaynakta aynı metin biçiminde
+    if TIME_COLUMN in df.columns and not pd.api.types.is_string_dtype(df[TIME_COLUMN]) \
+            and not pd.api.types.is_object_dtype(df[TIME_COLUMN]):
+        df = df.copy()
+        df[TIME_COLUMN] = pd.to_datetime(df[TIME_COLUMN]).dt.strftime(TIME_FORMAT)
+    return df.to_dict('records')
+
+
+def iter_frames(path, columns=None, chunk_rows=CHUNK_ROWS):
+    # Kaydı sabit bellekle DataFrame parçaları halinde okur (CSV veya .nrec)
+    if path.lower().endswith(REC_EXT):
+        with RecordingReader(path) as rec:
+            cols = None if columns is None else [c for c in columns if c in rec.columns]
+            for start in range(0, rec.n_rows, chunk_rows):
+                yield rec.to_dataframe(cols, start, start + chunk_rows)
+    else:
+        yield from iter_recording(path, columns=columns, chunksize=chunk_rows)
+
+
+class DataSource:
+    # blocks() -> satır sözlüğü listeleri üretir. stop() başka iş parçacığından çağrılabilir.
+    live = False     # True: akış yavaşlatılamaz (tampon dolunca eski satırlar atılır)
+
+    def __init__(self, columns=None):
+        self.columns = columns
+        self.stopped = threading.Event()
+
+    def blocks(self):
+        raise NotImplementedError
+
+    def stop(self):
+        self.stopped.set()
+
+    def describe(self):
+        return type(self).__name__
+
+
+class FileSource(DataSource):
+    # CSV: parça parça okuma (sabit bellek); .nrec: bloklar sırayla çözülür
+    def __init__(self, path, columns=None, chunk_rows=CHUNK_ROWS):
+        super().__init__(columns)
+        self.path = path
+        self.chunk_rows = chunk_rows
+
+    def blocks(self):
+        for df in iter_frames(self.path, self.columns, self.chunk_rows):
+            if self.stopped.is_set(): return
+            yield _records(df)
+
+    def describe(self):
+        return os.path.basename(self.path)
+
+
+def write_memmap_cache(path, out_dir, columns=None):
+    # Kaydı sütun başına bir .npy dosyasına çevirir (float32; zaman int64 epoch sn)
+    from BinaryRecording import load_recording
+    df = load_recording(path, columns=columns)
+    os.makedirs(out_dir, exist_ok=True)
+    for c in df.columns:
+        if c == TIME_COLUMN:
+            t = pd.to_datetime(df[c], format=TIME_FORMAT, errors='coerce')
+            vals = t.values.astype('datetime64[s]').astype(np.int64)
+        else:
+            vals = pd.to_numeric(df[c], errors='coerce').values.astype(np.float32)
+        np.save(os.path.join(out_dir, f"{c}.npy"), vals)
+    return len(df)
+
+
+class MemmapSource(DataSource):
+    # write_memmap_cache() klasörü; diskten sadece okunan dilimler sayfalanır
+    def __init__(self, cache_dir, columns=None, chunk_rows=CHUNK_ROWS):
+        super().__init__(columns)
+        self.cache_dir = cache_dir
+        self.chunk_rows = chunk_rows
+        names = sorted(f[:-4] for f in os.listdir(cache_dir) if f.endswith('.npy'))
+        if columns is not None:
+            names = [c for c in columns if c in names]
+        self.arrays = {c: np.load(os.path.join(cache_dir, f"{c}.npy"), mmap_mode='r') for c in names}
+        self.n_rows = min((len(a) for a in self.arrays.values()), default=0)
+
+    def blocks(self):
+        for start in range(0, self.n_rows, self.chunk_rows):
+            if self.stopped.is_set(): return
+            stop = min(start + self.chunk_rows, self.n_rows)
+            data = {}
+            for c, a in self.arrays.items():
+                part = np.asarray(a[start:stop])
+                if c == TIME_COLUMN:
+                    # int64 en küçük değer -> NaT
+                    data[c] = pd.to_datetime(part.astype('datetime64[s]')).strftime(TIME_FORMAT)
+                else:
+                    data[c] = part.astype(np.float64)
+            yield pd.DataFrame(data).to_dict('records')
+
+    def describe(self):
+        return f"mmap:{os.path.basename(os.path.normpath(self.cache_dir))}"
+
+
+def parse_line(line, columns):
+    # Kayıt biçimindeki tek CSV satırı -> sözlük (sayılar float, boş -> NaN)
+    vals = next(csv.reader([line]))
+    row = {}
+    for c, v in zip(columns, vals):
+        if c == TIME_COLUMN:
+            row[c] = v
+        else:
+            try: row[c] = float(v)
+            except ValueError: row[c] = np.nan
+    return row
+
+def _is_header(line):
+    return TIME_COLUMN in line and not line[:1].isdigit()
+
+
+class SocketSource(DataSource):
+    # Canlı telemetri / replay_server: satır satır kayıt biçiminde CSV.
+    # Sütunlar akıştaki başlık satırından öğrenilir; başlık gelene kadar satırlar atlanır.
+    live = True
+
+    def __init__(self, host=REPLAY_HOST, port=REPLAY_PORT, proto='udp', columns=None):
+        super().__init__(columns)
+        self.host, self.port, self.proto = host, port, proto
+        self.stream_columns = None
+
+    def _rows(self, lines):
+        out = []
+        for line in lines:
+            line = line.strip()
+            if not line: continue
+            if _is_header(line):
+                self.stream_columns = next(csv.reader([line]))
+                continue
+            if self.stream_columns is None: continue
+            row = parse_line(line, self.stream_columns)
+            if self.columns is not None:
+                row = {c: row.get(c, np.nan) for c in self.columns}
+            out.append(row)
+        return out
+
+    def blocks(self):
+        yield from (self._udp_blocks() if self.proto == 'udp' else self._tcp_blocks())
+
+    def _udp_blocks(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((self.host, self.port))
+        sock.settimeout(SOCKET_TIMEOUT)
+        try:
+            while not self.stopped.is_set():
+                try:
+                    data, _ = sock.recvfrom(MAX_DATAGRAM)
+                except socket.timeout:
+                    continue
+                rows = self._rows(data.decode('utf-8', 'replace').splitlines())
+                if rows: yield rows
+        finally:
+            sock.close()
+
+    def _tcp_blocks(self):
+        while not self.stopped.is_set():
+            try:
+                sock = socket.create_connection((self.host, self.port), timeout=SOCKET_TIMEOUT)
+            except OSError:
+                time.sleep(SOCKET_TIMEOUT)      # sunucu henüz açık değil
+                continue
+            sock.settimeout(SOCKET_TIMEOUT)
+            rest = b''
+            try:
+                while not self.stopped.is_set():
+                    try:
+                        data = sock.recv(MAX_DATAGRAM)
+                    except socket.timeout:
+                        continue
+                    if not data: break           # sunucu kapandı, yeniden bağlan
+                    lines = (rest + data).split(b'\n')
+                    rest = lines.pop()
+                    rows = self._rows(l.decode('utf-8', 'replace') for l in lines)
+                    if rows: yield rows
+            finally:
+                sock.close()
+            self.stream_columns = None
+
+    def describe(self):
+        return f"{self.proto}://{self.host}:{self.port}"
+
+
+def open_source(spec, columns=None):
+    # "udp://127.0.0.1:5005", "tcp://host:port", "mmap://klasör" (veya klasör), aksi halde kayıt dosyası
+    for proto in ('udp', 'tcp'):
+        if spec.startswith(f"{proto}://"):
+            host, _, port = spec[len(proto) + 3:].rpartition(':')
+            return SocketSource(host or REPLAY_HOST, int(port or REPLAY_PORT), proto, columns)
+    if spec.startswith("mmap://"):
+        return MemmapSource(spec[len("mmap://"):], columns)
+    if os.path.isdir(spec):
+        return MemmapSource(spec, columns)
+    return FileSource(spec, columns)
+
+def is_stream_spec(spec):
+    return isinstance(spec, str) and spec.split("://")[0] in ('udp', 'tcp', 'mmap')
+
+
+class SourceThread(threading.Thread):
+    # Üretici: kaynaktan okur, tampona yazar. Arayüz iş parçacığı hiç G/Ç beklemez.
+    def __init__(self, source, buffer):
+        super().__init__(daemon=True, name=f"source:{source.describe()}")
+        self.source = source
+        self.buffer = buffer
+        self.error = None
+        self.finished = False
+
+    def run(self):
+        try:
+            for rows in self.source.blocks():
+                if not self.buffer.put_many(rows): break
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
+
+    def stop(self):
+        self.source.stop()
+        self.buffer.close()
+
+
+def start_source(spec, columns=None, capacity=BUFFER_ROWS):
+    # -> (kaynak, tampon, üretici)
+    source = spec if isinstance(spec, DataSource) else open_source(spec, columns)
+    buffer = RingBuffer(capacity, drop_oldest=source.live)
+    producer = SourceThread(source, buffer)
+    producer.start()
+    return source, buffer, producer
+
+
+# ---------------------------------------------------------
+# REPLAY SUNUCUSU (canlı veri yerine)
+# ---------------------------------------------------------
+def _csv_lines(rows, columns):
+    out = []
+    for r in rows:
+        vals = []
+        for c in columns:
+            v = r.get(c)
+            if c == TIME_COLUMN: vals.append(f'"{v}"')
+            elif v is None or (isinstance(v, float) and np.isnan(v)): vals.append('')
+            else: vals.append(f"{v:.9g}")
+        out.append(",".join(vals))
+    return out
+
+def _datagrams(lines, limit=MAX_DATAGRAM):
+    # Satırlar bölünmeden en fazla `limit` baytlık paketlere toplanır
+    buf, size = [], 0
+    for line in lines:
+        b = (line + "\n").encode('utf-8')
+        if buf and size + len(b) > limit:
+            yield b''.join(buf)
+            buf, size = [], 0
+        buf.append(b)
+        size += len(b)
+    if buf: yield b''.join(buf)
+
+def replay_server(path, host=REPLAY_HOST, port=REPLAY_PORT, proto='udp', speed=1.0,
+                  loop=False, columns=None, stop=None):
+    # Kaydı gerçek zamanlı (x speed) satır satır yayınlar. TCP: tek istemci kabul eder.
+    stop = stop or threading.Event()
+    if proto == 'udp':
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        send = lambda payload: sock.sendto(payload, (host, port))
+    else:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, port))
+        server.listen(1)
+        sock, _ = server.accept()
+        server.close()
+        send = sock.sendall
+
+    tick = 1.0 / SAMPLE_RATE
+    per_tick = max(1, int(round(speed)))       # Her tick speed satır (UDP: MAX_DATAGRAM'lık paketler)
+    interval = tick * per_tick / speed
+    sent = 0
+    try:
+        while not stop.is_set():
+            source = FileSource(path, columns)
+            header = None
+            t_next = time.perf_counter()
+            for rows in source.blocks():
+                if header is None:
+                    cols = list(rows[0].keys()) if rows else []
+                    header = ",".join(f'"{c}"' for c in cols)
+                for k in range(0, len(rows), per_tick):
+                    if stop.is_set(): return sent
+                    lines = _csv_lines(rows[k:k + per_tick], cols)
+                    if proto == 'tcp' and sent == 0 or proto == 'udp' and sent % HEADER_EVERY < per_tick:
+                        lines.insert(0, header)
+                    if proto == 'udp':
+                        # Yüksek hızda bir tick'in satırları tek pakete sığmaz (EMSGSIZE)
+                        for payload in _datagrams(lines):
+                            send(payload)
+                    else:
+                        send(("\n".join(lines) + "\n").encode('utf-8'))
+                    sent += per_tick
+                    t_next += interval
+                    delay = t_next - time.perf_counter()
+                    if delay > 0: time.sleep(delay)
+            if not loop: break
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        sock.close()
+    return sent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Veri kaynakları: replay sunucusu / bellek eşlemeli önbellek")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("serve", help="Kaydı UDP/TCP üzerinden canlı veri gibi yayınla")
+    p.add_argument("recording")
+    p.add_argument("--proto", choices=["udp", "tcp"], default="udp")
+    p.add_argument("--host", default=REPLAY_HOST)
+    p.add_argument("--port", type=int, default=REPLAY_PORT)
+    p.add_argument("--speed", type=float, default=1.0)
+    p.add_argument("--loop", action="store_true")
+    p = sub.add_parser("cache", help="Kaydı sütun başına .npy önbelleğine çevir")
+    p.add_argument("recording")
+    p.add_argument("out_dir")
+    p.add_argument("--columns", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        print(f"{args.proto}://{args.host}:{args.port} yayını ({args.speed}x)...")
+        n = replay_server(args.recording, args.host, args.port, args.proto, args.speed, args.loop)
+        print(f"{n} satır gönderildi")
+    else:
+        n = write_memmap_cache(args.recording, args.out_dir, args.columns)
+        print(f"{args.out_dir}: {n} satır")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import sys
+import math
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from DerivedCache import rate_of_change
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+DT = 1.0 / SAMPLE_RATE
+SG_WINDOW = 9                 # Savitzky-Golay penceresi (örnek, tek sayı) ~0.45 sn
+SG_ORDER = 2                  # Polinom derecesi (2 ve 3 aynı 1./2. türevi verir)
+CENTRAL_WINDOW = 3            # Merkezi fark: x[i+h] - x[i-h], h = pencere // 2
+ANGLE_SCALE = 180.0           # Normalize -> Derece
+
+# Her türev, katsayıları en küçük kareler uydurmasından gelen tek bir evrişimdir
+# (fark + hareketli ortalama gibi iki geçiş ve ara dizi yok). Kenarlarda
+# (pencere // 2 örnek) NaN döner, pencerede NaN varsa o çıktı da NaN olur
+# (eski rolling davranışı gibi).
+
+
+def _check_window(window):
+    if window < 3 or window % 2 == 0:
+        raise ValueError(f"Pencere 3 veya daha büyük tek sayı olmalı: {window}")
+
+def savgol_kernel(window, order, deriv, dt=DT):
+    # En küçük kareler polinom uydurma: merkezdeki türev = katsayılar . pencere
+    _check_window(window)
+    if not deriv <= order < window:
+        raise ValueError(f"Türev <= derece < pencere olmalı: {deriv}, {order}, {window}")
+    h = window // 2
+    k = np.arange(-h, h + 1, dtype=np.float64)
+    A = k[:, None] ** np.arange(order + 1)
+    return np.linalg.pinv(A)[deriv] * math.factorial(deriv) / dt ** deriv
+
+def central_kernel(window, deriv, dt=DT):
+    # Pencerenin uçları ve merkezi kullanılır (aradaki örnekler 0 ağırlık)
+    _check_window(window)
+    h = window // 2
+    c = np.zeros(window)
+    if deriv == 1:
+        c[0], c[-1] = -1.0, 1.0
+        return c / (2 * h * dt)
+    if deriv == 2:
+        c[0], c[h], c[-1] = 1.0, -2.0, 1.0
+        return c / (h * dt) ** 2
+    raise ValueError(f"Merkezi fark sadece 1. ve 2. türev: {deriv}")
+
+def kernels(method="savgol", window=SG_WINDOW, order=SG_ORDER, derivs=(1, 2), dt=DT):
+    # -> (pencere, len(derivs)) katsayı matrisi
+    if method == "savgol":
+        cols = [savgol_kernel(window, order, d, dt) for d in derivs]
+    elif method == "central":
+        cols = [central_kernel(window, d, dt) for d in derivs]
+    else:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    return np.stack(cols, axis=1)
+
+def apply_kernels(x, K):
+    # Her türev için tek evrişim (C döngüsü, ara dizi yok); 'valid' kısım ortalanarak yazılır
+    x = np.asarray(x, dtype=np.float64)
+    n, (w, k) = len(x), K.shape
+    out = np.full((n, k), np.nan)
+    if n < w:
+        return out
+    h = w // 2
+    for j in range(k):
+        out[h:n - h, j] = np.convolve(x, K[::-1, j], mode='valid')
+    return out
+
+def derivatives(x, dt=DT, method="savgol", window=SG_WINDOW, order=SG_ORDER, derivs=(1, 2)):
+    # -> her istenen türev için bir dizi (aynı sırada)
+    out = apply_kernels(x, kernels(method, window, order, derivs, dt))
+    return tuple(out[:, j] for j in range(len(derivs)))
+
+
+def unwrap_angle(x, period=360.0):
+    # Sarmalı açı (0..360 veya normalize 0..2) -> sürekli; NaN'lar atlanır, yerinde kalır
+    x = np.asarray(x, dtype=np.float64)
+    ok = np.isfinite(x)
+    out = np.full(len(x), np.nan)
+    out[ok] = np.unwrap(x[ok], period=period)
+    return out
+
+
+# DerivedCache.channel() için tek çıktılı sürümler (fonksiyon adı anahtara girer)
+def savgol_rate(x, dt, window=SG_WINDOW, order=SG_ORDER):
+    return derivatives(x, dt, "savgol", window, order, (1,))[0]
+
+def savgol_accel(x, dt, window=SG_WINDOW, order=SG_ORDER):
+    return derivatives(x, dt, "savgol", window, order, (2,))[0]
+
+def central_rate(x, dt, window=CENTRAL_WINDOW):
+    return derivatives(x, dt, "central", window, derivs=(1,))[0]
+
+def derivative_frame(df, columns, dt=DT, method="savgol", window=SG_WINDOW, order=SG_ORDER,
+                     derivs=(1, 2)):
+    # Her sütun için <sütun>_D1, <sütun>_D2 ...
+    K = kernels(method, window, order, derivs, dt)
+    out = {}
+    for c in columns:
+        res = apply_kernels(pd.to_numeric(df[c], errors='coerce').values, K)
+        for j, d in enumerate(derivs):
+            out[f"{c}_D{d}"] = res[:, j]
+    return pd.DataFrame(out, index=df.index)
+
+
+# ---------------------------------------------------------
+# DOĞRULUK VE HIZ ÖLÇÜMÜ
+# ---------------------------------------------------------
+# Karşılaştırılan yöntemler: (isim, 1. türev fonksiyonu)
+METHODS = [
+    ("legacy diff+rolling5", lambda x, dt: rate_of_change(x, dt, 5)),
+    ("central w3", lambda x, dt: central_rate(x, dt, 3)),
+    ("central w21 (1 sn)", lambda x, dt: central_rate(x, dt, 21)),
+    ("savgol w9 o2", lambda x, dt: savgol_rate(x, dt, 9, 2)),
+    ("savgol w21 o3", lambda x, dt: savgol_rate(x, dt, 21, 3)),
+]
+
+def _rms(a, b):
+    ok = np.isfinite(a) & np.isfinite(b)
+    return float(np.sqrt(np.mean((a[ok] - b[ok]) ** 2))) if ok.any() else np.nan
+
+def accuracy_synthetic(n=SAMPLE_RATE * 600, noise=0.05, seed=0):
+    # Bilinen türevli manevra sinyali (derece) + ölçüm gürültüsü
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * DT
+    w1, w2 = 2 * np.pi / 20.0, 2 * np.pi / 4.0
+    x = 30 * np.sin(w1 * t) + 3 * np.sin(w2 * t)
+    d1 = 30 * w1 * np.cos(w1 * t) + 3 * w2 * np.cos(w2 * t)
+    d2 = -30 * w1 ** 2 * np.sin(w1 * t) - 3 * w2 ** 2 * np.sin(w2 * t)
+    xn = x + rng.normal(0, noise, n)
+    rows = [{"test": f"sinüs+gürültü({noise})", "method": name, "rms_d1": _rms(f(xn, DT), d1)}
+            for name, f in METHODS]
+    for method, w, o in (("central", 3, 2), ("central", 21, 2), ("savgol", 9, 2), ("savgol", 21, 3)):
+        _, a = derivatives(xn, DT, method, w, o)
+        rows.append({"test": f"sinüs+gürültü({noise})", "method": f"{method} w{w} 2. türev",
+                     "rms_d2": _rms(a, d2)})
+    return rows
+
+def accuracy_recording(df):
+    # Kayıtta yedekli kanal varsa: PlatformAzimuth türevi <-> YawRate (derece/sn)
+    if not {"PlatformAzimuth", "YawRate"} <= set(df.columns):
+        return []
+    hdg = np.degrees(np.unwrap(np.radians(pd.to_numeric(df["PlatformAzimuth"], errors='coerce').values
+                                          * ANGLE_SCALE)))
+    truth = pd.to_numeric(df["YawRate"], errors='coerce').values * ANGLE_SCALE
+    return [{"test": "PlatformAzimuth'->YawRate", "method": name, "rms_d1": _rms(f(hdg, DT), truth)}
+            for name, f in METHODS]
+
+def throughput(n=1_000_000, repeat=5, seed=0):
+    # -> {yöntem: milyon örnek/sn}
+    x = np.cumsum(np.random.default_rng(seed).normal(size=n))
+    cases = [(name, lambda f=f: f(x, DT)) for name, f in METHODS]
+    cases.append(("savgol w9 1.+2. türev", lambda: derivatives(x, DT, "savgol", 9, 2, (1, 2))))
+    out = {}
+    for name, func in cases:
+        runs = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - t)
+        out[name] = n / min(runs) / 1e6
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Türev yöntemleri: doğruluk ve hız karşılaştırması")
+    parser.add_argument("recording", nargs="?", help="YawRate içeren kayıt (örn. SyntheticFlight çıktısı)")
+    parser.add_argument("--noise", type=float, default=0.05, help="Sentetik sinüse eklenen gürültü (derece)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Hız ölçümü örnek sayısı")
+    args = parser.parse_args(argv)
+
+    rows = accuracy_synthetic(noise=args.noise)
+    if args.recording:
+        from BinaryRecording import load_recording
+        rows += accuracy_recording(load_recording(args.recording, columns=["PlatformAzimuth", "YawRate"]))
+    with pd.option_context('display.width', 160):
+        print(pd.DataFrame(rows).round(4).to_string(index=False))
+    print(f"\nHız ({args.rows} örnek):")
+    for name, mps in throughput(args.rows).items():
+        print(f"  {name:<24}{mps:>8.1f} M örnek/sn")
+
+if __name__ == "__main__":
+    sys.exit(main())
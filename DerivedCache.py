@@ -0,0 +1,111 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+CACHE_SUFFIX = '.cache'        # i09.csv -> i09.csv.cache/
+MANIFEST_NAME = 'manifest.json'
+CACHE_VERSION = 1              # Format değişirse tüm önbellek geçersiz olur
+
+
+# ---------------------------------------------------------
+# TÜRETİLMİŞ KANAL FONKSİYONLARI
+# ---------------------------------------------------------
+# Fonksiyon adı anahtara dahil edilir; formül değişirse adı da değişmeli.
+def scaled_hypot(x, y, factor=1.0):
+    # Yer hızı: sqrt(Vx^2 + Vy^2) * birim çarpanı
+    return np.hypot(x, y) * factor
+
+def rolling_mean(x, window):
+    return pd.Series(x).rolling(window=window, min_periods=1, center=True).mean().values
+
+def scaled_abs_cummax(x, factor=1.0):
+    # "Şimdiye kadarki max" (mutlak değer)
+    return np.maximum.accumulate(np.abs(x) * factor)
+
+def rate_of_change(x, dt, window):
+    # Değişim hızı = (Fark / dt), ardından merkezli hareketli ortalama
+    return (pd.Series(x).diff() / dt).rolling(window=window, center=True).mean().values
+
+
+class DerivedCache:
+    # Türetilmiş kanalları diske yazar. Her kanalın anahtarı; kaynak sütunların
+    # içerik özeti (hash) + parametreler (pencere, çarpan) + fonksiyon adıdır.
+    # Bir parametre değişirse sadece o kanal (ve ona bağlı kanallar) yeniden hesaplanır.
+    def __init__(self, datafile, cache_dir=None):
+        self.cache_dir = cache_dir or (datafile + CACHE_SUFFIX)
+        self.manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        self.manifest = self._read_manifest()
+        self.keys = {}      # kanal/kaynak adı -> anahtar
+        self.values = {}    # kanal/kaynak adı -> dizi
+        self.loaded = []
+        self.rebuilt = []
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get("version") == CACHE_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": CACHE_VERSION, "channels": {}}
+
+    def _write_manifest(self):
+        tmp = self.manifest_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    @staticmethod
+    def _digest(*parts):
+        h = hashlib.blake2b(digest_size=16)
+        for p in parts:
+            h.update(p if isinstance(p, bytes) else str(p).encode('utf-8'))
+            h.update(b'\x00')
+        return h.hexdigest()
+
+    def source(self, name, values):
+        # Ham (CSV'den gelen) sütunu kaydet ve içerik özetini çıkar
+        arr = np.ascontiguousarray(values)
+        self.keys[name] = self._digest("src", arr.dtype.str, arr.shape, arr.tobytes())
+        self.values[name] = arr
+        return arr
+
+    def channel(self, name, inputs, params, func):
+        # inputs: daha önce source() veya channel() ile kaydedilmiş isimler
+        key = self._digest("chn", name, func.__name__,
+                           json.dumps(params, sort_keys=True),
+                           *[self.keys[i] for i in inputs])
+        path = os.path.join(self.cache_dir, f"{name}.npy")
+
+        entry = self.manifest["channels"].get(name)
+        if entry is not None and entry["key"] == key and os.path.exists(path):
+            try:
+                values = np.load(path)
+                self.loaded.append(name)
+                self.keys[name] = key
+                self.values[name] = values
+                return values
+            except (OSError, ValueError):
+                pass  # Bozuk dosya -> yeniden hesapla
+
+        values = np.asarray(func(*[self.values[i] for i in inputs], **params))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = path + '.tmp.npy'
+        np.save(tmp, values)
+        os.replace(tmp, path)
+        self.manifest["channels"][name] = {"key": key, "inputs": list(inputs), "params": params}
+        self._write_manifest()
+
+        self.rebuilt.append(name)
+        self.keys[name] = key
+        self.values[name] = values
+        return values
+
+    def summary(self):
+        return f"Önbellekten: {len(self.loaded)} kanal, Yeniden hesaplanan: {self.rebuilt or 'yok'}"
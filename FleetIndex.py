@@ -0,0 +1,223 @@
+import os
+import sys
+import glob
+import sqlite3
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from HeaderParser import read_recording
+from FlightPhases import wrap180
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+INDEX_NAME = 'fleet_index.sqlite'
+FILE_PATTERN = '*.csv'
+SAMPLE_RATE = 20              # TimeMarker yoksa dakika = satır // (20*60)
+ANGLE_SCALE = 180.0           # Normalize -> Derece
+KNOTS_CONVERSION = 0.592484
+WORKERS = None                # None -> çekirdek sayısı kadar
+
+# İndekslenen kanallar (kayıt ve dakika bazında min/max/mean)
+CHANNELS = ["RollAngle", "PitchAngle", "RollRate", "PitchRate", "YawRate",
+            "GroundSpeed", "Altitude"]
+STATS = ["min", "max", "mean"]
+
+RAW_COLS = ["TimeMarker", "RollAngle", "PitchAngle", "RollRate", "PitchRate", "YawRate",
+            "VelocityX", "VelocityY", "BlendedEllipsoidHeight"]
+
+STAT_COLS = [f"{ch}_{st}" for ch in CHANNELS for st in STATS]
+SCHEMA = "v2:" + ",".join(STAT_COLS)   # v2: duruş açıları ±180
+
+
+# ---------------------------------------------------------
+# 1. TEK KAYDIN ÖZETİ (İşçi süreçte çalışır)
+# ---------------------------------------------------------
+def read_channels(path):
+    return derive_channels(read_recording(path, columns=RAW_COLS))
+
+def derive_channels(df):
+    # Ham sütunlar (RAW_COLS) -> CHANNELS birimlerinde tablo + zaman; parça parça da çağrılabilir
+    out = pd.DataFrame(index=df.index)
+    for c in ["RollAngle", "PitchAngle", "RollRate", "PitchRate", "YawRate"]:
+        if c in df.columns:
+            out[c] = pd.to_numeric(df[c], errors='coerce') * ANGLE_SCALE
+    # Duruş açıları [0, 360) olarak gelir (-10° yatış 350°); istatistikler ±180 üzerinden
+    for c in ["RollAngle", "PitchAngle"]:
+        if c in out.columns:
+            out[c] = wrap180(out[c])
+    if "VelocityX" in df.columns and "VelocityY" in df.columns:
+        vx = pd.to_numeric(df["VelocityX"], errors='coerce')
+        vy = pd.to_numeric(df["VelocityY"], errors='coerce')
+        out["GroundSpeed"] = np.hypot(vx, vy) * KNOTS_CONVERSION
+    if "BlendedEllipsoidHeight" in df.columns:
+        out["Altitude"] = pd.to_numeric(df["BlendedEllipsoidHeight"], errors='coerce')
+    for ch in CHANNELS:
+        if ch not in out.columns:
+            out[ch] = np.nan
+
+    if "TimeMarker" in df.columns:
+        times = pd.to_datetime(df["TimeMarker"], errors='coerce')
+    else:
+        times = pd.Series(pd.NaT, index=df.index)
+    return out[CHANNELS], times
+
+def _time_str(t):
+    return None if pd.isna(t) else str(t)
+
+def summarize_recording(path):
+    st = os.stat(path)
+    data, times = read_channels(path)
+
+    agg = data.agg(STATS)
+    rec = {f"{ch}_{s}": float(agg.at[s, ch]) for ch in CHANNELS for s in STATS}
+    rec.update(n_rows=len(data),
+               start_time=_time_str(times.min()), end_time=_time_str(times.max()))
+
+    # Dakika bazında özet (tek groupby)
+    if times.notna().any():
+        minute_key = times.dt.floor('min').ffill().bfill()
+    else:
+        minute_key = pd.Series(np.arange(len(data)) // (SAMPLE_RATE * 60), index=data.index)
+    grouped = data.groupby(minute_key, sort=True)
+    magg = grouped.agg(STATS)
+    counts = grouped.size()
+    tmin = times.groupby(minute_key).agg(['min', 'max'])
+
+    minutes = []
+    for key in magg.index:
+        row = [str(key), int(counts[key]), _time_str(tmin.at[key, 'min']), _time_str(tmin.at[key, 'max'])]
+        row += [float(magg.at[key, (ch, s)]) for ch in CHANNELS for s in STATS]
+        minutes.append(row)
+    return path, st.st_size, st.st_mtime, rec, minutes
+
+
+# ---------------------------------------------------------
+# 2. İNDEKS (SQLite)
+# ---------------------------------------------------------
+class FleetIndex:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self._ensure_schema()
+
+    def close(self):
+        self.conn.close()
+
+    def _ensure_schema(self):
+        c = self.conn
+        c.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = c.execute("SELECT value FROM meta WHERE key='schema'").fetchone()
+        if row is not None and row[0] != SCHEMA:
+            # Kanal listesi veya tanımı değişti -> tüm indeksi baştan kur
+            c.execute("DROP TABLE IF EXISTS minutes")
+            c.execute("DROP TABLE IF EXISTS recordings")
+        stat_defs = ", ".join(f"{s} REAL" for s in STAT_COLS)
+        c.execute("CREATE TABLE IF NOT EXISTS recordings ("
+                  "id INTEGER PRIMARY KEY, path TEXT UNIQUE, size INTEGER, mtime REAL, "
+                  f"n_rows INTEGER, start_time TEXT, end_time TEXT, {stat_defs})")
+        c.execute("CREATE TABLE IF NOT EXISTS minutes ("
+                  "recording_id INTEGER, minute TEXT, n_rows INTEGER, start_time TEXT, end_time TEXT, "
+                  f"{stat_defs})")
+        c.execute("CREATE INDEX IF NOT EXISTS minutes_rec ON minutes(recording_id)")
+        c.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (SCHEMA,))
+        c.commit()
+
+    def update(self, directory, pattern=FILE_PATTERN, workers=WORKERS):
+        # Artımlı: sadece yeni/değişmiş dosyalar okunur, silinenler indeksten çıkar
+        paths = sorted(os.path.abspath(p) for p in glob.glob(os.path.join(directory, pattern)))
+        known = {p: (s, m) for p, s, m in self.conn.execute("SELECT path, size, mtime FROM recordings")}
+
+        todo = []
+        for p in paths:
+            st = os.stat(p)
+            if known.get(p) != (st.st_size, st.st_mtime):
+                todo.append(p)
+        present = set(paths)
+        root = os.path.abspath(directory)
+        removed = [p for p in known if p not in present and os.path.dirname(p) == root]
+        for p in removed:
+            self._delete(p)
+
+        if todo:
+            print(f"İndeksleniyor: {len(todo)} kayıt ({len(paths) - len(todo)} güncel)")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for result in pool.map(summarize_recording, todo):
+                    self._store(*result)
+                    self.conn.commit()
+        self.conn.commit()
+        return todo, removed
+
+    def _delete(self, path):
+        row = self.conn.execute("SELECT id FROM recordings WHERE path=?", (path,)).fetchone()
+        if row is not None:
+            self.conn.execute("DELETE FROM minutes WHERE recording_id=?", row)
+            self.conn.execute("DELETE FROM recordings WHERE id=?", row)
+
+    def _store(self, path, size, mtime, rec, minutes):
+        self._delete(path)
+        cols = ["path", "size", "mtime", "n_rows", "start_time", "end_time"] + STAT_COLS
+        vals = [path, size, mtime, rec["n_rows"], rec["start_time"], rec["end_time"]]
+        vals += [rec[s] for s in STAT_COLS]
+        cur = self.conn.execute(f"INSERT INTO recordings ({','.join(cols)}) "
+                                f"VALUES ({','.join('?' * len(cols))})", vals)
+        rec_id = cur.lastrowid
+        mcols = ["recording_id", "minute", "n_rows", "start_time", "end_time"] + STAT_COLS
+        self.conn.executemany(f"INSERT INTO minutes ({','.join(mcols)}) "
+                              f"VALUES ({','.join('?' * len(mcols))})",
+                              [[rec_id] + m for m in minutes])
+
+    # --- SORGULAR ---
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def top(self, channel, stat="absmax", n=10, per_minute=False):
+        # stat: min / max / mean / absmax (en büyük sapma)
+        if channel not in CHANNELS:
+            raise ValueError(f"Bilinmeyen kanal: {channel}")
+        t = "m." if per_minute else ""
+        if stat == "absmax":
+            expr = f"MAX(ABS({t}{channel}_min), ABS({t}{channel}_max))"
+        elif stat in STATS:
+            expr = f"{t}{channel}_{stat}"
+        else:
+            raise ValueError(f"Bilinmeyen istatistik: {stat}")
+        order = "ASC" if stat == "min" else "DESC"
+        if per_minute:
+            sql = (f"SELECT r.path, m.minute, m.start_time, m.end_time, {expr} AS value "
+                   f"FROM minutes m JOIN recordings r ON r.id = m.recording_id "
+                   f"WHERE value IS NOT NULL ORDER BY value {order} LIMIT ?")
+        else:
+            sql = (f"SELECT path, start_time, end_time, n_rows, {expr} AS value FROM recordings "
+                   f"WHERE value IS NOT NULL ORDER BY value {order} LIMIT ?")
+        return self.query(sql, (n,))
+
+
+# ---------------------------------------------------------
+# 3. KOMUT SATIRI
+# ---------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıt filosu özet indeksi")
+    parser.add_argument("directory", help="Kayıtların bulunduğu klasör")
+    parser.add_argument("--db", help=f"İndeks dosyası (varsayılan: <klasör>/{INDEX_NAME})")
+    parser.add_argument("--pattern", default=FILE_PATTERN)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--top", metavar="KANAL", help="Örn: PitchAngle")
+    parser.add_argument("--stat", default="absmax", choices=STATS + ["absmax"])
+    parser.add_argument("-n", type=int, default=10)
+    parser.add_argument("--minutes", action="store_true", help="Dakika bazında sırala")
+    args = parser.parse_args(argv)
+
+    index = FleetIndex(args.db or os.path.join(args.directory, INDEX_NAME))
+    try:
+        updated, removed = index.update(args.directory, args.pattern, args.workers)
+        print(f"Güncellenen: {len(updated)}, Silinen: {len(removed)}")
+        if args.top:
+            with pd.option_context('display.width', 200, 'display.max_colwidth', 80):
+                print(index.top(args.top, args.stat, args.n, per_minute=args.minutes))
+    finally:
+        index.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
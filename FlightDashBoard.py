@@ -9,6 +9,9 @@ import math
 # ---------------------------------------------------------
 FILE_NAME = 'DnzRec.csv'
 UPDATE_INTERVAL = 50  # 50ms = Saniyede 20 kare (Daha akıcı olması için düşürdüm)
+USE_ATLAS = True        # Hız/Yön/VSI kadranları önceden çizilmiş karelerden (GaugeAtlas.py)
+PRERENDER_ATLAS = True  # Tüm kareler açılışta boşta turlarda hazırlanır (~382 kare, ~74 MB Tk belleği;
+                        # False: her kare ilk görüldüğünde oynatma sırasında çizilir, 1-15 ms)
 
 class CockpitApp:
     def __init__(self, root, datafile):
@@ -23,6 +26,7 @@ class CockpitApp:
         self.current_frame = 0
         self.is_playing = False # Başlangıçta duraklatılmış olsun
         self.speed_multiplier = 1 # Varsayılan hız 1x
+        self.atlas = None
 
         # --- ARAYÜZ ---
         self.create_widgets()
@@ -111,6 +115,32 @@ class CockpitApp:
                                     label="Hız Çarpanı (x)", length=200)
         self.scale_speed.pack(side=tk.RIGHT, padx=10)
 
+        if USE_ATLAS:
+            self.create_atlases()
+
+    def create_atlases(self):
+        # matplotlib sadece bu seçenekte yüklenir
+        from GaugeAtlas import airspeed_atlas, heading_atlas, vsi_atlas
+        self.atlas = {self.canvas_airspeed: airspeed_atlas(),
+                      self.canvas_heading: heading_atlas(),
+                      self.canvas_vsi: vsi_atlas()}
+        self.tile_items = {}
+        if PRERENDER_ATLAS:
+            for atlas in self.atlas.values():
+                atlas.prerender(self.root)
+
+    def show_tile(self, c, value, text):
+        # Kadran resmi değiştirilir, sayısal değer ayrı metin öğesi
+        img = self.atlas[c].photo(value, self.root)
+        items = self.tile_items.get(c)
+        if items is None:
+            c.delete("all")
+            self.tile_items[c] = (c.create_image(0, 0, image=img, anchor=tk.NW),
+                                  c.create_text(110, 160, text=text, fill="#00ff00", font=("Arial", 24, "bold")))
+        else:
+            c.itemconfig(items[0], image=img)
+            c.itemconfig(items[1], text=text)
+
     def create_gauge_canvas(self, parent, title):
         frame = tk.Frame(parent, bg="#202020")
         frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
@@ -177,6 +207,8 @@ class CockpitApp:
     # --- ÇİZİM FONKSİYONLARI ---
     def draw_airspeed(self, speed):
         c = self.canvas_airspeed
+        if self.atlas:
+            return self.show_tile(c, speed, f"{int(speed)}")
         c.delete("all")
         c.create_oval(10, 10, 210, 210, fill="#101010", outline="#555", width=3)
         c.create_text(110, 160, text=f"{int(speed)}", fill="#00ff00", font=("Arial", 24, "bold"))
@@ -251,6 +283,8 @@ class CockpitApp:
 
     def draw_heading(self, heading):
         c = self.canvas_heading
+        if self.atlas:
+            return self.show_tile(c, heading, f"{int(heading)}°")
         c.delete("all")
         c.create_oval(10, 10, 210, 210, fill="#101010", outline="#555", width=3)
         c.create_text(110, 90, text="▲", fill="yellow", font=("Arial", 20))
@@ -270,6 +304,8 @@ class CockpitApp:
 
     def draw_vsi(self, vz):
         c = self.canvas_vsi
+        if self.atlas:
+            return self.show_tile(c, vz, f"{vz:.1f}")
         c.delete("all")
         c.create_oval(10, 10, 210, 210, fill="#101010", outline="#555", width=3)
         c.create_text(110, 160, text=f"{vz:.1f}", fill="#00ff00", font=("Arial", 24, "bold"))
@@ -1,21 +1,90 @@
+import time
+_START = time.perf_counter()    # İlk pencere süresi bu andan ölçülür
 import tkinter as tk
 from tkinter import ttk
-import pandas as pd
 import numpy as np
+import os
+import sys
 import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from mpl_toolkits.mplot3d import Axes3D
+from FrameProfiler import FrameProfiler
+# pandas, matplotlib ve veri modülleri ilk kullanıldıkları yerde yüklenir
+# (pencere önce açılır, ağır grafikler ilk gösterildiklerinde kurulur)
 
 # ---------------------------------------------------------
 # AYARLAR
 # ---------------------------------------------------------
-FILE_NAME = 'i09.csv'
+FILE_NAME = 'i09.csv'        # .nrec de olabilir
 UPDATE_INTERVAL = 50      # 50ms = 20 FPS
 PLOT_DOWNSAMPLE = 100     # Performans için örnekleme
+ANGLE_SCALE = 180.0       # Normalize -> Derece
+KNOTS_CONVERSION = 0.592484
+ALT_SMOOTH_WINDOW = 20
+SMOOTH_METHOD = 'kalman'  # 'kalman': hız sensörüyle füzyon (gecikmesiz), 'rolling': merkezli ortalama
+DT = 1.0 / 20             # 20 Hz
+PARALLEL_LOAD = True      # Büyük CSV'ler çok çekirdekli okunur
+PROFILE = True                    # Kare süreleri ölçümü (F2: ekran, F3: dışa aktar)
+PROFILE_EXPORT = 'frame_trace.csv'  # .csv veya .json
+OVERLAY_EVERY = 10                # Ekrandaki özet kaç karede bir tazelensin
+MAP_MODE = '3d'                   # '2d': metrik hareketli harita (tıkla: o ana git)
+SAMPLE_RATE = 20
+
+# Karşılaştırmalı oynatma: aynı pencerede, tek döngüyle oynatılan diğer kayıtlar
+LAZY_START = True         # Pencere önce açılır; veri ve grafikler ardından yüklenir
+SHOW_PLOTS = True         # False: sadece göstergeler (grafik alanına tıklayınca kurulur)
+
+COMPARE_FILES = []                # ör. ['DnzRec.csv']; komut satırından da verilebilir
+ALIGN_BY = 'time'                 # 'time': TimeMarker ile, kanal adı (ör. 'RollRate'): o olayın anına göre
+COMPARE_COLORS = ['orange', 'lime', 'violet', 'white']
+ALIGN_TOLERANCE = 0.1             # sn; daha yakın örnek yoksa o anda kayıt gösterilmez
+
+# Akış kaynakları (DataSources.py): 'udp://127.0.0.1:5005', 'tcp://host:port', 'mmap://klasör'
+STREAM_FILES = False              # True: kayıt dosyaları da önceden yüklenmeden akış olarak oynatılır
+STREAM_BUFFER = 4000              # Okuyucu ile arayüz arasındaki tampon (satır)
+STREAM_HISTORY = 20 * 60 * 30     # Akışta geri sarılabilen son 30 dk
+SHOW_LEGS = True                  # Steerpoint bacağı bilgisi (LegSegments.py, kayıt yanında önbellekli)
+SHOW_PHASES = True                # Zaman çubuğu altında renkli uçuş evreleri (FlightPhases.py); tıkla: o ana git
+PHASE_STRIP_HEIGHT = 8
+
+# Klavye: ←/→ 1 kare (oynatma durur), Shift+←/→ 1 sn, ↑/↓ 10 sn, N/P sonraki/önceki olay, Boşluk oynat
+JUMP_SHORT_S = 1
+JUMP_LONG_S = 10
+RATE_EVENT_DPS = 30.0             # |açısal hız| bunu aşınca her aşımın tepe noktası bir olay
+SEEK_COALESCE_MS = 30             # Kaydırıcı sürüklenirken bu aralıkta sadece son konum çizilir
+RATE_WINDOW_S = 10                # Rate etiketinde "son N sn" en büyük değeri
+
+# Kayıttan okunacak sütunlar (geniş kayıtlarda diğerleri hiç ayrıştırılmaz)
+NEEDED_COLS = ["TimeMarker", "RollAngle", "PitchAngle", "PlatformAzimuth",
+               "BlendedLatitude", "BlendedLongitude", "BlendedEllipsoidHeight",
+               "RollRate", "PitchRate", "YawRate",
+               "VelocityX", "VelocityY", "VelocityZ"]
+
+def sample_times(df):
+    # Örnek bazında zaman (sn): TimeMarker saniye çözünürlüklü, saniye içindeki sıra eklenir.
+    # Bir saniyede 20'den fazla satır olabilir (ör. 22): satırlar o saniyenin gerçek satır
+    # sayısına yayılır, böylece kesir 1'in altında kalır ve zaman geri gitmez.
+    import pandas as pd
+    t = df["TimeMarker_DT"].ffill().bfill()
+    secs = t.values.astype('datetime64[s]').astype(np.int64)
+    g = pd.Series(secs).groupby(secs)
+    return secs + g.cumcount().values / g.transform('size').values
+
+def align_frames(base, other, align_by='time'):
+    # Ana kaydın her karesi için diğer kayıttaki en yakın satır (-1: o anda kayıt yok)
+    from TimeWindow import event_row
+    tb, to = sample_times(base), sample_times(other)
+    shift = 0.0
+    if align_by != 'time':
+        shift = to[event_row(other, align_by)] - tb[event_row(base, align_by)]
+    target = tb + shift
+    j = np.clip(np.searchsorted(to, target), 1, len(to) - 1)
+    j -= (target - to[j - 1]) < (to[j] - target)
+    j = np.clip(j, 0, len(to) - 1)
+    j[np.abs(to[j] - target) > ALIGN_TOLERANCE] = -1
+    return j, shift
+
 
 class CockpitApp:
-    def __init__(self, root, datafile):
+    def __init__(self, root, datafile, compare_files=(), align_by=ALIGN_BY):
         self.root = root
         self.root.title("Flight Data Recording Player")
         self.root.geometry("1600x950") 
@@ -24,105 +93,329 @@ class CockpitApp:
         self.is_running = True
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # --- VERİ YÜKLEME ---
-        self.load_data(datafile)
-        
+        self.df = None
+        self.times = []
+        self.total_frames = 0
+        self.others = []
         self.current_frame = 0
         self.is_playing = False
         self.speed_multiplier = 1 
+        self.profiler = FrameProfiler(enabled=PROFILE)
+        self.map_ready = self.rate_ready = False
+        self.map_mode = '3d'
+        self.stream = None        # akış kaynağı (DataSources); None: kayıt tamamen yüklenir
+        self.legs = None
+        self.phase_labels = None
+        self.rate_stats = {}
+        self.event_rows = np.zeros(0, dtype=np.int64)
+        self.event_kinds = []
+        self.event_note = ""
+        self.seek_job = None
 
         # --- ARAYÜZ ---
         self.create_layout()
-        
+        self.create_profile_overlay()
+        self.create_key_bindings()
+
+        # --- VERİ YÜKLEME ---
+        if LAZY_START:
+            self.root.update()   # pencere ve boş göstergeler veri okunmadan ekrana gelsin
+            self.report_first_window()
+            self.root.after(1, self.finish_startup, datafile, compare_files, align_by)
+        else:
+            self.finish_startup(datafile, compare_files, align_by)
+            self.root.after_idle(self.report_first_window)
+
+    def report_first_window(self):
+        print(f"İlk pencere: {(time.perf_counter() - _START) * 1000:.0f} ms")
+
+    def finish_startup(self, datafile, compare_files, align_by):
+        from DataSources import is_stream_spec
+        if STREAM_FILES or is_stream_spec(datafile):
+            self.start_stream(datafile)
+        else:
+            self.load_data(datafile)
+            self.load_compare(compare_files, align_by)
+            if SHOW_LEGS: self.load_legs(datafile)
+            if SHOW_PHASES: self.load_phases()
+            self.build_events()
+        self.scale_timeline.config(to=max(0, self.total_frames - 1))
+        if self.others:
+            self.lbl_compare = tk.Label(self.top_frame, text="", font=("Consolas", 11),
+                                        fg="orange", bg="#202020", justify=tk.LEFT)
+            self.lbl_compare.pack()
+
         print("Görünüşe göre hazırız... :)")
         # --- DÖNGÜ BAŞLAT ---
         self.update_ui()
+        if SHOW_PLOTS:
+            # Grafikler göstergeler ekrana geldikten sonra kurulur
+            if LAZY_START:
+                self.root.after_idle(self.reveal_plots)
+            else:
+                self.reveal_plots()
         self.root.after(UPDATE_INTERVAL, self.update_loop)
+        print(f"Hazır: {(time.perf_counter() - _START) * 1000:.0f} ms")
+
+    def reveal_plots(self):
+        self.ensure_map_pane()
+        self.ensure_rate_pane()
 
     def on_closing(self):
         print("Tekrar Görüşmek üzere...")
         self.is_running = False
         self.is_playing = False
+        if self.seek_job is not None:
+            self.root.after_cancel(self.seek_job)
+        if self.stream is not None:
+            self.producer.stop()
+            print(f"Akış: {self.stream_buffer.dropped} satır atıldı, tampon en fazla {self.stream_buffer.high_water}")
         try:
             self.root.after_cancel(self.update_loop)
         except:
             print("Shit happened... ")
         finally:
             self.root.destroy()
-            plt.close('all')
+            if self.map_ready or self.rate_ready:
+                import matplotlib.pyplot as plt
+                plt.close('all')
 
     def load_data(self, filename):
         try:
-            print("Veri yükleniyor...")
-            with open(filename, 'r') as f:
-                header_line = f.readline().strip()
-            if header_line.startswith('"') and header_line.endswith('"'):
-                header_line = header_line[1:-1]
-            raw_cols = header_line.split(',')
-            cols = [c.replace('""', '').strip() for c in raw_cols]
-            seen = {}
-            deduped_cols = []
-            for c in cols:
-                if c in seen:
-                    seen[c] += 1
-                    deduped_cols.append(f"{c}_{seen[c]}")
-                else:
-                    seen[c] = 0
-                    deduped_cols.append(c)
-
-            df = pd.read_csv(filename, skiprows=1, names=deduped_cols)
-            
-            # Zaman
-            if "TimeMarker" in df.columns:
-                df["TimeMarker_DT"] = pd.to_datetime(df["TimeMarker"], errors='coerce')
-                self.times = df["TimeMarker"].astype(str).values
-            else:
-                df["TimeMarker_DT"] = pd.to_datetime(df.index, unit='s', origin='unix')
-                self.times = [f"F:{i}" for i in range(len(df))]
-
-            # Açılar (Normalize -> Derece)
-            angle_cols = ["RollAngle", "PitchAngle", "PlatformAzimuth", 
-                          "BlendedLatitude", "BlendedLongitude"]
-            for c in angle_cols:
-                if c in df.columns:
-                    df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0) * 180.0
-            
-            # Rate (Normalize -> Derece/Saniye)
-            rate_cols = ["RollRate", "PitchRate", "YawRate"]
-            for c in rate_cols:
-                if c in df.columns:
-                    df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0) * 180.0
-
-            # Hızlar
-            vel_cols = ["VelocityX", "VelocityY", "VelocityZ"]
-            for c in vel_cols:
-                if c in df.columns:
-                    df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0) * 0.592484
-            
-            df['GroundSpeed'] = np.sqrt(df['VelocityX']**2 + df['VelocityY']**2)
-            
-            # İrtifa
-            if "BlendedEllipsoidHeight" in df.columns:
-                df["Altitude"] = df["BlendedEllipsoidHeight"]
-            else:
-                df["Altitude"] = 0
-            
-            df["Altitude_Smooth"] = df["Altitude"].rolling(window=20, min_periods=1, center=True).mean()
-
-            # Max Rate Stats
-            df['RollRate_Max'] = df['RollRate'].abs().cummax()
-            df['PitchRate_Max'] = df['PitchRate'].abs().cummax()
-            df['YawRate_Max'] = df['YawRate'].abs().cummax()
-
-            self.df = df
-            self.total_frames = len(df)
+            self.df, self.times = self.prepare_recording(filename)
+            self.total_frames = len(self.df)
             print(f"Veri Başarılı şekilde okundu...! Toplam {self.total_frames} kayıt.")
+            # Rate istatistikleri (max, son N sn, tepe tutma): sütun yerine seyrek tablo, her konumda O(1)
+            from RunningStats import SeekRateStats
+            self.rate_stats = {c: SeekRateStats(self.df[c].values, RATE_WINDOW_S)
+                               for c in ("RollRate", "PitchRate", "YawRate") if c in self.df.columns}
 
         except Exception as e:
             print(f"Hata: {e}")
+            import pandas as pd
             self.df = pd.DataFrame()
             self.total_frames = 0
 
+    def load_legs(self, filename):
+        from LegSegments import load_legs
+        try:
+            self.legs = load_legs(filename)
+            self.leg_starts = self.legs["start_row"].values
+            print(f"{len(self.legs)} steerpoint bacağı")
+        except Exception as e:
+            print(f"Bacaklar okunamadı: {e}")
+            self.legs = None
+
+    def leg_text(self, idx):
+        if self.legs is None or len(self.legs) == 0: return ""
+        k = int(np.searchsorted(self.leg_starts, idx, side='right') - 1)
+        leg = self.legs.iloc[k]
+        return f" | LEG {k + 1}/{len(self.legs)} ({leg['dist_start_nm']:.0f} nm, SE {leg['steer_err_mean']:.1f}°)"
+
+    def load_phases(self):
+        # Yüklü (birimleri çevrilmiş) sütunlardan tek vektörel geçiş
+        from FlightPhases import classify, wrap180
+        if self.total_frames == 0: return
+        df = self.df
+        self.phase_labels = classify(df["GroundSpeed"].values, df["VelocityZ"].values / KNOTS_CONVERSION,
+                                     wrap180(df["RollAngle"].values), df["YawRate"].values)
+        self.draw_phase_strip()
+
+    def draw_phase_strip(self):
+        # Her piksel sütunu için o konumdaki evre; aynı renkli komşu pikseller tek dikdörtgen
+        from FlightPhases import PHASES, runs
+        c = self.canvas_phases
+        c.delete("all")
+        if self.phase_labels is None or len(self.phase_labels) == 0: return
+        w = max(1, c.winfo_width())
+        n = len(self.phase_labels)
+        px = self.phase_labels[((np.arange(w) + 0.5) * n / w).astype(np.int64)]
+        for a, b, v in zip(*runs(px)):
+            c.create_rectangle(int(a), 0, int(b), PHASE_STRIP_HEIGHT, fill=PHASES[int(v)][1], width=0)
+
+    def on_phase_click(self, event):
+        if self.total_frames == 0 or self.stream is not None: return
+        self.seek(int(event.x / max(1, self.canvas_phases.winfo_width()) * self.total_frames))
+
+    def phase_text(self, idx):
+        from FlightPhases import PHASES
+        if self.phase_labels is None: return ""
+        return f" | {PHASES[int(self.phase_labels[idx])][0].upper()}"
+
+    def build_events(self):
+        # N/P ile atlanan olaylar: evre sınırları, bacak başları, açısal hız tepe noktaları
+        from ConsistencyCheck import exceed_segments
+        if self.total_frames == 0: return
+        rows, kinds = [], []
+        if self.phase_labels is not None:
+            from FlightPhases import PHASES, runs
+            starts, _, vals = runs(self.phase_labels)
+            rows += starts[1:].tolist()
+            kinds += [PHASES[int(v)][0].upper() for v in vals[1:]]
+        if self.legs is not None and len(self.legs) > 1:
+            rows += self.leg_starts[1:].tolist()
+            kinds += [f"LEG {k + 2}" for k in range(len(self.leg_starts) - 1)]
+        rate_cols = [c for c in ("RollRate", "PitchRate", "YawRate") if c in self.df.columns]
+        if rate_cols:
+            rate = np.abs(self.df[rate_cols].values).max(axis=1)
+            for a, b in zip(*exceed_segments(rate, RATE_EVENT_DPS, min_len=1)):
+                k = int(a + np.argmax(rate[a:b]))
+                rows.append(k)
+                kinds.append(f"MAX RATE {rate[k]:.0f}°/s")
+        order = np.argsort(rows, kind='stable')
+        self.event_rows = np.asarray(rows, dtype=np.int64)[order]
+        self.event_kinds = [kinds[i] for i in order]
+        print(f"{len(self.event_rows)} olay (N/P ile gezilir)")
+
+    def load_compare(self, files, align_by):
+        # Diğer kayıtlar ana kaydın zaman eksenine bir kez eşlenir (kare -> satır dizisi)
+        self.others = []
+        for k, f in enumerate(files):
+            if self.total_frames == 0: break
+            try:
+                df, times = self.prepare_recording(f)
+                frame_map, shift = align_frames(self.df, df, align_by)
+            except Exception as e:
+                print(f"Hata ({f}): {e}")
+                continue
+            self.others.append({"name": os.path.basename(f), "df": df, "times": times,
+                                "map": frame_map, "shift": shift,
+                                "color": COMPARE_COLORS[k % len(COMPARE_COLORS)]})
+            print(f"Karşılaştırma: {f} ({len(df)} kayıt, kayma {shift:+.1f} sn, "
+                  f"ortak {int((frame_map >= 0).sum())} kare)")
+
+    def start_stream(self, spec):
+        # Satırlar arka planda okunur; arayüz döngüsü tampondan beklemeden alır.
+        # Grafikler tüm kaydı gerektirdiği için akışta sadece göstergeler çalışır.
+        from collections import deque
+        from DataSources import start_source
+        from KalmanSmooth import StreamingFuser, ALT_RATE_NOISE, ALT_MEAS_NOISE, ATT_RATE_NOISE, ATT_MEAS_NOISE
+        try:
+            self.stream, self.stream_buffer, self.producer = start_source(spec, NEEDED_COLS, STREAM_BUFFER)
+        except Exception as e:
+            print(f"Hata: {e}")
+            return
+        self.stream_rows = deque(maxlen=STREAM_HISTORY)
+        self.times = deque(maxlen=STREAM_HISTORY)
+        # Canlı veride merkezli ortalama olmaz; süzgeç her zaman hız füzyonu
+        # Akış satırları derece: duruş açıları 360° sarmalı, çıkış ±180°
+        att = dict(dt=DT, rate_noise=ATT_RATE_NOISE, meas_noise=ATT_MEAS_NOISE, period=360.0, centered=True)
+        self.fusers = {"RollAngle": StreamingFuser(**att), "PitchAngle": StreamingFuser(**att),
+                       "Altitude": StreamingFuser(DT, ALT_RATE_NOISE, ALT_MEAS_NOISE)}
+        from RunningStats import LiveRateStats
+        self.rate_stats = {c: LiveRateStats(RATE_WINDOW_S) for c in ("RollRate", "PitchRate", "YawRate")}
+        self.root.title(f"Flight Data Recording Player - {self.stream.describe()}")
+        print(f"Akış başladı: {self.stream.describe()}")
+
+    def convert_stream_row(self, raw):
+        # prepare_recording ile aynı birimler, satır satır
+        def val(c, scale=1.0):
+            v = raw.get(c)
+            return 0.0 if v is None or v != v else v * scale
+        row = {c: val(c, ANGLE_SCALE) for c in ("RollAngle", "PitchAngle", "PlatformAzimuth",
+                                                "BlendedLatitude", "BlendedLongitude",
+                                                "RollRate", "PitchRate", "YawRate")}
+        for c in ("VelocityX", "VelocityY", "VelocityZ"):
+            row[c] = val(c, KNOTS_CONVERSION)
+        row["GroundSpeed"] = math.hypot(row["VelocityX"], row["VelocityY"])
+        row["Altitude"] = val("BlendedEllipsoidHeight")
+        row["Altitude_Smooth"] = self.fusers["Altitude"].step(row["Altitude"], val("VelocityZ"))
+        for c, rc in (("RollAngle", "RollRate"), ("PitchAngle", "PitchRate")):
+            row[f"{c}_Smooth"] = self.fusers[c].step(row[c], row[rc])
+        for c, stats in self.rate_stats.items():
+            stats.update(row[c])
+        return row
+
+    def pull_stream(self):
+        # Canlı kaynak: biriken her şey alınır (oynatma durunca da geçmiş dolmaya devam eder).
+        # Dosya akışı: oynatılırken her turda hız kadar satır; tampon dolunca okuyucu bekler.
+        if not (self.stream.live or self.is_playing): return False
+        n = STREAM_BUFFER if self.stream.live else self.var_speed.get()
+        rows = self.stream_buffer.get_many(n)
+        for raw in rows:
+            self.stream_rows.append(self.convert_stream_row(raw))
+            self.times.append(raw.get("TimeMarker", ""))
+        if not rows: return False
+        self.total_frames = len(self.stream_rows)
+        self.scale_timeline.config(to=max(0, self.total_frames - 1))
+        return True
+
+    def prepare_recording(self, filename):
+        import pandas as pd
+        from BinaryRecording import load_recording
+        from DerivedCache import DerivedCache, scaled_hypot, rolling_mean
+        import KalmanSmooth as ks
+        from KalmanSmooth import fused_attitude, fused_altitude
+        print("Veri yükleniyor...")
+        # CSV: başlık bir kez çözümlenir, gövde sadece gereken sütunlarla tek geçişte okunur
+        # .nrec: sadece gereken sütunlar çözülür
+        df = load_recording(filename, columns=NEEDED_COLS, parallel=PARALLEL_LOAD)
+        
+        # Zaman
+        if "TimeMarker" in df.columns:
+            df["TimeMarker_DT"] = pd.to_datetime(df["TimeMarker"], errors='coerce')
+            times = df["TimeMarker"].astype(str).values
+        else:
+            df["TimeMarker_DT"] = pd.to_datetime(df.index, unit='s', origin='unix')
+            times = [f"F:{i}" for i in range(len(df))]
+
+        # Türetilmiş kanallar önbelleği (ham sütun özetleri + parametreler)
+        cache = DerivedCache(filename)
+
+        # Açılar (Normalize -> Derece)
+        angle_cols = ["RollAngle", "PitchAngle", "PlatformAzimuth", 
+                      "BlendedLatitude", "BlendedLongitude"]
+        for c in angle_cols:
+            if c in df.columns:
+                raw = cache.source(c, pd.to_numeric(df[c], errors='coerce').fillna(0).values)
+                df[c] = raw * ANGLE_SCALE
+        
+        # Rate (Normalize -> Derece/Saniye)
+        rate_cols = ["RollRate", "PitchRate", "YawRate"]
+        for c in rate_cols:
+            if c in df.columns:
+                raw = cache.source(c, pd.to_numeric(df[c], errors='coerce').fillna(0).values)
+                df[c] = raw * ANGLE_SCALE
+
+        # Hızlar
+        vel_cols = ["VelocityX", "VelocityY", "VelocityZ"]
+        for c in vel_cols:
+            if c in df.columns:
+                raw = cache.source(c, pd.to_numeric(df[c], errors='coerce').fillna(0).values)
+                df[c] = raw * KNOTS_CONVERSION
+        
+        df['GroundSpeed'] = cache.channel('GroundSpeed', ["VelocityX", "VelocityY"],
+                                          {"factor": KNOTS_CONVERSION}, scaled_hypot)
+        
+        # İrtifa
+        if "BlendedEllipsoidHeight" in df.columns:
+            df["Altitude"] = df["BlendedEllipsoidHeight"]
+            cache.source("BlendedEllipsoidHeight", pd.to_numeric(df["Altitude"], errors='coerce').values)
+            if SMOOTH_METHOD == 'kalman' and "VelocityZ" in df.columns:
+                # Filtre ayarlarının hepsi anahtara girer; ayar değişince kanal yeniden üretilir
+                df["Altitude_Smooth"] = cache.channel("Altitude_Smooth", ["BlendedEllipsoidHeight", "VelocityZ"],
+                                                      {"dt": DT, "rate_noise": ks.ALT_RATE_NOISE,
+                                                       "meas_noise": ks.ALT_MEAS_NOISE, "vz_sign": ks.VZ_SIGN},
+                                                      fused_altitude)
+            else:
+                df["Altitude_Smooth"] = cache.channel("Altitude_Smooth", ["BlendedEllipsoidHeight"],
+                                                      {"window": ALT_SMOOTH_WINDOW}, rolling_mean)
+        else:
+            df["Altitude"] = 0
+            df["Altitude_Smooth"] = 0.0
+
+        # Filtrelenmiş duruş (açı + açısal hız füzyonu)
+        att_params = {"dt": DT, "rate_noise": ks.ATT_RATE_NOISE, "meas_noise": ks.ATT_MEAS_NOISE,
+                      "period": 2.0}
+        for c, rc in (("RollAngle", "RollRate"), ("PitchAngle", "PitchRate")):
+            if c in df.columns and rc in df.columns:
+                df[f"{c}_Smooth"] = cache.channel(f"{c}_Smooth", [c, rc], att_params, fused_attitude) * ANGLE_SCALE
+            elif c in df.columns:
+                df[f"{c}_Smooth"] = df[c]
+        print(cache.summary())
+
+        return df, times
+
     def create_layout(self):
         print("Form Yapısı Düzenleniyor...")
         # 1. ÜST PANEL
@@ -138,7 +431,7 @@ class CockpitApp:
         # --- SOL TARAF (HARİTA) ---
         self.map_frame = tk.Frame(self.main_pane, bg="black")
         self.main_pane.add(self.map_frame, minsize=600, stretch="always")
-        self.create_3d_plot()
+        self.map_placeholder = self.create_placeholder(self.map_frame, "3D İZ / HARİTA", self.ensure_map_pane)
 
         # --- SAĞ TARAF (YAN PANEL) ---
         self.sidebar_pane = tk.PanedWindow(self.main_pane, orient=tk.VERTICAL, bg="#202020", sashwidth=5)
@@ -165,7 +458,7 @@ class CockpitApp:
         
         self.rate_plot_frame = tk.Frame(self.rate_container, bg="black")
         self.rate_plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        self.create_rate_plot()
+        self.rate_placeholder = self.create_placeholder(self.rate_plot_frame, "ANGULAR RATES", self.ensure_rate_pane)
         
         self.rate_stats_frame = tk.Frame(self.rate_container, bg="#202020", pady=5)
         self.rate_stats_frame.pack(side=tk.BOTTOM, fill=tk.X)
@@ -188,12 +481,27 @@ class CockpitApp:
                                          font=("Arial", 10, "bold"), command=self.update_ui)
         self.chk_smooth.pack(side=tk.LEFT, padx=10)
 
+        self.btn_map = tk.Button(self.control_frame, text="3D İZ" if self.map_mode == '2d' else "2D HARİTA",
+                                 command=self.toggle_map_mode,
+                                 bg="#444", fg="white", font=("Arial", 10, "bold"), width=10)
+        self.btn_map.pack(side=tk.LEFT, padx=10)
+
+        tk.Label(self.control_frame, text="←/→ kare  ⇧ 1 sn  ↑/↓ 10 sn\nN/P olay  Boşluk oynat",
+                 font=("Consolas", 8), fg="gray", bg="#303030", justify=tk.LEFT).pack(side=tk.LEFT, padx=5)
+
         self.var_timeline = tk.IntVar(value=0)
-        self.scale_timeline = tk.Scale(self.control_frame, from_=0, to=max(0, self.total_frames-1), 
+        self.timeline_frame = tk.Frame(self.control_frame, bg="#303030")
+        self.timeline_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=20)
+        self.scale_timeline = tk.Scale(self.timeline_frame, from_=0, to=0, 
                                        orient=tk.HORIZONTAL, variable=self.var_timeline, 
                                        command=self.on_seek, bg="#303030", fg="white", 
                                        highlightthickness=0, label="Zaman", length=400)
-        self.scale_timeline.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=20)
+        self.scale_timeline.pack(side=tk.TOP, fill=tk.X, expand=True)
+        self.canvas_phases = tk.Canvas(self.timeline_frame, height=PHASE_STRIP_HEIGHT, bg="#303030",
+                                       highlightthickness=0)
+        self.canvas_phases.pack(side=tk.TOP, fill=tk.X)
+        self.canvas_phases.bind("<Configure>", lambda e: self.draw_phase_strip())
+        self.canvas_phases.bind("<Button-1>", self.on_phase_click)
 
         self.var_speed = tk.IntVar(value=1)
         self.scale_speed = tk.Scale(self.control_frame, from_=1, to=500, orient=tk.HORIZONTAL, 
@@ -201,6 +509,72 @@ class CockpitApp:
                                     highlightthickness=0, label="Hız (x)", length=150)
         self.scale_speed.pack(side=tk.RIGHT, padx=20)
 
+    def create_key_bindings(self):
+        keys = {"<Right>": lambda: self.step(1, pause=True), "<Left>": lambda: self.step(-1, pause=True),
+                "<Shift-Right>": lambda: self.step(JUMP_SHORT_S * SAMPLE_RATE),
+                "<Shift-Left>": lambda: self.step(-JUMP_SHORT_S * SAMPLE_RATE),
+                "<Up>": lambda: self.step(JUMP_LONG_S * SAMPLE_RATE),
+                "<Down>": lambda: self.step(-JUMP_LONG_S * SAMPLE_RATE),
+                "<KeyPress-n>": lambda: self.jump_event(1), "<KeyPress-p>": lambda: self.jump_event(-1),
+                "<space>": self.toggle_play}
+        # Odaktaki kaydırıcı/düğme ok ve boşluk tuşlarını kendisi de işler; orada da yakalanıp kesilir
+        widgets = [self.root, self.scale_timeline, self.scale_speed, self.btn_play, self.chk_smooth, self.btn_map]
+        for seq, func in keys.items():
+            for w in widgets:
+                w.bind(seq, lambda e, f=func: (f(), "break")[1])
+
+    def create_profile_overlay(self):
+        self.lbl_profile = tk.Label(self.root, text="", font=("Consolas", 9), fg="#00ff00",
+                                    bg="black", justify=tk.LEFT, anchor="nw")
+        self.profile_visible = False
+        self.root.bind("<F2>", self.toggle_profile_overlay)
+        self.root.bind("<F3>", self.export_profile)
+
+    def toggle_profile_overlay(self, event=None):
+        self.profile_visible = not self.profile_visible
+        if self.profile_visible:
+            self.lbl_profile.config(text=self.profiler.overlay_text())
+            self.lbl_profile.place(relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
+        else:
+            self.lbl_profile.place_forget()
+
+    def export_profile(self, event=None):
+        n = self.profiler.export(PROFILE_EXPORT)
+        print(f"Kare ölçümleri kaydedildi: {PROFILE_EXPORT} ({n} kare)")
+
+    def create_placeholder(self, parent, title, command):
+        lbl = tk.Label(parent, text=f"{title}\n(göstermek için tıklayın)", fg="gray", bg="black",
+                       font=("Arial", 11, "bold"), cursor="hand2")
+        lbl.pack(fill=tk.BOTH, expand=True)
+        lbl.bind("<Button-1>", lambda e: command())
+        return lbl
+
+    def ensure_map_pane(self):
+        # 3D iz ve 2D harita ilk gösterildiklerinde kurulur (matplotlib burada yüklenir)
+        if self.map_ready or self.total_frames == 0 or self.stream is not None: return
+        t = time.perf_counter()
+        self.map_placeholder.destroy()
+        self.create_3d_plot()
+        self.create_map_view()
+        # Ertelenen (draw_idle) gerçek çizim sürelerini de ölç
+        self.canvas_3d.draw = self.profiler.wrap("render_3d", self.canvas_3d.draw)
+        self.canvas_map.draw = self.profiler.wrap("render_map", self.canvas_map.draw)
+        self.map_ready = True
+        if MAP_MODE == '2d':
+            self.toggle_map_mode()
+        self.update_ui()
+        print(f"Harita kuruldu: {(time.perf_counter() - t) * 1000:.0f} ms")
+
+    def ensure_rate_pane(self):
+        if self.rate_ready or self.total_frames == 0 or self.stream is not None: return
+        t = time.perf_counter()
+        self.rate_placeholder.destroy()
+        self.create_rate_plot()
+        self.canvas_rate.draw = self.profiler.wrap("render_rate", self.canvas_rate.draw)
+        self.rate_ready = True
+        self.update_ui()
+        print(f"Rate grafiği kuruldu: {(time.perf_counter() - t) * 1000:.0f} ms")
+
     def create_gauge_canvas(self, parent, title, r, c):
         frame = tk.Frame(parent, bg="#202020")
         frame.grid(row=r, column=c, padx=3, pady=3, sticky="nsew")
@@ -222,6 +596,9 @@ class CockpitApp:
         return lbl_val
 
     def create_3d_plot(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from mpl_toolkits.mplot3d import Axes3D
         print("3D Grafik Hazırlanıyor...")
         self.fig3d = plt.figure(figsize=(8, 6), dpi=100, facecolor='#101010')
         self.ax3d = self.fig3d.add_subplot(111, projection='3d')
@@ -243,15 +620,76 @@ class CockpitApp:
             self.ax3d.scatter([xs[-1]], [ys[-1]], [zs[-1]], color='red', marker='x', s=10)
             self.plane_marker, = self.ax3d.plot([], [], [], marker='^', color='cyan', markersize=10, linestyle='None')
             
-            self.ax3d.set_xlim(xs.min(), xs.max())
-            self.ax3d.set_ylim(ys.min(), ys.max())
-            self.ax3d.set_zlim(zs.min(), zs.max())
+            for rec in self.others:
+                o = rec["df"]
+                oxs, oys = o['BlendedLongitude'].values[::step], o['BlendedLatitude'].values[::step]
+                ozs = o['Altitude'].values[::step]
+                self.ax3d.plot(oxs, oys, ozs, color=rec["color"], linewidth=0.6, alpha=0.4)
+                rec["marker3d"], = self.ax3d.plot([], [], [], marker='^', color=rec["color"],
+                                                   markersize=8, linestyle='None')
+                xs, ys, zs = np.r_[xs, oxs], np.r_[ys, oys], np.r_[zs, ozs]
+
+            self.ax3d.set_xlim(np.nanmin(xs), np.nanmax(xs))
+            self.ax3d.set_ylim(np.nanmin(ys), np.nanmax(ys))
+            self.ax3d.set_zlim(np.nanmin(zs), np.nanmax(zs))
 
         self.canvas_3d = FigureCanvasTkAgg(self.fig3d, master=self.map_frame)
         self.canvas_3d.draw()
         self.canvas_3d.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+    def create_map_view(self):
+        # 2D hareketli harita: iz bir kez metreye çevrilir, sadece görünen parça çizilir
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from MapView import MapView
+        self.figMap = plt.figure(figsize=(8, 6), dpi=100, facecolor='#101010')
+        self.axMap = self.figMap.add_subplot(111)
+        self.axMap.set_facecolor('#101010')
+        self.axMap.tick_params(colors='gray', labelsize=8)
+        self.axMap.grid(color='gray', linestyle=':', linewidth=0.3, alpha=0.5)
+        lat = self.df['BlendedLatitude'].values if self.total_frames > 0 else np.zeros(0)
+        lon = self.df['BlendedLongitude'].values if self.total_frames > 0 else np.zeros(0)
+        self.map_view = MapView(self.axMap, lat, lon, scale=1.0)  # load_data'da dereceye çevrildi
+        for rec in self.others:
+            rec["map_track"] = self.map_view.add_track(rec["df"]['BlendedLatitude'].values,
+                                                       rec["df"]['BlendedLongitude'].values, rec["color"])
+
+        self.canvas_map = FigureCanvasTkAgg(self.figMap, master=self.map_frame)
+        self.canvas_map.mpl_connect('button_press_event', self.on_map_click)
+        self.canvas_map.mpl_connect('scroll_event', self.on_map_scroll)
+
+    def toggle_map_mode(self):
+        if not self.map_ready:
+            self.ensure_map_pane()
+            return
+        if self.map_mode == '3d':
+            self.canvas_3d.get_tk_widget().pack_forget()
+            self.canvas_map.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.map_mode = '2d'
+        else:
+            self.canvas_map.get_tk_widget().pack_forget()
+            self.canvas_3d.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.map_mode = '3d'
+        self.btn_map.config(text="3D İZ" if self.map_mode == '2d' else "2D HARİTA")
+        self.update_ui()
+
+    def on_map_click(self, event):
+        i = self.map_view.sample_at(event)
+        if i >= 0:
+            self.current_frame = i
+            self.var_timeline.set(i)
+            self.update_ui()
+
+    def on_map_scroll(self, event):
+        from MapView import ZOOM_STEP
+        if self.total_frames == 0: return
+        factor = 1 / ZOOM_STEP if event.button == 'up' else ZOOM_STEP
+        self.map_view.zoom(factor, min(self.current_frame, self.total_frames - 1))
+        self.canvas_map.draw_idle()
+
     def create_rate_plot(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         print("2D Grafikler Hazırlanıyor...")
         self.figRate = plt.figure(figsize=(4, 3), dpi=100, facecolor='#151515')
         self.axRate = self.figRate.add_subplot(111)
@@ -277,16 +715,56 @@ class CockpitApp:
         self.btn_play.config(text="⏸ DURAKLAT" if self.is_playing else "▶ OYNAT", bg="darkred" if self.is_playing else "#444")
 
     def on_seek(self, val):
-        self.current_frame = int(val)
+        # Kaydırıcı her hareket olayında çağrılır; çizim SEEK_COALESCE_MS sonra, son konumla bir kez
+        frame = int(float(val))
+        if frame == self.current_frame: return      # oynatma veya seek() kaydırıcıyı taşıdı
+        self.current_frame = frame
+        self.event_note = ""
+        self.schedule_render()
+
+    def schedule_render(self):
+        if self.seek_job is None:
+            self.seek_job = self.root.after(SEEK_COALESCE_MS, self.render_seek)
+
+    def render_seek(self):
+        self.seek_job = None
         self.update_ui()
 
+    def seek(self, frame, note=""):
+        if self.total_frames == 0: return
+        self.current_frame = min(max(int(frame), 0), self.total_frames - 1)
+        self.event_note = note
+        self.var_timeline.set(self.current_frame)
+        self.schedule_render()
+
+    def step(self, frames, pause=False):
+        # Akışta oynatma en yeni satırı izler; geri adım atmak için durdurulur
+        if self.is_playing and (pause or self.stream is not None):
+            self.toggle_play()
+        self.seek(self.current_frame + frames)
+
+    def jump_event(self, direction):
+        if len(self.event_rows) == 0: return
+        if direction > 0:
+            k = int(np.searchsorted(self.event_rows, self.current_frame, side='right'))
+        else:
+            k = int(np.searchsorted(self.event_rows, self.current_frame, side='left')) - 1
+        if 0 <= k < len(self.event_rows):
+            self.seek(self.event_rows[k], self.event_kinds[k])
+
     def update_loop(self):
         if not self.is_running: return
-        if self.is_playing and self.total_frames > 0:
+        if self.stream is not None:
+            if self.pull_stream() and self.is_playing:
+                self.current_frame = self.total_frames - 1     # en yeni satırı izle
+                self.var_timeline.set(self.current_frame)
+                self.update_ui()
+        elif self.is_playing and self.total_frames > 0:
             speed = self.var_speed.get()
             self.current_frame += speed
             if self.current_frame >= self.total_frames:
                 self.current_frame = 0
+            self.event_note = ""
             self.var_timeline.set(self.current_frame)
             self.update_ui()
         if self.is_running:
@@ -295,31 +773,117 @@ class CockpitApp:
     def update_ui(self):
         if not self.is_running or self.total_frames == 0: return
         idx = min(self.current_frame, self.total_frames - 1)
-        row = self.df.iloc[idx]
+        prof = self.profiler
+        prof.begin_frame(idx)
+
+        with prof.phase("row"):
+            row = self.stream_rows[idx] if self.stream is not None else self.df.iloc[idx]
         use_smooth = self.var_smooth.get()
         alt_val = row['Altitude_Smooth'] if use_smooth else row['Altitude']
 
-        t_str = str(self.times[idx]).split(' ')[1] if ' ' in str(self.times[idx]) else str(self.times[idx])
-        self.lbl_time.config(text=f"TIME: {t_str} | ALT: {int(alt_val)} ft")
-
-        self.draw_airspeed(row['GroundSpeed'])
-        self.draw_attitude(row['RollAngle'], row['PitchAngle'])
-        self.draw_heading(row['PlatformAzimuth'])
-        self.draw_vsi(row['VelocityZ'])
-
-        self.plane_marker.set_data([row['BlendedLongitude']], [row['BlendedLatitude']])
-        self.plane_marker.set_3d_properties([alt_val])
-        self.canvas_3d.draw_idle()
-
-        self.time_line_rate.set_xdata([idx])
-        self.canvas_rate.draw_idle()
+        with prof.phase("airspeed"):
+            self.draw_airspeed(row['GroundSpeed'])
+        with prof.phase("attitude"):
+            if use_smooth:
+                self.draw_attitude(row['RollAngle_Smooth'], row['PitchAngle_Smooth'])
+            else:
+                self.draw_attitude(row['RollAngle'], row['PitchAngle'])
+        with prof.phase("heading"):
+            self.draw_heading(row['PlatformAzimuth'])
+        with prof.phase("vsi"):
+            self.draw_vsi(row['VelocityZ'])
+
+        with prof.phase("compare"):
+            self.update_compare(idx, use_smooth)
+
+        if self.map_ready and self.map_mode == '3d':
+            with prof.phase("canvas_3d"):
+                self.plane_marker.set_data([row['BlendedLongitude']], [row['BlendedLatitude']])
+                self.plane_marker.set_3d_properties([alt_val])
+                self.canvas_3d.draw_idle()
+        elif self.map_ready:
+            with prof.phase("canvas_map"):
+                self.map_view.update(idx)
+                self.canvas_map.draw_idle()
+
+        if self.rate_ready:
+            with prof.phase("canvas_rate"):
+                self.time_line_rate.set_xdata([idx])
+                self.canvas_rate.draw_idle()
         
         #### ==================================================
         # BURADA BIR IYILEŞTIRME YAPMAM LAZIM... :( 
         
-        self.lbl_roll_rate.config(text=f"Cur: {row['RollRate']:.1f}°/s | Max: {row['RollRate_Max']:.1f}")
-        self.lbl_pitch_rate.config(text=f"Cur: {row['PitchRate']:.1f}°/s | Max: {row['PitchRate_Max']:.1f}")
-        self.lbl_yaw_rate.config(text=f"Cur: {row['YawRate']:.1f}°/s | Max: {row['YawRate_Max']:.1f}")
+        with prof.phase("labels"):
+            t_str = str(self.times[idx]).split(' ')[1] if ' ' in str(self.times[idx]) else str(self.times[idx])
+            self.lbl_time.config(text=f"TIME: {t_str} | ALT: {int(alt_val)} ft{self.phase_text(idx)}{self.leg_text(idx)}"
+                                     f"{' | ' + self.event_note if self.event_note else ''}")
+            for c, lbl in (("RollRate", self.lbl_roll_rate), ("PitchRate", self.lbl_pitch_rate),
+                           ("YawRate", self.lbl_yaw_rate)):
+                lbl.config(text=self.rate_text(c, idx))
+
+        prof.end_frame()
+        if self.profile_visible and prof.count % OVERLAY_EVERY == 0:
+            self.lbl_profile.config(text=prof.overlay_text())
+
+    def rate_text(self, c, idx):
+        # Akışta istatistikler en yeni satıra kadardır (geçmişte gezinirken de)
+        stats = self.rate_stats.get(c)
+        if stats is None: return "Cur: --"
+        cur, mx, win, peak = stats.last if self.stream is not None else stats.at(idx)
+        return f"Cur: {cur:6.1f}°/s  Pk: {peak:5.1f}\n{RATE_WINDOW_S:g}s: {win:5.1f}  Max: {mx:5.1f}"
+
+    def update_compare(self, idx, use_smooth):
+        # Diğer kayıtlar: göstergelere ince ibre, izlere işaret (tek çizim turunda)
+        lines = []
+        for k, rec in enumerate(self.others):
+            j = int(rec["map"][idx])
+            if j < 0:
+                if "marker3d" in rec:
+                    rec["marker3d"].set_data([], [])
+                    rec["marker3d"].set_3d_properties([])
+                if self.map_ready:
+                    self.map_view.update_other(rec["map_track"], -1)
+                lines.append(f"{rec['name']}: --")
+                continue
+            row = rec["df"].iloc[j]
+            alt = row['Altitude_Smooth'] if use_smooth else row['Altitude']
+            roll = row['RollAngle_Smooth'] if use_smooth else row['RollAngle']
+            pitch = row['PitchAngle_Smooth'] if use_smooth else row['PitchAngle']
+            self.draw_overlay(rec["color"], row['GroundSpeed'], roll, pitch,
+                              row['PlatformAzimuth'], row['VelocityZ'])
+            if "marker3d" in rec:
+                rec["marker3d"].set_data([row['BlendedLongitude']], [row['BlendedLatitude']])
+                rec["marker3d"].set_3d_properties([alt])
+            if self.map_ready:
+                self.map_view.update_other(rec["map_track"], j)
+            t = str(rec["times"][j])
+            lines.append(f"{rec['name']}: {t.split(' ')[-1]} | ALT: {int(alt)} ft | "
+                         f"GS: {int(row['GroundSpeed'])} kt | R: {roll:.0f}°")
+        if self.others:
+            self.lbl_compare.config(text="\n".join(lines))
+
+    def draw_overlay(self, color, speed, roll, pitch, hdg, vz):
+        # Ana göstergelerin üzerine ikinci kaydın ibreleri (draw_* fonksiyonlarıyla aynı geometri)
+        cx, cy = 80, 80
+        rad = math.radians(135 + (speed / 600) * 270)
+        self.canvas_airspeed.create_line(cx, cy, cx + 45 * math.cos(rad), cy + 45 * math.sin(rad),
+                                         fill=color, width=2, arrow=tk.LAST)
+        rad = math.radians(-hdg - 90)
+        self.canvas_heading.create_line(cx, cy, cx + 45 * math.cos(rad), cy + 45 * math.sin(rad),
+                                        fill=color, width=2, arrow=tk.LAST)
+        val = max(min(vz, 20), -20)
+        rad = math.radians(180 - (val / 20) * 90)
+        self.canvas_vsi.create_line(cx, cy, cx + 45 * math.cos(rad), cy + 45 * math.sin(rad),
+                                    fill=color, width=2, arrow=tk.LAST)
+        # Yapay ufuk: ikinci kaydın ufuk çizgisi
+        rad = math.radians(-roll)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+        off = pitch * 1.2
+        pts = []
+        for x, y in [(-50, off), (50, off)]:
+            pts.extend([x * cos_a - y * sin_a + cx, x * sin_a + y * cos_a + cy])
+        self.canvas_attitude.create_line(pts, fill=color, width=2, dash=(4, 2))
 
     # --- YENİ "HAVALI" YAPAY UFUK FONKSİYONU ---
     def draw_attitude(self, roll, pitch):
@@ -427,6 +991,8 @@ class CockpitApp:
         c.create_line(80, 80, x, y, fill="white", width=3, arrow=tk.LAST)
 
 if __name__ == "__main__":
+    # python FlightDashboard_3D.py [ana_kayıt] [diğer_kayıtlar...]
+    files = sys.argv[1:] or [FILE_NAME] + COMPARE_FILES
     root = tk.Tk()
-    app = CockpitApp(root, FILE_NAME)
+    app = CockpitApp(root, files[0], files[1:])
     root.mainloop()
\ No newline at end of file
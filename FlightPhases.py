@@ -0,0 +1,179 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from BinaryRecording import load_recording
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+PHASES_SUFFIX = '.phases.npz'
+PHASES_VERSION = 2            # Sınıflandırma değişince eski yan dosyalar yeniden üretilir
+SAMPLE_RATE = 20
+ANGLE_SCALE = 180.0           # Normalize -> Derece
+KNOTS_CONVERSION = 0.592484
+SMOOTH_S = 2.0                # Sınıflandırmadan önce kayan ortalama (sn)
+MIN_PHASE_S = 5.0             # Daha kısa evreler komşu evreye katılır
+TAXI_MAX_KT = 50.0            # Altında yerde (taksi)
+TURN_ROLL_DEG = 15.0          # |yatış| veya
+TURN_RATE_DPS = 1.5           # |sapma hızı| bunu aşarsa dönüş
+CLIMB_FPS = 8.0               # VelocityZ (ft/s, yukarı +) ~ 500 ft/dk
+PHASE_COLS = ["TimeMarker", "VelocityX", "VelocityY", "VelocityZ", "RollAngle", "YawRate"]
+
+# Kod -> (isim, zaman çizelgesi rengi). Öncelik: taksi > dönüş > tırmanış/alçalış > seyir
+PHASES = {
+    0: ("cruise", "#2e7d32"),
+    1: ("climb", "#1565c0"),
+    2: ("descent", "#ef6c00"),
+    3: ("turn", "#c62828"),
+    4: ("taxi", "#757575"),
+}
+CODES = {name: code for code, (name, _) in PHASES.items()}
+
+
+def _smooth(x, window):
+    # Merkezli kayan ortalama (cumsum; NaN -> 0 katkı)
+    if window <= 1 or len(x) == 0:
+        return x
+    ok = np.isfinite(x)
+    c = np.concatenate(([0.0], np.cumsum(np.where(ok, x, 0.0))))
+    k = np.concatenate(([0], np.cumsum(ok)))
+    i = np.arange(len(x))
+    lo = np.clip(i - window // 2, 0, len(x))
+    hi = np.clip(i + (window + 1) // 2, 0, len(x))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (c[hi] - c[lo]) / (k[hi] - k[lo])
+
+def runs(labels):
+    # -> (başlangıçlar, bitişler_hariç, etiketler)
+    if len(labels) == 0:
+        e = np.zeros(0, dtype=np.int64)
+        return e, e, np.zeros(0, dtype=labels.dtype)
+    starts = np.concatenate(([0], np.flatnonzero(labels[1:] != labels[:-1]) + 1))
+    ends = np.concatenate((starts[1:], [len(labels)]))
+    return starts, ends, labels[starts]
+
+def _absorb_short(labels, min_len):
+    # Kısa evre önceki evrenin etiketini alır (ilk evre ise sonrakinin); tek tur yeterli
+    starts, ends, vals = runs(labels)
+    short = (ends - starts) < min_len
+    if not short.any() or len(vals) < 2:
+        return labels
+    keep = ~short
+    if not keep.any():
+        return labels
+    # Her evre için son uzun evrenin etiketi (yoksa ilk uzun evre)
+    idx = np.where(keep, np.arange(len(vals)), -1)
+    idx = np.maximum.accumulate(idx)
+    idx[idx < 0] = np.flatnonzero(keep)[0]
+    return np.repeat(vals[idx], ends - starts)
+
+def wrap180(deg):
+    # Yatış normalize * 180 olarak [0, 360) gelir: -10° seviye uçuş 350° görünür
+    return (deg + 180.0) % 360.0 - 180.0
+
+def classify(ground_speed, vz, roll, yaw_rate, smooth_s=SMOOTH_S, min_phase_s=MIN_PHASE_S):
+    # ground_speed: kt, vz: ft/s (yukarı +), roll: derece (±180), yaw_rate: derece/sn -> uint8 etiket
+    w = int(smooth_s * SAMPLE_RATE)
+    gs = _smooth(np.asarray(ground_speed, dtype=np.float64), w)
+    vz = _smooth(np.asarray(vz, dtype=np.float64), w)
+    roll = _smooth(np.asarray(roll, dtype=np.float64), w)
+    yaw = _smooth(np.asarray(yaw_rate, dtype=np.float64), w)
+
+    labels = np.full(len(gs), CODES["cruise"], dtype=np.uint8)
+    labels[vz > CLIMB_FPS] = CODES["climb"]
+    labels[vz < -CLIMB_FPS] = CODES["descent"]
+    labels[(np.abs(roll) > TURN_ROLL_DEG) | (np.abs(yaw) > TURN_RATE_DPS)] = CODES["turn"]
+    labels[gs < TAXI_MAX_KT] = CODES["taxi"]
+    return _absorb_short(labels, int(min_phase_s * SAMPLE_RATE))
+
+def classify_frame(df):
+    # Ham kayıt sütunları (normalize açılar, ft/s hızlar)
+    def num(c):
+        if c not in df.columns: return np.full(len(df), np.nan)
+        return pd.to_numeric(df[c], errors='coerce').values.astype(np.float64)
+    gs = np.hypot(num("VelocityX"), num("VelocityY")) * KNOTS_CONVERSION
+    return classify(gs, num("VelocityZ"), wrap180(num("RollAngle") * ANGLE_SCALE), num("YawRate") * ANGLE_SCALE)
+
+
+def segment_index(labels, times=None):
+    # Evre bölgeleri (run-length) tablosu
+    starts, ends, vals = runs(labels)
+    out = pd.DataFrame({"phase": [PHASES[int(v)][0] for v in vals], "code": vals,
+                        "start_row": starts, "end_row": ends,
+                        "duration_s": (ends - starts) / SAMPLE_RATE})
+    if times is not None and len(starts):
+        times = np.asarray(times)
+        out["start_time"] = times[starts]
+        out["end_time"] = times[ends - 1]
+    return out
+
+def phase_rows(index, phase):
+    # Sadece bu evrenin satırları (analizler tüm kaydı taramadan buradan başlar)
+    sel = index[index["phase"] == phase]
+    return [slice(int(a), int(b)) for a, b in zip(sel["start_row"], sel["end_row"])]
+
+def summary(index):
+    return index.groupby("phase")["duration_s"].agg(["count", "sum", "max"]).rename(
+        columns={"count": "segments", "sum": "total_s", "max": "longest_s"})
+
+
+# ---------------------------------------------------------
+# KAYIT YANINDA SAKLAMA
+# ---------------------------------------------------------
+def load_phases(path, rebuild=False):
+    # -> (etiketler, bölge tablosu). Yan dosya boyut/zaman değişmediyse kullanılır
+    ppath = path + PHASES_SUFFIX
+    st = os.stat(path)
+    if not rebuild and os.path.exists(ppath):
+        z = np.load(ppath)
+        if (int(z["size"]) == st.st_size and float(z["mtime"]) == st.st_mtime
+                and int(z.get("version", 0)) == PHASES_VERSION):
+            labels = np.repeat(z["codes"], z["ends"] - z["starts"])
+            index = segment_index(labels)
+            if len(z["start_time"]) == len(index):
+                index["start_time"], index["end_time"] = z["start_time"], z["end_time"]
+            return labels, index
+    df = load_recording(path, columns=PHASE_COLS)
+    labels = classify_frame(df)
+    times = df["TimeMarker"].astype(str).values if "TimeMarker" in df.columns else None
+    index = segment_index(labels, times)
+    # Sadece bölgeler saklanır; etiketler yüklenirken geri açılır
+    no_times = np.zeros(0, dtype='U1')
+    tmp = ppath + '.tmp.npz'
+    np.savez(tmp, codes=index["code"].values, starts=index["start_row"].values,
+             ends=index["end_row"].values,
+             start_time=index["start_time"].to_numpy().astype(str) if times is not None else no_times,
+             end_time=index["end_time"].to_numpy().astype(str) if times is not None else no_times,
+             size=st.st_size, mtime=st.st_mtime, version=PHASES_VERSION)
+    os.replace(tmp, ppath)
+    return labels, index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uçuş evresi sınıflandırma (taksi/tırmanış/seyir/dönüş/alçalış)")
+    parser.add_argument("recordings", nargs="+")
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--phase", help="Sadece bu evrenin bölgelerini listele (örn: turn)")
+    parser.add_argument("-o", "--output", help="Bölge tablosu (CSV)")
+    args = parser.parse_args(argv)
+
+    tables = []
+    for path in args.recordings:
+        labels, index = load_phases(path, args.rebuild)
+        index.insert(0, "recording", os.path.basename(path))
+        tables.append(index)
+        print(f"\n{path}: {len(labels)} örnek, {len(index)} bölge")
+        print(summary(index))
+        if len(index) == 1 and len(labels) > MIN_PHASE_S * SAMPLE_RATE and index["phase"].iloc[0] == "turn":
+            print("Uyarı: kaydın tamamı dönüş olarak sınıflandı (yatış/sapma birimini kontrol edin)")
+    allidx = pd.concat(tables, ignore_index=True)
+    if args.phase:
+        with pd.option_context('display.width', 200):
+            print(allidx[allidx["phase"] == args.phase])
+    if args.output:
+        allidx.to_csv(args.output, index=False)
+
+if __name__ == "__main__":
+    sys.exit(main())
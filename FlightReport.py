@@ -0,0 +1,283 @@
+import os
+import sys
+import html
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from DataSources import iter_frames
+from FleetIndex import RAW_COLS, CHANNELS, derive_channels
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+CHUNK_ROWS = 100000           # Bir seferde okunan satır (bellek bundan bağımsız sabit)
+COMPRESSION = 200             # Yüzdelik özeti: en fazla ~COMPRESSION merkez
+PERCENTILES = [1, 5, 25, 50, 75, 95, 99]
+WORKERS = None                # Birden çok kayıtta süreç sayısı (None -> çekirdek sayısı)
+
+# Kanal: (histogram alt, üst, kova genişliği, eşik). Eşik: |değer| > eşik süresi
+CHANNEL_SPECS = {
+    "RollAngle":   (-180.0, 180.0, 5.0, 60.0),
+    "PitchAngle":  (-90.0, 90.0, 2.5, 20.0),
+    "RollRate":    (-200.0, 200.0, 5.0, 90.0),
+    "PitchRate":   (-100.0, 100.0, 2.5, 30.0),
+    "YawRate":     (-100.0, 100.0, 2.5, 30.0),
+    "GroundSpeed": (0.0, 800.0, 10.0, 500.0),
+    "Altitude":    (-1000.0, 50000.0, 500.0, 30000.0),
+}
+
+# Tüm istatistikler parça parça güncellenir; kayıt boyu ne olursa olsun bellekte
+# sadece bir parça + kanal başına sabit boyutlu özetler tutulur.
+
+
+class Moments:
+    # Welford / Chan: parça istatistikleri sayısal olarak kararlı biçimde birleştirilir
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, x):
+        if len(x) == 0: return
+        n_b = len(x)
+        mean_b = float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else np.nan
+
+
+class QuantileSketch:
+    # t-digest benzeri: sıralı merkezler (ortalama, ağırlık). Uçlarda (q ~ 0 / 1)
+    # merkezler küçük tutulur (k = C/pi * asin(2q-1) ölçeği), yüzdelikler uçlarda
+    # da hassas kalır. Her parça mevcut merkezlerle birlikte tek sıralamada sıkıştırılır.
+    def __init__(self, compression=COMPRESSION):
+        self.compression = compression
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+
+    def update(self, x):
+        if len(x) == 0: return
+        means = np.concatenate((self.means, x))
+        weights = np.concatenate((self.weights, np.ones(len(x))))
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cum = np.cumsum(weights)
+        q = (cum - weights / 2) / cum[-1]
+        k = np.floor(self.compression / np.pi * np.arcsin(np.clip(2 * q - 1, -1, 1)))
+        _, ids = np.unique(k, return_inverse=True)
+        w = np.bincount(ids, weights)
+        self.means = np.bincount(ids, weights * means) / w
+        self.weights = w
+
+    def quantile(self, q, lo=None, hi=None):
+        # q: 0..1 (dizi olabilir). lo/hi: gerçek min/max (uç merkezlerin ötesi için)
+        if len(self.means) == 0:
+            return np.full(np.shape(q), np.nan)
+        cum = np.cumsum(self.weights)
+        mid = (cum - self.weights / 2) / cum[-1]
+        xs, ys = mid, self.means
+        if lo is not None:
+            xs, ys = np.concatenate(([0.0], xs)), np.concatenate(([lo], ys))
+        if hi is not None:
+            xs, ys = np.concatenate((xs, [1.0])), np.concatenate((ys, [hi]))
+        return np.interp(q, xs, ys)
+
+
+class Histogram:
+    def __init__(self, lo, hi, width):
+        self.edges = np.arange(lo, hi + width / 2, width)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.under = self.over = 0
+
+    def update(self, x):
+        self.under += int((x < self.edges[0]).sum())
+        self.over += int((x >= self.edges[-1]).sum())
+        k = np.searchsorted(self.edges, x, side='right') - 1
+        k = k[(k >= 0) & (k < len(self.counts))]
+        self.counts += np.bincount(k, minlength=len(self.counts))
+
+
+class Exceedance:
+    # |x| > eşik: toplam süre, ayrı aşım sayısı, en uzun aşım (parça sınırlarını aşan aşımlar dahil)
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.samples = 0
+        self.events = 0
+        self.longest = 0
+        self.current = 0          # önceki parçanın sonunda süren aşım (örnek)
+
+    def update(self, x):
+        over = np.abs(x) > self.threshold       # NaN -> aşım değil
+        if len(over) == 0: return
+        self.samples += int(over.sum())
+        edges = np.diff(np.concatenate(([0], over.view(np.int8), [0])))
+        starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+        if len(starts) == 0:
+            self.current = 0
+            return
+        lengths = ends - starts
+        if starts[0] == 0 and self.current:
+            lengths[0] += self.current          # önceki parçadan devam eden aşım
+            self.events -= 1
+        self.events += len(starts)
+        self.longest = max(self.longest, int(lengths.max()))
+        self.current = int(lengths[-1]) if ends[-1] == len(over) else 0
+
+
+class ChannelStats:
+    def __init__(self, name, spec=None):
+        self.name = name
+        self.nan = 0
+        self.moments = Moments()
+        self.sketch = QuantileSketch()
+        lo, hi, width, threshold = spec or CHANNEL_SPECS.get(name, (None, None, None, None))
+        self.hist = Histogram(lo, hi, width) if width else None
+        self.exceed = Exceedance(threshold) if threshold is not None else None
+
+    def update(self, values):
+        x = np.asarray(values, dtype=np.float64)
+        if self.exceed: self.exceed.update(x)
+        ok = np.isfinite(x)
+        self.nan += int(len(x) - ok.sum())
+        x = x[ok]
+        self.moments.update(x)
+        self.sketch.update(x)
+        if self.hist: self.hist.update(x)
+
+    def summary(self):
+        m = self.moments
+        row = {"channel": self.name, "count": m.n, "missing": self.nan,
+               "min": m.min if m.n else np.nan, "max": m.max if m.n else np.nan,
+               "mean": m.mean if m.n else np.nan, "std": m.std}
+        qs = self.sketch.quantile(np.array(PERCENTILES) / 100.0, row["min"], row["max"])
+        row.update({f"p{p}": float(v) for p, v in zip(PERCENTILES, qs)})
+        if self.exceed:
+            e = self.exceed
+            row.update(threshold=e.threshold, time_above_s=e.samples / SAMPLE_RATE,
+                       excursions=e.events, longest_s=e.longest / SAMPLE_RATE)
+        return row
+
+
+# ---------------------------------------------------------
+# 1. TEK GEÇİŞ
+# ---------------------------------------------------------
+def report_recording(path, chunk_rows=CHUNK_ROWS, thresholds=None):
+    # -> özet sözlüğü (kanal satırları + histogramlar); kayıt hiçbir zaman tamamen yüklenmez
+    t = time.perf_counter()
+    specs = dict(CHANNEL_SPECS)
+    for ch, th in (thresholds or {}).items():
+        lo, hi, width, _ = specs.get(ch, (None, None, None, None))
+        specs[ch] = (lo, hi, width, th)
+    stats = {ch: ChannelStats(ch, specs.get(ch)) for ch in CHANNELS}
+    n_rows, t_first, t_last = 0, None, None
+    for df in iter_frames(path, RAW_COLS, chunk_rows):
+        data, times = derive_channels(df)
+        for ch in CHANNELS:
+            stats[ch].update(data[ch].values)
+        n_rows += len(df)
+        valid = times.dropna()
+        if len(valid):
+            t_first = valid.iloc[0] if t_first is None else t_first
+            t_last = valid.iloc[-1]
+    return {"path": path, "n_rows": n_rows,
+            "start_time": None if t_first is None else str(t_first),
+            "end_time": None if t_last is None else str(t_last),
+            "duration_s": n_rows / SAMPLE_RATE,
+            "elapsed_s": time.perf_counter() - t,
+            "channels": [stats[ch].summary() for ch in CHANNELS],
+            "histograms": {ch: (s.hist.edges, s.hist.counts, s.hist.under, s.hist.over)
+                           for ch, s in stats.items() if s.hist is not None}}
+
+def report_many(paths, workers=WORKERS, thresholds=None):
+    if len(paths) == 1 or workers == 1:
+        return [report_recording(p, thresholds=thresholds) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(report_recording, paths, [CHUNK_ROWS] * len(paths),
+                             [thresholds] * len(paths)))
+
+
+# ---------------------------------------------------------
+# 2. ÇIKTI (CSV / HTML)
+# ---------------------------------------------------------
+def summary_table(reports):
+    rows = []
+    for rep in reports:
+        for ch in rep["channels"]:
+            rows.append({"recording": os.path.basename(rep["path"]), **ch})
+    return pd.DataFrame(rows)
+
+def _svg_histogram(edges, counts, width=360, height=80):
+    if counts.sum() == 0:
+        return ""
+    bar = width / len(counts)
+    top = counts.max()
+    rects = "".join(
+        f'<rect x="{i * bar:.1f}" y="{height - c / top * height:.1f}" width="{max(bar - 0.5, 0.5):.1f}" '
+        f'height="{c / top * height:.1f}"><title>{edges[i]:g}..{edges[i + 1]:g}: {c}</title></rect>'
+        for i, c in enumerate(counts) if c)
+    return (f'<svg width="{width}" height="{height + 14}" class="hist"><g fill="#1f77b4">{rects}</g>'
+            f'<text x="0" y="{height + 12}">{edges[0]:g}</text>'
+            f'<text x="{width}" y="{height + 12}" text-anchor="end">{edges[-1]:g}</text></svg>')
+
+def write_html(reports, out_path):
+    css = ("body{font-family:sans-serif;margin:20px}table{border-collapse:collapse;font-size:13px}"
+           "td,th{border:1px solid #ccc;padding:3px 6px;text-align:right}th{background:#eee}"
+           "td:first-child{text-align:left}.hist text{font-size:10px}h2{margin-top:32px}")
+    parts = [f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Uçuş Raporu</title>"
+             f"<style>{css}</style></head><body><h1>Uçuş Raporu</h1>"]
+    for rep in reports:
+        df = pd.DataFrame(rep["channels"]).set_index("channel")
+        parts.append(f"<h2>{html.escape(os.path.basename(rep['path']))}</h2>"
+                     f"<p>{rep['n_rows']} kayıt, {rep['duration_s'] / 60:.1f} dk "
+                     f"({html.escape(str(rep['start_time']))} - {html.escape(str(rep['end_time']))}), "
+                     f"hesaplama {rep['elapsed_s']:.1f} sn</p>")
+        parts.append(df.to_html(float_format=lambda v: f"{v:.2f}", na_rep="-"))
+        parts.append("<table><tr><th>Kanal</th><th>Histogram</th><th>Aralık dışı (alt / üst)</th></tr>")
+        for ch, (edges, counts, under, over) in rep["histograms"].items():
+            parts.append(f"<tr><td>{ch}</td><td>{_svg_histogram(edges, counts)}</td>"
+                         f"<td>{under} / {over}</td></tr>")
+        parts.append("</table>")
+    parts.append("</body></html>")
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(parts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tek geçişte kanal istatistikleri raporu (HTML/CSV)")
+    parser.add_argument("recordings", nargs="+", help="CSV veya .nrec kayıtları")
+    parser.add_argument("-o", "--html", default="flight_report.html")
+    parser.add_argument("--csv", help="Kanal özet tablosu (CSV)")
+    parser.add_argument("--threshold", nargs="*", default=[], metavar="KANAL=DEĞER",
+                        help="Örn: RollRate=120 GroundSpeed=450")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args(argv)
+
+    thresholds = {}
+    for item in args.threshold:
+        ch, _, val = item.partition("=")
+        thresholds[ch] = float(val)
+    reports = report_many(args.recordings, args.workers, thresholds)
+    write_html(reports, args.html)
+    print(f"{args.html} yazıldı")
+    if args.csv:
+        summary_table(reports).to_csv(args.csv, index=False, float_format='%.6g')
+        print(f"{args.csv} yazıldı")
+    with pd.option_context('display.width', 200, 'display.max_columns', 30):
+        print(summary_table(reports)[["recording", "channel", "min", "max", "mean", "std", "p50", "p99"]])
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+HISTORY = 2000        # Bellekte tutulan son kare sayısı
+FPS_WINDOW = 40       # FPS hesabı için son N kare
+
+
+class FrameProfiler:
+    # Kare bazında faz süreleri (ms). Kullanım:
+    #   prof.begin_frame(idx)
+    #   with prof.phase("row"): ...
+    #   prof.end_frame()
+    # Sonradan çalışan işler (ör. draw_idle ile ertelenen çizim) wrap() ile
+    # son kareye eklenir.
+    def __init__(self, enabled=True, history=HISTORY):
+        self.enabled = enabled
+        self.frames = deque(maxlen=history)
+        self.count = 0                      # Toplam kare sayısı (deque dolunca da artar)
+        self.phase_names = []
+        self.current = None
+        self._t0 = time.perf_counter()
+
+    def begin_frame(self, frame_idx):
+        if not self.enabled: return
+        self.current = {"frame": frame_idx, "t": time.perf_counter() - self._t0,
+                        "total": 0.0, "phases": {}}
+        self._start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.current is None: return
+        self.current["total"] = (time.perf_counter() - self._start) * 1000.0
+        self.frames.append(self.current)
+        self.count += 1
+        self.current = None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t) * 1000.0)
+
+    def record(self, name, ms):
+        target = self.current if self.current is not None else (self.frames[-1] if self.frames else None)
+        if target is None: return
+        if name not in self.phase_names:
+            self.phase_names.append(name)
+        target["phases"][name] = target["phases"].get(name, 0.0) + ms
+
+    def wrap(self, name, func):
+        def wrapped(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapped
+
+    # --- ÖZET ---
+    def fps(self):
+        if len(self.frames) < 2: return 0.0
+        recent = list(self.frames)[-FPS_WINDOW:]
+        span = recent[-1]["t"] - recent[0]["t"]
+        return (len(recent) - 1) / span if span > 0 else 0.0
+
+    def summary(self, last=FPS_WINDOW):
+        # faz -> (ortalama ms, max ms)
+        recent = list(self.frames)[-last:]
+        out = {}
+        for name in self.phase_names + ["total"]:
+            vals = [f["total"] if name == "total" else f["phases"].get(name, 0.0) for f in recent]
+            if vals:
+                out[name] = (sum(vals) / len(vals), max(vals))
+        return out
+
+    def overlay_text(self):
+        lines = [f"FPS: {self.fps():5.1f}   (ms ort / max)"]
+        for name, (avg, peak) in self.summary().items():
+            lines.append(f"{name:<12}{avg:7.2f} {peak:7.2f}")
+        return "\n".join(lines)
+
+    # --- DIŞA AKTARIM ---
+    def export(self, path):
+        frames = list(self.frames)
+        if path.lower().endswith('.json'):
+            with open(path, 'w') as f:
+                json.dump({"phases": self.phase_names, "frames": frames}, f, indent=1)
+        else:
+            with open(path, 'w', newline='') as f:
+                w = csv.writer(f)
+                w.writerow(["frame", "t", "total_ms"] + [f"{n}_ms" for n in self.phase_names])
+                for fr in frames:
+                    w.writerow([fr["frame"], f"{fr['t']:.6f}", f"{fr['total']:.4f}"] +
+                               [f"{fr['phases'].get(n, 0.0):.4f}" for n in self.phase_names])
+        return len(frames)
@@ -0,0 +1,224 @@
+import os
+import sys
+import math
+import argparse
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Circle
+from matplotlib.collections import LineCollection
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+TILE_SIZE = 220           # FlightDashBoard.py kadran boyu (px)
+BG_COLOR = '#202020'
+FACE_COLOR = '#101010'
+BEZEL_COLOR = '#555555'
+# Adımlar ibrede ~2 dereceye denk gelir (hız: 270°/600 kt, VSI: 90°/20); sayısal
+# değer ayrı yazıldığı için okunan değer nicelenmez. Her kare Tk'da
+# 220*220*4 B ~ 194 kB: 121 + 180 + 81 = 382 kare ~ 74 MB.
+AIRSPEED_STEP = 5.0       # kt   (121 kare)
+AIRSPEED_MAX = 600.0
+HEADING_STEP = 2.0        # derece (180 kare)
+VSI_STEP = 0.5            # (81 kare)
+VSI_MAX = 20.0
+PRERENDER_BATCH = 4       # Arka planda her boşta turda hazırlanan kare sayısı (~15 ms/kare)
+
+# Her kadran (yüz + ibre) nicelenmiş değerler için bir kez çizilir. Oynatma
+# sırasında sadece hazır PhotoImage değiştirilir; çizim maliyeti kadranın
+# karmaşıklığından bağımsızdır. Sayısal değer yazısı kadrana dahil değildir
+# (tuval üzerinde ayrı bir metin öğesi olarak güncellenir).
+
+
+class GaugeAtlas:
+    # render_face(ax): sabit kısımlar; render_moving(ax, value) -> değişen artist listesi
+    def __init__(self, name, lo, hi, step, render_face, render_moving, size=TILE_SIZE, wrap=False):
+        self.name = name
+        self.lo, self.hi, self.step = lo, hi, step
+        self.wrap = wrap
+        self.size = size
+        self.count = int(round((hi - lo) / step)) + (0 if wrap else 1)
+        self.render_moving = render_moving
+        self.images = {}       # indeks -> PhotoImage
+        self.rgb = {}          # indeks -> (size, size, 3) uint8
+
+        dpi = 100
+        self.fig = Figure(figsize=(size / dpi, size / dpi), dpi=dpi, facecolor=BG_COLOR)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.fig.add_axes([0, 0, 1, 1])
+        ax.set_xlim(0, size)
+        ax.set_ylim(size, 0)   # Tk tuvali gibi: y aşağı doğru
+        ax.set_aspect('equal')
+        ax.axis('off')
+        self.ax = ax
+        render_face(ax, size)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def index(self, value):
+        if value is None or not np.isfinite(value): value = self.lo
+        k = int(round((value - self.lo) / self.step))
+        if self.wrap:
+            return k % self.count
+        return min(max(k, 0), self.count - 1)
+
+    def value_of(self, k):
+        return self.lo + k * self.step
+
+    def render(self, k):
+        # Yüz önbellekten geri yüklenir, sadece hareketli kısımlar çizilir
+        if k in self.rgb: return self.rgb[k]
+        self.canvas.restore_region(self.background)
+        for artist in self.render_moving(self.ax, self.value_of(k), self.size):
+            self.ax.draw_artist(artist)
+            artist.remove()
+        rgb = np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+        self.rgb[k] = rgb
+        return rgb
+
+    def photo(self, value, master=None):
+        import tkinter as tk
+        k = self.index(value)
+        img = self.images.get(k)
+        if img is None:
+            rgb = self.render(k)
+            header = f"P6 {rgb.shape[1]} {rgb.shape[0]} 255 ".encode()
+            img = tk.PhotoImage(master=master, data=header + rgb.tobytes(), format='PPM')
+            self.images[k] = img
+            self.rgb.pop(k, None)   # Tk kendi kopyasını tutuyor
+        return img
+
+    def prerender(self, root, batch=PRERENDER_BATCH, done=None):
+        # Pencereyi kilitlemeden, boşta kalınan turlarda tüm kareleri hazırla
+        todo = [k for k in range(self.count) if k not in self.images]
+        def work():
+            for k in todo[:batch]:
+                self.photo(self.value_of(k), root)
+            del todo[:batch]
+            if todo: root.after_idle(work)
+            elif done: done(self)
+        if todo: root.after_idle(work)
+
+    def sheet(self, cols=20):
+        # Tüm kareler tek görüntüde (dışa aktarma / kontrol için)
+        rows = -(-self.count // cols)
+        out = np.zeros((rows * self.size, cols * self.size, 3), dtype=np.uint8)
+        for k in range(self.count):
+            r, c = divmod(k, cols)
+            out[r * self.size:(r + 1) * self.size, c * self.size:(c + 1) * self.size] = self.render(k)
+            self.rgb.pop(k, None)
+        return out
+
+
+# ---------------------------------------------------------
+# KADRANLAR
+# ---------------------------------------------------------
+def _polar(cx, cy, r, deg):
+    rad = math.radians(deg)
+    return cx + r * math.cos(rad), cy + r * math.sin(rad)
+
+def _bezel(ax, size):
+    c = size / 2
+    ax.add_patch(Circle((c, c), c - 10, facecolor=FACE_COLOR, edgecolor=BEZEL_COLOR, linewidth=2.5))
+
+def _ticks(ax, cx, cy, angles, r_out, lengths, color='white', width=1.0):
+    segs = [[_polar(cx, cy, r_out - ln, a), _polar(cx, cy, r_out, a)] for a, ln in zip(angles, lengths)]
+    lc = LineCollection(segs, colors=color, linewidths=width)
+    ax.add_collection(lc)
+    return lc
+
+def _needle(ax, cx, cy, r, deg, color, width):
+    x, y = _polar(cx, cy, r, deg)
+    return ax.annotate('', xy=(x, y), xytext=(cx, cy),
+                       arrowprops=dict(arrowstyle='-|>', color=color, lw=width, mutation_scale=15))
+
+def airspeed_face(ax, size):
+    c = size / 2
+    _bezel(ax, size)
+    speeds = np.arange(0, AIRSPEED_MAX + 1, 20)
+    angles = 135 + speeds / AIRSPEED_MAX * 270
+    _ticks(ax, c, c, angles, c - 14, [14 if s % 100 == 0 else 7 for s in speeds])
+    for s in range(0, int(AIRSPEED_MAX) + 1, 100):
+        x, y = _polar(c, c, c - 40, 135 + s / AIRSPEED_MAX * 270)
+        ax.text(x, y, str(s), color='white', fontsize=8, ha='center', va='center')
+    ax.text(c, c + 75, "KTS", color='#00ff00', fontsize=8, ha='center', va='center')
+
+def airspeed_needle(ax, speed, size):
+    c = size / 2
+    hub = Circle((c, c), 5, facecolor='red', edgecolor='red')
+    ax.add_patch(hub)
+    return [_needle(ax, c, c, 80, 135 + speed / AIRSPEED_MAX * 270, 'red', 3), hub]
+
+def heading_face(ax, size):
+    c = size / 2
+    _bezel(ax, size)
+    ax.text(c, c - 20, "▲", color='yellow', fontsize=16, ha='center', va='center')
+
+def heading_card(ax, heading, size):
+    # Pusula kartı başa göre döner (orijinal: N kırmızı ibre, E/S/W yazıları)
+    c = size / 2
+    degs = np.arange(0, 360, 5)
+    angles = degs - heading - 90
+    artists = [_ticks(ax, c, c, angles, c - 14, [12 if d % 30 == 0 else 6 for d in degs], color='#aaaaaa')]
+    for d in range(30, 360, 30):
+        if d % 90 == 0: continue
+        x, y = _polar(c, c, c - 36, d - heading - 90)
+        artists.append(ax.text(x, y, str(d // 10), color='#aaaaaa', fontsize=7, ha='center', va='center'))
+    for label, d in [("E", 90), ("S", 180), ("W", 270)]:
+        x, y = _polar(c, c, 70, d - heading - 90)
+        artists.append(ax.text(x, y, label, color='white', fontsize=10, ha='center', va='center'))
+    artists.append(_needle(ax, c, c, 80, -heading - 90, 'red', 2.5))
+    x, y = _polar(c, c, 80, -heading - 90)
+    artists.append(ax.text(x, y, "N", color='red', fontsize=11, fontweight='bold', ha='center', va='center'))
+    return artists
+
+def vsi_face(ax, size):
+    c = size / 2
+    _bezel(ax, size)
+    vals = np.arange(-VSI_MAX, VSI_MAX + 0.1, 2.5)
+    angles = 180 - vals / VSI_MAX * 90
+    _ticks(ax, c, c, angles, c - 14, [14 if v % 10 == 0 else 7 for v in vals])
+    for v in (-10, 10):
+        x, y = _polar(c, c, c - 40, 180 - v / VSI_MAX * 90)
+        ax.text(x, y, str(abs(v)), color='white', fontsize=8, ha='center', va='center')
+    ax.plot([30, 50], [c, c], color='gray', linewidth=2)
+    ax.text(c, c + 75, "KTS UP", color='#00ff00', fontsize=8, ha='center', va='center')
+
+def vsi_needle(ax, vz, size):
+    c = size / 2
+    val = max(min(vz, VSI_MAX), -VSI_MAX)
+    return [_needle(ax, c, c, 80, 180 - val / VSI_MAX * 90, 'white', 3)]
+
+
+def airspeed_atlas(size=TILE_SIZE, step=AIRSPEED_STEP):
+    return GaugeAtlas("airspeed", 0.0, AIRSPEED_MAX, step, airspeed_face, airspeed_needle, size)
+
+def heading_atlas(size=TILE_SIZE, step=HEADING_STEP):
+    return GaugeAtlas("heading", 0.0, 360.0, step, heading_face, heading_card, size, wrap=True)
+
+def vsi_atlas(size=TILE_SIZE, step=VSI_STEP):
+    return GaugeAtlas("vsi", -VSI_MAX, VSI_MAX, step, vsi_face, vsi_needle, size)
+
+ATLASES = {"airspeed": airspeed_atlas, "heading": heading_atlas, "vsi": vsi_atlas}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kadran karelerini (atlas) dışa aktar")
+    parser.add_argument("--out", default="gauge_atlas", help="Çıktı klasörü")
+    parser.add_argument("--size", type=int, default=TILE_SIZE)
+    args = parser.parse_args(argv)
+
+    import time
+    from matplotlib.image import imsave
+    os.makedirs(args.out, exist_ok=True)
+    for name, make in ATLASES.items():
+        t = time.perf_counter()
+        atlas = make(args.size)
+        img = atlas.sheet()
+        path = os.path.join(args.out, f"{name}.png")
+        imsave(path, img)
+        print(f"{path}: {atlas.count} kare, {(time.perf_counter() - t) * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    sys.exit(main())
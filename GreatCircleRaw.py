@@ -2,9 +2,10 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from SharedDataset import load_frame
 
 # 1. VERİ YÜKLEME
-df = pd.read_csv('DetailToAnalyse.csv')
+df, shared = load_frame('DetailToAnalyse.csv')   # SharedDataset.py ile paylaşıldıysa kopyasız bağlanır
 df.columns = [col.strip().replace('"', '') for col in df.columns]
 
 # Analiz edilecek genişletilmiş liste (10 Sütun)
@@ -0,0 +1,86 @@
+import csv
+import pandas as pd
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+DEFAULT_DELIMITER = ','
+
+
+def dedupe_columns(cols):
+    # Tekrarlanan sütun isimleri: c, c_1, c_2 ...
+    seen = {}
+    deduped = []
+    for c in cols:
+        if c in seen:
+            seen[c] += 1
+            deduped.append(f"{c}_{seen[c]}")
+        else:
+            seen[c] = 0
+            deduped.append(c)
+    return deduped
+
+
+class CsvHeader:
+    # Başlık satırının çözümlenmiş hali. Kayıtlarda iki biçim görülüyor:
+    #   "TimeMarker","Id",...           (alan bazında tırnak)
+    #   "TimeMarker,""Id"",..."         (tüm satır tek alan olarak tırnaklı)
+    def __init__(self, path, raw_columns, delimiter, quoted, line_quoted):
+        self.path = path
+        self.delimiter = delimiter
+        self.quoted = quoted
+        self.line_quoted = line_quoted
+        self.raw_columns = raw_columns
+        self.columns = dedupe_columns(raw_columns)
+        self.duplicates = sorted({c for c in raw_columns if raw_columns.count(c) > 1})
+
+    def projection(self, wanted):
+        # İstenen sütunların dosyadaki sıra numaraları (olmayanlar atlanır)
+        # wanted=None -> tüm sütunlar
+        if wanted is None:
+            return list(range(len(self.columns))), list(self.columns)
+        pos = {c: i for i, c in enumerate(self.columns)}
+        indices = sorted(pos[c] for c in dict.fromkeys(wanted) if c in pos)
+        return indices, [self.columns[i] for i in indices]
+
+    def missing(self, wanted):
+        return [c for c in wanted if c not in self.columns]
+
+
+def sniff_header(path, delimiter=DEFAULT_DELIMITER):
+    with open(path, 'r', encoding='utf-8-sig', errors='replace', newline='') as f:
+        line = f.readline().rstrip('\r\n')
+
+    quoted = '"' in line
+    fields = next(csv.reader([line], delimiter=delimiter), [])
+    line_quoted = False
+    # Tüm satır tek tırnaklı alan ise içini bir kez daha çözümle
+    if len(fields) == 1 and delimiter in fields[0]:
+        line_quoted = True
+        fields = next(csv.reader([fields[0]], delimiter=delimiter), [])
+
+    cols = [c.replace('"', '').strip() for c in fields]
+    return CsvHeader(path, cols, delimiter, quoted, line_quoted)
+
+
+def read_recording(path, columns=None, header=None, **kwargs):
+    # Gövde tek seferde ve sadece gereken sütunlarla okunur.
+    # columns=None -> tüm sütunlar (tekrar edenler c_1, c_2 olarak)
+    header = header or sniff_header(path)
+    indices, names = header.projection(columns)
+    df = pd.read_csv(path, header=None, skiprows=1, usecols=indices,
+                     sep=header.delimiter, **kwargs)
+    df.columns = names
+    return df
+
+
+def iter_recording(path, columns=None, chunksize=100000, header=None, **kwargs):
+    # Büyük kayıtlar için parça parça okuma (sabit bellek)
+    header = header or sniff_header(path)
+    indices, names = header.projection(columns)
+    reader = pd.read_csv(path, header=None, skiprows=1, usecols=indices,
+                         sep=header.delimiter, chunksize=chunksize, **kwargs)
+    with reader:
+        for df in reader:
+            df.columns = names
+            yield df
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+DT = 1.0 / SAMPLE_RATE
+ATT_RATE_NOISE = 0.5      # deg/s   (RollRate/PitchRate/YawRate gürültüsü)
+ATT_MEAS_NOISE = 0.5      # deg     (RollAngle/PitchAngle ölçüm gürültüsü)
+ALT_RATE_NOISE = 1.0      # ft/s    (VelocityZ gürültüsü)
+ALT_MEAS_NOISE = 5.0      # ft      (BlendedEllipsoidHeight gürültüsü)
+VZ_SIGN = 1.0             # VelocityZ yukarı pozitif; aşağı pozitif kayıtlarda -1
+BLOCK = 256               # Vektörel çözümde blok boyu
+
+# Model: x_k = x_{k-1} + hız_k * dt (hız sensörü girdi), z_k = x_k + gürültü.
+# Sabit gürültülerde Kalman kazancı hızla sabitlenir (durağan kazanç), filtre
+#   x_k = (1-K) * (x_{k-1} + hız_k * dt) + K * z_k
+# tamamlayıcı (complementary) filtreye indirgenir. Hız girdisi sayesinde
+# manevralarda gecikme olmaz; merkezli hareketli ortalamanın aksine gelecekteki
+# örneklere de ihtiyaç duymaz (canlı veride aynı sonuç).
+
+
+def steady_gain(rate_noise, meas_noise, dt=DT):
+    # Skaler Riccati denkleminin durağan çözümü (sadece Q/R oranına bağlı)
+    q = (rate_noise * dt) ** 2
+    r = meas_noise ** 2
+    if r == 0: return 1.0
+    if q == 0: return 0.0
+    p = (q + np.sqrt(q * q + 4 * q * r)) / 2.0   # tahmin (a priori) varyansı
+    return p / (p + r)
+
+def solve_recurrence(a, b, y0=0.0, block=BLOCK):
+    # y_k = a * y_{k-1} + b_k  (y_{-1} = y0), döngüsüz.
+    # Blok içinde: y_j = a^j * cumsum(b_i / a^i) ; bloklar arası taşınan değer
+    # aynı denklemin a^L ile küçültülmüş hali (özyinelemeli).
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    if n == 0: return b.copy()
+    if a == 0: return b.copy()
+    # a^-L taşmasın (a küçükse blok kısalır)
+    if a < 1.0:
+        block = max(1, min(block, int(np.log(1e-100) / np.log(a))))
+    nb = -(-n // block)
+    pad = np.zeros(nb * block)
+    pad[:n] = b
+    B = pad.reshape(nb, block)
+
+    j = np.arange(block)
+    up = a ** (-j.astype(np.float64))
+    down = a ** j.astype(np.float64)
+    part = np.cumsum(B * up, axis=1) * down      # blok başında y = 0 varsayımıyla
+
+    # Her bloğun son değeri: c_k = a^L * c_{k-1} + part[k, -1]
+    aL = a ** block
+    if nb > 1 and aL > 1e-18:
+        carry = solve_recurrence(aL, part[:, -1], y0, block)
+    else:
+        carry = part[:, -1]     # tek blok veya önceki bloğun etkisi float hassasiyetinin altında
+    prev = np.concatenate(([y0], carry[:-1]))
+    y = part + prev[:, None] * (a * down)
+    return y.ravel()[:n]
+
+def _fill(x):
+    s = pd.Series(np.asarray(x, dtype=np.float64))
+    return s.ffill().bfill().fillna(0).values
+
+def _wrap(x, period, centered):
+    # centered: [-period/2, period/2) (yatış/yunuslama), değilse [0, period) (yön)
+    return np.mod(x + period / 2, period) - period / 2 if centered else np.mod(x, period)
+
+def fuse(measured, rate, dt=DT, rate_noise=ATT_RATE_NOISE, meas_noise=ATT_MEAS_NOISE,
+         rate_scale=1.0, period=None, centered=False):
+    # measured: açı/irtifa, rate: aynı birimde /sn. period: açı sarması (ör. 2 -> 360° normalize)
+    z = _fill(measured)
+    w = _fill(rate) * rate_scale
+    if len(z) == 0: return z
+    if period is not None:
+        z = np.unwrap(z, period=period)
+    k = steady_gain(rate_noise, meas_noise, dt)
+    a = 1.0 - k
+    b = a * w[1:] * dt + k * z[1:]
+    out = np.empty_like(z)
+    out[0] = z[0]
+    out[1:] = solve_recurrence(a, b, z[0])
+    if period is not None:
+        out = _wrap(out, period, centered)
+    return out
+
+
+class StreamingFuser:
+    # Canlı veri için örnek örnek aynı filtre (fuse() ile birebir aynı çıktı)
+    #   f = StreamingFuser(); x = f.step(z, rate)
+    def __init__(self, dt=DT, rate_noise=ATT_RATE_NOISE, meas_noise=ATT_MEAS_NOISE,
+                 rate_scale=1.0, period=None, centered=False):
+        self.dt = dt
+        self.k = steady_gain(rate_noise, meas_noise, dt)
+        self.rate_scale = rate_scale
+        self.period = period
+        self.centered = centered
+        self.x = None
+        self.last_z = None
+
+    def step(self, z, rate):
+        if z is None or np.isnan(z): z = self.last_z
+        if rate is None or np.isnan(rate): rate = 0.0
+        if z is None: return np.nan
+        if self.period is not None and self.last_z is not None:
+            # Sarma: bir önceki ölçüme en yakın tur (np.unwrap ile aynı)
+            p = self.period
+            z = self.last_z + (z - self.last_z + p / 2) % p - p / 2
+        if self.x is None:
+            self.x = z
+        else:
+            pred = self.x + rate * self.rate_scale * self.dt
+            self.x = (1.0 - self.k) * pred + self.k * z
+        self.last_z = z
+        return _wrap(self.x, self.period, self.centered) if self.period is not None else self.x
+
+
+# ---------------------------------------------------------
+# KANALLAR (DerivedCache.channel ile kullanılabilir)
+# ---------------------------------------------------------
+def fused_attitude(angle, rate, dt=DT, rate_noise=ATT_RATE_NOISE, meas_noise=ATT_MEAS_NOISE,
+                   period=2.0):
+    # RollAngle+RollRate, PitchAngle+PitchRate (aynı ölçek). Açılar 0..360° sarmalı gelir
+    # (-10° yatış = 1.944); süzgeç sarmayı açarak çalışır, çıkış ±period/2 (±180°).
+    # period=2.0 normalize, derece için 360
+    return fuse(angle, rate, dt, rate_noise, meas_noise, period=period, centered=True)
+
+def fused_heading(heading, yaw_rate, dt=DT, rate_noise=ATT_RATE_NOISE, meas_noise=ATT_MEAS_NOISE,
+                  period=2.0):
+    # PlatformAzimuth+YawRate; period=2.0 normalize (360 derece) için
+    return fuse(heading, yaw_rate, dt, rate_noise, meas_noise, period=period)
+
+def fused_altitude(height, vz, dt=DT, rate_noise=ALT_RATE_NOISE, meas_noise=ALT_MEAS_NOISE,
+                   vz_sign=VZ_SIGN):
+    # BlendedEllipsoidHeight + VelocityZ
+    return fuse(height, vz, dt, rate_noise, meas_noise, rate_scale=vz_sign)
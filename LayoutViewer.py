@@ -0,0 +1,300 @@
+import os
+import sys
+import json
+import glob
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+from DerivedCache import DerivedCache, rolling_mean
+from Derivatives import savgol_rate
+from SharedDataset import load_frame
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+FILE_NAME = 'DetailToAnalyse.csv'
+LAYOUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'layouts')
+DEFAULT_LAYOUT = 'raw'
+FIXED_DT = 0.05               # 20 Hz
+FIGSIZE_PER_ROW = 3.0         # inç; satır sayısına göre pencere yüksekliği
+
+# Birim çarpanları (panelde "unit" ile seçilir)
+UNITS = {
+    "raw": 1.0,
+    "rad2deg": 180.0 / np.pi,     # Radyan şüphesi olan açılar
+    "norm2deg": 180.0,            # Normalize (-1..1) -> Derece
+    "fps2kt": 0.592484,           # ft/s -> knot
+}
+
+# Yerleşim dosyası (layouts/<isim>.json):
+#   {"title": ..., "grid": [satır, sütun], "window": 150, "step": 10, "interval": 200,
+#    "margin": 0.1, "min_margin": 1.0,
+#    "channels": {"isim": kanal, ...},        # tekrar kullanılan tanımlar (isteğe bağlı)
+#    "panels": [{"title": ..., "color": ..., "ylabel": ..., <kanal alanları> veya "ref": isim}, ...]}
+# Kanal: ham sütun adı (metin), "channels" içindeki bir isim, veya sözlük:
+#   {"channel": "PitchAngle"} ya da {"op": "sub"|"add"|"hypot"|"absdelta", "inputs": [kanal, ...]}
+#   + isteğe bağlı "unit", "scale", "smooth" (pencere), "rate" (Savitzky-Golay penceresi, tek sayı)
+# Sadece aktif yerleşimin kullandığı ham sütunlar okunur; hesaplanan kanallar
+# DerivedCache üzerinden saklanır ve yerleşim değiştirince yeniden kullanılır.
+SPEC_KEYS = ("channel", "op", "inputs", "unit", "scale", "smooth", "rate")
+
+
+def _op(op, *inputs):
+    if op == "sub":
+        return inputs[0] - sum(inputs[1:])
+    if op == "add":
+        return sum(inputs)
+    if op == "hypot":
+        return np.hypot(*inputs)
+    if op == "absdelta":
+        return np.abs(np.diff(inputs[0], prepend=np.nan))
+    raise ValueError(f"Bilinmeyen işlem: {op}")
+
+def evaluate_channel(*inputs, op=None, scale=1.0, smooth=0, rate=0):
+    # Sıra: işlem -> birim -> yumuşatma -> değişim hızı (eski betiklerle aynı)
+    x = _op(op, *inputs) if op else inputs[0]
+    x = np.asarray(x, dtype=np.float64) * scale
+    if smooth:
+        x = rolling_mean(x, smooth)
+    if rate:
+        x = savgol_rate(x, FIXED_DT, rate)
+    return x
+
+
+def list_layouts(layout_dir=LAYOUT_DIR):
+    return sorted(os.path.splitext(os.path.basename(p))[0]
+                  for p in glob.glob(os.path.join(layout_dir, '*.json')))
+
+def read_layout(name, layout_dir=LAYOUT_DIR):
+    path = name if name.endswith('.json') else os.path.join(layout_dir, name + '.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        layout = json.load(f)
+    layout.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    layout.setdefault("title", layout["name"])
+    rows, cols = layout.setdefault("grid", [len(layout["panels"]), 1])
+    if len(layout["panels"]) > rows * cols:
+        raise ValueError(f"{path}: {len(layout['panels'])} panel {rows}x{cols} ızgaraya sığmıyor")
+    return layout
+
+
+class ChannelStore:
+    # Bir kayıt için ham sütunlar ve hesaplanan kanallar. Ham sütunlar ilk
+    # istendiklerinde okunur; kanallar içerik anahtarıyla saklanır.
+    def __init__(self, path, disk_cache=True):
+        self.path = path
+        self.cache = DerivedCache(path) if disk_cache else None
+        self.raw = {}          # sütun -> dizi
+        self.values = {}       # kanal anahtarı -> dizi
+        self.keys = {}         # ham sütun / kanal adı -> DerivedCache adı
+        self.shared = []       # paylaşılan bellek bağlantıları (görünümler yaşadıkça tutulur)
+        self.n_rows = 0
+
+    def resolve(self, spec, named=None):
+        # Metin referanslarını açıp kanonik sözlüğe çevirir
+        named = named or {}
+        if isinstance(spec, str):
+            if spec in named:
+                return self.resolve(named[spec], named)
+            return {"channel": spec}
+        out = {k: spec[k] for k in SPEC_KEYS if k in spec}
+        if "inputs" in out:
+            out["inputs"] = [self.resolve(s, named) for s in out["inputs"]]
+        return out
+
+    def columns(self, spec):
+        if "inputs" in spec:
+            return {c for s in spec["inputs"] for c in self.columns(s)}
+        return {spec["channel"]}
+
+    def load_columns(self, columns):
+        missing = [c for c in columns if c not in self.raw]
+        if not missing:
+            return []
+        df, ds = load_frame(self.path, columns=missing)
+        if ds is not None:
+            self.shared.append(ds)
+        df.columns = [col.strip().replace('"', '') for col in df.columns]
+        for c in missing:
+            if c not in df.columns:
+                raise KeyError(f"{self.path}: '{c}' sütunu yok")
+            self.raw[c] = pd.to_numeric(df[c], errors='coerce').values.astype(np.float64)
+            self.n_rows = len(self.raw[c])
+            if self.cache is not None:
+                self.cache.source(c, self.raw[c])
+                self.keys[c] = c
+        return missing
+
+    def channel(self, spec):
+        key = json.dumps(spec, sort_keys=True)
+        if key in self.values:
+            return self.values[key]
+        if "inputs" in spec:
+            inputs = [self.channel(s) for s in spec["inputs"]]
+            names = [self.keys[json.dumps(s, sort_keys=True)] for s in spec["inputs"]]
+        else:
+            self.load_columns([spec["channel"]])
+            inputs = [self.raw[spec["channel"]]]
+            names = [spec["channel"]]
+        params = {"op": spec.get("op"),
+                  "scale": float(spec.get("scale", UNITS[spec.get("unit", "raw")])),
+                  "smooth": int(spec.get("smooth", 0)), "rate": int(spec.get("rate", 0))}
+
+        if params == {"op": None, "scale": 1.0, "smooth": 0, "rate": 0}:
+            values = inputs[0]                      # ham sütun, kopya yok
+            self.keys[key] = names[0]
+        elif self.cache is not None:
+            name = "lv_" + hashlib.sha1(key.encode()).hexdigest()[:16]
+            values = self.cache.channel(name, names, params, evaluate_channel)
+            self.keys[key] = name
+        else:
+            values = evaluate_channel(*inputs, **params)
+            self.keys[key] = key
+        self.values[key] = values
+        return values
+
+    def panel_spec(self, panel, named):
+        return self.resolve(panel["ref"] if "ref" in panel else panel, named)
+
+    def panels(self, layout):
+        # Yerleşimdeki her panelin dizisi (eksikler ffill + 0, eski betiklerdeki gibi)
+        named = layout.get("channels", {})
+        specs = [self.panel_spec(p, named) for p in layout["panels"]]
+        # Eksik ham sütunlar tek okumada gelir
+        self.load_columns(sorted({c for s in specs for c in self.columns(s)}))
+        out = []
+        for spec in specs:
+            v = self.channel(spec)
+            out.append(pd.Series(v).ffill().fillna(0).values)
+        return out
+
+    def summary(self):
+        s = f"{len(self.raw)} ham sütun, {len(self.values)} kanal"
+        if self.cache is not None:
+            s += f" (diskten {len(self.cache.loaded)}, yeni hesaplanan {len(self.cache.rebuilt)})"
+        return s
+
+
+# ---------------------------------------------------------
+# GÖRÜNTÜLEYİCİ
+# ---------------------------------------------------------
+class LayoutViewer:
+    # Tek pencere; n/p veya 1-9 ile yerleşim değişir, kayıt konumu korunur. Boşluk: duraklat
+    def __init__(self, store, layouts, layout_dir=LAYOUT_DIR):
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        self.plt = plt
+        self.store = store
+        self.names = layouts
+        self.layout_dir = layout_dir
+        self.current = 0
+        self.pos = 0
+        self.paused = False
+        self.fig = plt.figure(figsize=(16, 12))
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        self.show_layout(0)
+        self.ani = FuncAnimation(self.fig, self.update, frames=self.frames(),
+                                 interval=self.layout.get("interval", 200), blit=False,
+                                 cache_frame_data=False, repeat=False)
+
+    def show_layout(self, i):
+        self.current = i % len(self.names)
+        self.layout = read_layout(self.names[self.current], self.layout_dir)
+        self.data = self.store.panels(self.layout)
+        print(f"[{self.layout['name']}] {self.store.summary()}")
+
+        rows, cols = self.layout["grid"]
+        self.fig.clf()
+        self.fig.set_size_inches(16, max(6, FIGSIZE_PER_ROW * rows), forward=True)
+        self.fig.suptitle(f"{self.layout['title']}  ({self.current + 1}/{len(self.names)}: n/p ile değiştir)",
+                          fontsize=14)
+        axes = self.fig.subplots(rows, cols, squeeze=False).flatten()
+        self.axes, self.lines = axes, []
+        window = self.layout.get("window", 150)
+        for ax, panel in zip(axes, self.layout["panels"]):
+            title = panel.get("title") or panel.get("channel") or panel.get("ref", "")
+            line, = ax.plot([], [], label=title, color=panel.get("color", '#1f77b4'),
+                            lw=panel.get("lw", 1.5))
+            ax.set_title(title)
+            ax.grid(True, alpha=0.3)
+            if "ylabel" in panel:
+                ax.set_ylabel(panel["ylabel"])
+            ax.set_xlim(0, window)
+            self.lines.append(line)
+        for ax in axes[len(self.layout["panels"]):]:
+            ax.set_visible(False)
+        self.fig.tight_layout(rect=[0, 0.02, 1, 0.96])
+        if hasattr(self, 'ani'):
+            self.ani.event_source.interval = self.layout.get("interval", 200)
+        self.fig.canvas.draw_idle()
+
+    def frames(self):
+        while self.pos < self.store.n_rows:
+            if not self.paused:
+                self.pos += self.layout.get("step", 10)
+            yield self.pos
+
+    def update(self, frame):
+        window = self.layout.get("window", 150)
+        margin = self.layout.get("margin", 0.1)
+        start, end = max(0, frame - window), frame
+        for i, (panel, y) in enumerate(zip(self.layout["panels"], self.data)):
+            y_data = y[start:end]
+            if len(y_data) == 0:
+                continue
+            self.lines[i].set_data(np.arange(len(y_data)), y_data)
+            ok = y_data[np.isfinite(y_data)]      # türev kanallarının kenarları NaN
+            if len(ok) == 0:
+                continue
+            y_min, y_max = ok.min(), ok.max()
+            pad = max((y_max - y_min) * panel.get("margin", margin),
+                      panel.get("min_margin", self.layout.get("min_margin", 0.5)))
+            self.axes[i].set_ylim(y_min - pad, y_max + pad)
+        return self.lines
+
+    def on_key(self, event):
+        if event.key in ('n', 'right'):
+            self.show_layout(self.current + 1)
+        elif event.key in ('p', 'left'):
+            self.show_layout(self.current - 1)
+        elif event.key and event.key.isdigit() and 0 < int(event.key) <= len(self.names):
+            self.show_layout(int(event.key) - 1)
+        elif event.key == ' ':
+            self.paused = not self.paused
+
+    def run(self):
+        self.plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerleşim dosyalarıyla çalışan kanal/panel görüntüleyici")
+    parser.add_argument("layouts", nargs="*", help=f"Yerleşim isimleri veya .json yolları "
+                                                   f"(varsayılan: {LAYOUT_DIR} içindekilerin hepsi)")
+    parser.add_argument("-f", "--file", default=FILE_NAME, help="Kayıt (.csv / .nrec)")
+    parser.add_argument("--layout-dir", default=LAYOUT_DIR)
+    parser.add_argument("--list", action="store_true", help="Yerleşimleri ve kullandıkları sütunları listele")
+    parser.add_argument("--no-disk-cache", action="store_true", help="Kanalları diske yazma")
+    args = parser.parse_args(argv)
+
+    names = args.layouts or list_layouts(args.layout_dir)
+    if not names:
+        parser.error(f"{args.layout_dir} içinde yerleşim yok")
+    if DEFAULT_LAYOUT in names and not args.layouts:
+        names.insert(0, names.pop(names.index(DEFAULT_LAYOUT)))
+    store = ChannelStore(args.file, disk_cache=not args.no_disk_cache)
+
+    if args.list:
+        for name in names:
+            layout = read_layout(name, args.layout_dir)
+            named = layout.get("channels", {})
+            cols = set()
+            for p in layout["panels"]:
+                cols |= store.columns(store.panel_spec(p, named))
+            print(f"{layout['name']:<16} {layout['grid'][0]}x{layout['grid'][1]}  {layout['title']}")
+            print(f"{'':<16} {', '.join(sorted(cols))}")
+        return 0
+
+    LayoutViewer(store, names, args.layout_dir).run()
+
+if __name__ == "__main__":
+    sys.exit(main())
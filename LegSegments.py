@@ -0,0 +1,165 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from BinaryRecording import load_recording
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+LEGS_SUFFIX = '.legs.npz'
+LEGS_VERSION = 2              # Bacak tanımı değişince eski yan dosyalar yeniden üretilir
+SAMPLE_RATE = 20
+ANGLE_SCALE = 180.0           # Normalize -> Derece
+DIST_UNIT_NM = 0.1            # DistanceToSteerpoint birimi (0.1 nm)
+JUMP_DIST = 20                # Kalan mesafe bu kadar artarsa yeni steerpoint (2 nm)
+JUMP_TIME = 30                # ... veya kalan süre bu kadar artarsa (sn)
+MIN_LEG_S = 10.0              # Daha kısa bacaklar bir öncekine katılır (seçici oynaması)
+ARRIVE_NM = 1.0               # Bacak sonunda kalan mesafe bundan azsa noktaya varılmış sayılır
+LEG_COLS = ["TimeMarker", "DistanceToSteerpoint", "TimeToSteerpoint",
+            "GreatCircleSteeringError", "ComputedCourseDeviation", "TrueAirSpeed"]
+
+# Kalan mesafe/süre bir bacak boyunca azalır; yeni steerpoint seçildiğinde sıçrar.
+# Sıçramalar tek diff ile bulunur, bacak istatistikleri reduceat/bincount ile
+# tek geçişte hesaplanır. Sonuç küçük bir tablo olarak kaydın yanına yazılır
+# (<kayıt>.legs.npz); pano ve raporlar ham örneklere dokunmadan sorgular.
+
+
+def _num(df, col):
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[col], errors='coerce').values.astype(np.float64)
+
+def leg_starts(dist, tts=None, jump_dist=JUMP_DIST, jump_time=JUMP_TIME,
+               min_len=int(MIN_LEG_S * SAMPLE_RATE)):
+    # -> bacak başlangıç satırları (ilk eleman 0)
+    n = len(dist)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    d = pd.Series(dist).ffill().values
+    jump = np.diff(d) > jump_dist
+    if tts is not None:
+        jump |= np.diff(pd.Series(tts).ffill().values) > jump_time
+    starts = np.concatenate(([0], np.flatnonzero(jump) + 1))
+    if len(starts) > 1 and min_len > 1:
+        # Kısa bacak bir öncekine katılır: kısa parçanın başlangıcı düşer, ardından gelen
+        # gerçek bacağın başlangıcı kalır (seçici oynaması sonraki bacağı yutmaz).
+        # Kaydın başındaki kısa parça (öncesi yok) ayrı bacak olarak kalır.
+        keep = [0]
+        for s in list(starts[1:]) + [n]:
+            if s - keep[-1] < min_len and keep[-1] != 0:
+                keep.pop()
+            if s < n:
+                keep.append(s)
+        starts = np.asarray(keep, dtype=np.int64)
+    return starts
+
+
+def leg_table(df):
+    # -> bacak başına bir satırlık DataFrame
+    n = len(df)
+    dist = _num(df, "DistanceToSteerpoint")
+    tts = _num(df, "TimeToSteerpoint")
+    starts = leg_starts(dist, tts)
+    if n == 0:
+        return pd.DataFrame(columns=["leg", "start_row", "end_row"])
+    ends = np.concatenate((starts[1:], [n]))
+    ids = np.repeat(np.arange(len(starts)), ends - starts)
+    counts = np.bincount(ids).astype(np.float64)
+
+    def mean(x):
+        # Sadece geçerli (NaN olmayan) örneklerin ortalaması
+        ok = np.isfinite(x)
+        s = np.bincount(ids, np.where(ok, x, 0.0), minlength=len(starts))
+        c = np.bincount(ids, ok, minlength=len(starts))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return s / c
+
+    def mean_abs(x):
+        return mean(np.abs(x))
+
+    def max_abs(x):
+        # reduceat NaN yaymasın: NaN -> -inf (tamamı NaN olan bacak sonra NaN yapılır)
+        return np.maximum.reduceat(np.nan_to_num(np.abs(x), nan=-np.inf), starts)
+
+    steer = _num(df, "GreatCircleSteeringError") * ANGLE_SCALE
+    course = _num(df, "ComputedCourseDeviation") * ANGLE_SCALE
+    tas = _num(df, "TrueAirSpeed")
+
+    # ETA doğruluğu: her örnekte tahmin edilen kalan süre ile bacağın gerçek bitişine kalan süre
+    remaining = (ends[ids] - np.arange(n)) / SAMPLE_RATE
+    eta_err = tts - remaining
+    last = ends - 1
+    completed = dist[last] * DIST_UNIT_NM < ARRIVE_NM
+
+    times = df["TimeMarker"].astype(str).values if "TimeMarker" in df.columns else np.full(n, "")
+    out = pd.DataFrame({
+        "leg": np.arange(len(starts)),
+        "start_row": starts, "end_row": ends,
+        "start_time": times[starts], "end_time": times[last],
+        "duration_s": counts / SAMPLE_RATE,
+        "dist_start_nm": dist[starts] * DIST_UNIT_NM,
+        "dist_end_nm": dist[last] * DIST_UNIT_NM,
+        "completed": completed,
+        "steer_err_mean": mean_abs(steer), "steer_err_max": max_abs(steer),
+        "course_dev_mean": mean_abs(course), "course_dev_max": max_abs(course),
+        "tas_mean": mean(tas),
+        "eta_start_err_s": eta_err[starts],      # bacak başındaki tahmin - gerçek süre
+        "eta_err_mean_s": mean_abs(eta_err),
+    })
+    for c in ("steer_err_max", "course_dev_max"):
+        out.loc[np.isinf(out[c]), c] = np.nan
+    # Varılmayan bacaklarda (kayıt bitti / nokta değişti) ETA karşılaştırması anlamsız
+    out.loc[~completed, ["eta_start_err_s", "eta_err_mean_s"]] = np.nan
+    return out
+
+
+# ---------------------------------------------------------
+# KAYIT YANINDA SAKLAMA
+# ---------------------------------------------------------
+def load_legs(path, rebuild=False):
+    # Yan dosya kayıt boyutu/zamanı değişmediyse kullanılır (TimeWindow.TimeIndex gibi)
+    lpath = path + LEGS_SUFFIX
+    st = os.stat(path)
+    if not rebuild and os.path.exists(lpath):
+        z = np.load(lpath, allow_pickle=False)
+        if (int(z["_size"]) == st.st_size and float(z["_mtime"]) == st.st_mtime
+                and "_version" in z.files and int(z["_version"]) == LEGS_VERSION):
+            return pd.DataFrame({c: z[c] for c in z.files if not c.startswith("_")})
+    legs = leg_table(load_recording(path, columns=LEG_COLS))
+    tmp = lpath + '.tmp.npz'
+    arrays = {c: legs[c].to_numpy() if pd.api.types.is_numeric_dtype(legs[c]) or
+                 pd.api.types.is_bool_dtype(legs[c]) else legs[c].to_numpy().astype(str)
+              for c in legs.columns}
+    np.savez(tmp, _size=st.st_size, _mtime=st.st_mtime, _version=LEGS_VERSION, **arrays)
+    os.replace(tmp, lpath)
+    return legs
+
+def leg_at(legs, row):
+    # Satırın bulunduğu bacak (tablo satırı indeksi, yoksa -1)
+    if len(legs) == 0: return -1
+    return int(np.searchsorted(legs["start_row"].values, row, side='right') - 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Steerpoint bacaklarına bölme ve bacak istatistikleri")
+    parser.add_argument("recordings", nargs="+")
+    parser.add_argument("--rebuild", action="store_true", help="Yan dosyayı yeniden oluştur")
+    parser.add_argument("-o", "--output", help="Tüm bacaklar (CSV)")
+    args = parser.parse_args(argv)
+
+    tables = []
+    for path in args.recordings:
+        legs = load_legs(path, args.rebuild)
+        legs.insert(0, "recording", os.path.basename(path))
+        tables.append(legs)
+        print(f"{path}: {len(legs)} bacak, {int(legs['completed'].sum())} tamamlandı")
+    allegs = pd.concat(tables, ignore_index=True)
+    with pd.option_context('display.width', 220, 'display.max_columns', 30):
+        print(allegs.drop(columns=["start_row", "end_row"]).round(2))
+    if args.output:
+        allegs.to_csv(args.output, index=False, float_format='%.6g')
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import numpy as np
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+ANGLE_SCALE = 180.0       # Normalize -> Derece
+EARTH_RADIUS = 6371000.0  # m
+GRID_CELLS = 256          # Uzun kenar boyunca hücre sayısı
+VIEW_RADIUS = 5000.0      # Hareketli haritada uçağın çevresi (m)
+TILE_MARGIN = 2.0         # Çizilen parça görünümden bu kat geniş (az yeniden çizim)
+MAX_POINTS = 4000         # Bir parçada çizilecek en fazla nokta
+ZOOM_STEP = 1.25
+
+# İz bir kez yerel metrik koordinatlara (m) çevrilir ve hücre ızgarasına dizilir.
+# Hücre anahtarları sıralı tutulur; kutu ve en yakın nokta sorguları
+# searchsorted ile O(log n).
+
+
+def track_origin(lat, lon, scale=ANGLE_SCALE):
+    # İlk geçerli nokta (radyan)
+    lat = np.radians(np.asarray(lat, dtype=np.float64) * scale)
+    lon = np.radians(np.asarray(lon, dtype=np.float64) * scale)
+    ok = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+    return (lat[ok[0]], lon[ok[0]]) if len(ok) else (0.0, 0.0)
+
+def project_track(lat, lon, scale=ANGLE_SCALE, origin=None):
+    # Normalize enlem/boylam -> başlangıç noktasına göre doğu/kuzey (m)
+    lat0, lon0 = origin if origin is not None else track_origin(lat, lon, scale)
+    lat = np.radians(np.asarray(lat, dtype=np.float64) * scale)
+    lon = np.radians(np.asarray(lon, dtype=np.float64) * scale)
+    x = EARTH_RADIUS * (lon - lon0) * np.cos(lat0)
+    y = EARTH_RADIUS * (lat - lat0)
+    return x, y
+
+
+class GridIndex:
+    def __init__(self, x, y, cells=GRID_CELLS):
+        self.x, self.y = x, y
+        ok = np.isfinite(x) & np.isfinite(y)
+        if not ok.any():
+            self.x0 = self.y0 = 0.0
+            self.cell = 1.0
+        else:
+            self.x0, self.y0 = x[ok].min(), y[ok].min()
+            extent = max(x[ok].max() - self.x0, y[ok].max() - self.y0, 1.0)
+            self.cell = extent / cells
+        self.nx = cells + 1
+        self.ny = cells + 1
+
+        ix, iy = self._cell_of(x, y)
+        keys = np.where(ok, iy * self.nx + ix, np.iinfo(np.int64).max)
+        self.order = np.argsort(keys, kind='stable')   # hücre içinde zaman sırası korunur
+        self.keys = keys[self.order]
+        self.n_valid = int(ok.sum())
+
+    def _cell_of(self, x, y):
+        ix = np.clip(np.floor((np.nan_to_num(x) - self.x0) / self.cell), 0, self.nx - 1).astype(np.int64)
+        iy = np.clip(np.floor((np.nan_to_num(y) - self.y0) / self.cell), 0, self.ny - 1).astype(np.int64)
+        return ix, iy
+
+    def query_box(self, x0, x1, y0, y1):
+        # Kutuya değen hücrelerdeki örneklerin indeksleri (sıralı)
+        (ix0, ix1), (iy0, iy1) = self._cell_of(np.array([x0, x1]), np.array([y0, y1]))
+        rows = np.arange(iy0, iy1 + 1, dtype=np.int64) * self.nx
+        lo = np.searchsorted(self.keys, rows + ix0, side='left')
+        hi = np.searchsorted(self.keys, rows + ix1, side='right')
+        if not len(lo) or (hi - lo).sum() == 0:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate([self.order[a:b] for a, b in zip(lo, hi) if b > a]))
+
+    def nearest(self, px, py):
+        # Tıklanan noktaya en yakın örnek. Halka halka genişler; r halkasından
+        # sonraki hücreler en az r*cell uzakta olduğundan erken durulur.
+        if self.n_valid == 0:
+            return -1
+        best, best_d = -1, np.inf
+        for r in range(max(self.nx, self.ny)):
+            pad = (r + 0.5) * self.cell
+            cand = self.query_box(px - pad, px + pad, py - pad, py + pad)
+            if len(cand):
+                d = (self.x[cand] - px) ** 2 + (self.y[cand] - py) ** 2
+                k = int(np.nanargmin(d))
+                if d[k] < best_d:
+                    best, best_d = int(cand[k]), d[k]
+            if best >= 0 and best_d <= (r * self.cell) ** 2:
+                break
+        return best
+
+
+def decimate(indices, max_points=MAX_POINTS):
+    # Görünen örnekleri seyrelt; iz görünümden çıkıp geri girdiğinde çizgi kopar (NaN)
+    if len(indices) == 0:
+        return indices, np.zeros(0, dtype=bool)
+    step = max(1, int(np.ceil(len(indices) / max_points)))
+    idx = indices[::step]
+    breaks = np.diff(idx) > 2 * step
+    return idx, np.concatenate(([False], breaks))
+
+
+class MapView:
+    # 2D hareketli harita. ax: matplotlib Axes (2D).
+    #   mv.update(i) -> uçak i. örneğe; görünüm parçadan çıkınca iz yeniden kesilir
+    #   mv.sample_at(event) -> tıklanan yere en yakın örnek
+    def __init__(self, ax, lat, lon, scale=ANGLE_SCALE, radius=VIEW_RADIUS):
+        self.ax = ax
+        self.scale = scale
+        self.origin = track_origin(lat, lon, scale)
+        self.x, self.y = project_track(lat, lon, scale, self.origin)
+        self.index = GridIndex(self.x, self.y)
+        self.radius = radius
+        self.tile = None     # (x0, x1, y0, y1) çizili parça
+        self.follow = True
+
+        self.full_line, = ax.plot([], [], color='#004400', linewidth=0.6, alpha=0.5)
+        self.tile_line, = ax.plot([], [], color='#00aa00', linewidth=1.0)
+        self.plane_marker, = ax.plot([], [], marker='^', color='cyan', markersize=10, linestyle='None')
+        ax.set_aspect('equal', adjustable='box')
+        ax.set_xlabel('Doğu (m)', color='gray')
+        ax.set_ylabel('Kuzey (m)', color='gray')
+
+        # Genel görünüm için kaba (sabit adımlı) iz bir kez çizilir
+        n = len(self.x)
+        step = max(1, int(np.ceil(n / MAX_POINTS)))
+        self.full_line.set_data(self.x[::step], self.y[::step])
+        self.others = []     # karşılaştırılan kayıtlar: (x, y, marker)
+
+    def add_track(self, lat, lon, color):
+        # Ek kayıt aynı başlangıç noktasına göre çevrilir; seyreltilmiş iz bir kez çizilir
+        x, y = project_track(lat, lon, self.scale, self.origin)
+        step = max(1, int(np.ceil(len(x) / MAX_POINTS)))
+        self.ax.plot(x[::step], y[::step], color=color, linewidth=0.6, alpha=0.5)
+        marker, = self.ax.plot([], [], marker='^', color=color, markersize=8, linestyle='None')
+        self.others.append((x, y, marker))
+        return len(self.others) - 1
+
+    def update_other(self, k, j):
+        # j < 0 -> bu anda kayıt yok
+        x, y, marker = self.others[k]
+        if j < 0: marker.set_data([], [])
+        else: marker.set_data([x[j]], [y[j]])
+
+    def _render_tile(self, cx, cy):
+        half = self.radius * TILE_MARGIN
+        x0, x1, y0, y1 = cx - half, cx + half, cy - half, cy + half
+        idx, breaks = decimate(self.index.query_box(x0, x1, y0, y1))
+        xs, ys = self.x[idx].copy(), self.y[idx].copy()
+        xs[breaks], ys[breaks] = np.nan, np.nan
+        self.tile_line.set_data(xs, ys)
+        self.tile = (x0, x1, y0, y1)
+
+    def _inside_tile(self, x0, x1, y0, y1):
+        if self.tile is None: return False
+        tx0, tx1, ty0, ty1 = self.tile
+        return x0 >= tx0 and x1 <= tx1 and y0 >= ty0 and y1 <= ty1
+
+    def update(self, i):
+        cx, cy = self.x[i], self.y[i]
+        if not (np.isfinite(cx) and np.isfinite(cy)):
+            return
+        self.plane_marker.set_data([cx], [cy])
+        if not self.follow:
+            return
+        r = self.radius
+        if not self._inside_tile(cx - r, cx + r, cy - r, cy + r):
+            self._render_tile(cx, cy)
+        self.ax.set_xlim(cx - r, cx + r)
+        self.ax.set_ylim(cy - r, cy + r)
+
+    def zoom(self, factor, i):
+        self.radius = float(np.clip(self.radius * factor, 200.0, 500000.0))
+        self.tile = None
+        self.update(i)
+
+    def sample_at(self, event):
+        if event.inaxes is not self.ax or event.xdata is None:
+            return -1
+        return self.index.nearest(event.xdata, event.ydata)
@@ -1,11 +1,13 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from BinaryRecording import load_recording
+from Derivatives import central_rate, unwrap_angle
 
 # ---------------------------------------------------------
 # AYARLAR
 # ---------------------------------------------------------
-FILE_NAME = 'i09.csv'
+FILE_NAME = 'i09.csv'        # .nrec de olabilir
 SAMPLE_RATE = 20           
 IS_NORMALIZED = True       
 
@@ -13,15 +15,11 @@ IS_NORMALIZED = True
 # 1. VERİ YÜKLEME
 # ---------------------------------------------------------
 try:
-    with open(FILE_NAME, 'r') as f:
-        header = f.readline().strip().replace('"', '')
-    cols = [c.strip() for c in header.split(',')]
-    df = pd.read_csv(FILE_NAME, skiprows=1, names=cols)
+    df = load_recording(FILE_NAME, columns=["TimeMarker", "RollAngle", "PitchAngle",
+                                            "RollRate", "PitchRate", "YawRate"])
 except FileNotFoundError:
     print(f"HATA: '{FILE_NAME}' bulunamadı!")
     exit()
-except Exception:
-    df = pd.read_csv(FILE_NAME)
 
 if "TimeMarker" in df.columns:
     df["TimeMarker"] = pd.to_datetime(df["TimeMarker"])
@@ -38,8 +36,10 @@ for col in analyze_cols:
     if col in df.columns:
         raw = pd.to_numeric(df[col], errors='coerce')
         val = raw * 180.0 if IS_NORMALIZED else raw
-        # 1 saniyelik mutlak değişim
-        results_calc[col] = val.diff(periods=SAMPLE_RATE).abs()
+        # 1 saniyelik mutlak değişim: x[i+10] - x[i-10] (merkezli; sistem rate'leriyle zamanda hizalı).
+        # Açılar 0..360 sarmalı: 359° -> 1° geçişi 358° değil 2° değişimdir
+        rate = central_rate(unwrap_angle(val.values), 1.0 / SAMPLE_RATE, window=SAMPLE_RATE + 1)
+        results_calc[col] = pd.Series(np.abs(rate), index=df.index)
 
 # ---------------------------------------------------------
 # 3. RATE VERİLERİ (System Data)
@@ -0,0 +1,142 @@
+import io
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from HeaderParser import sniff_header, read_recording
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+WORKERS = None                   # None -> çekirdek sayısı kadar
+MIN_PART_BYTES = 8 * 1024 ** 2   # Bundan küçük parçalara bölme
+PARTS_PER_WORKER = 4             # Yük dengesi için işçi başına parça
+PARALLEL_MIN_BYTES = 64 * 1024 ** 2  # Bundan küçük dosyalar tek süreçte okunur
+SCHEMA_SAMPLE_ROWS = 2000
+TIME_COLUMN = 'TimeMarker'
+
+# Dosya satır sınırlarından parçalara bölünür; her işçi kendi bayt aralığını
+# dosyadan okuyup bilinen şema (sütun + tip) ile ayrıştırır. Sonuçlar her sütun
+# için önceden ayrılmış tek bir diziye bir kez kopyalanır. TimeMarker,
+# read_recording ile aynı şekilde metin olarak döner.
+
+
+def infer_schema(path, header, indices, names):
+    sample = read_recording(path, header=header, nrows=SCHEMA_SAMPLE_ROWS,
+                            columns=names)
+    schema = {}
+    for i, name in zip(indices, names):
+        if name == TIME_COLUMN:
+            schema[i] = 't'
+        elif pd.api.types.is_integer_dtype(sample[name]):
+            schema[i] = 'int64'
+        else:
+            schema[i] = 'float64'
+    return schema
+
+def split_ranges(path, data_start, n_parts):
+    # [başlangıç, bitiş) bayt aralıkları; her sınır bir satır başına denk gelir
+    size = os.path.getsize(path)
+    cuts = [data_start]
+    with open(path, 'rb') as f:
+        for k in range(1, n_parts):
+            pos = data_start + (size - data_start) * k // n_parts
+            if pos <= cuts[-1]:
+                continue
+            f.seek(pos)
+            f.readline()
+            if f.tell() < size and f.tell() > cuts[-1]:
+                cuts.append(f.tell())
+    cuts.append(size)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+def parse_range(path, start, end, indices, names, schema, delimiter):
+    # İşçi süreçte çalışır
+    with open(path, 'rb') as f:
+        f.seek(start)
+        buf = f.read(end - start)
+    dtypes = {i: (str if dt == 't' else dt) for i, dt in schema.items()}
+    try:
+        df = pd.read_csv(io.BytesIO(buf), header=None, usecols=indices, sep=delimiter, dtype=dtypes)
+    except (ValueError, OverflowError):
+        # Tamsayı sütunda boş/bozuk değer -> bu parçada float olarak oku
+        dtypes = {i: (str if dt == 't' else 'float64') for i, dt in schema.items()}
+        df = pd.read_csv(io.BytesIO(buf), header=None, usecols=indices, sep=delimiter, dtype=dtypes)
+
+    out = {}
+    for i, name in zip(indices, names):
+        col = df[i]
+        if schema[i] == 't':
+            out[name] = col.to_numpy(dtype=object)
+        else:
+            out[name] = col.values
+    return out
+
+def read_csv_parallel(path, columns=None, workers=WORKERS):
+    header = sniff_header(path)
+    indices, names = header.projection(columns)
+    schema = infer_schema(path, header, indices, names)
+    with open(path, 'rb') as f:
+        f.readline()
+        data_start = f.tell()
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    n_parts = max(1, min(workers * PARTS_PER_WORKER, (size - data_start) // MIN_PART_BYTES))
+    ranges = split_ranges(path, data_start, n_parts)
+
+    n = len(ranges)
+    with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+        parts = list(pool.map(parse_range, [path] * n, [r[0] for r in ranges], [r[1] for r in ranges],
+                              [indices] * n, [names] * n, [schema] * n, [header.delimiter] * n))
+
+    # Her sütun için tek hedef dizi; parçalar doğrudan yerine kopyalanır
+    total = sum(len(p[names[0]]) for p in parts) if names else 0
+    data = {}
+    for name in names:
+        dtype = np.result_type(*[p[name].dtype for p in parts])
+        out = np.empty(total, dtype=dtype)
+        pos = 0
+        for p in parts:
+            arr = p.pop(name)   # parça belleği hemen bırakılsın
+            out[pos:pos + len(arr)] = arr
+            pos += len(arr)
+        data[name] = out
+    return pd.DataFrame(data, copy=False)
+
+def read_csv_auto(path, columns=None, workers=WORKERS):
+    # Büyük dosyalarda paralel, küçüklerde tek geçiş
+    if os.path.getsize(path) >= PARALLEL_MIN_BYTES and (workers or os.cpu_count() or 1) > 1:
+        return read_csv_parallel(path, columns, workers)
+    return read_recording(path, columns=columns)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Büyük CSV kayıtlarını paralel içe aktarma")
+    parser.add_argument("csv")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--columns", nargs="*")
+    parser.add_argument("--compare", action="store_true", help="Tek süreçli okuma ile süre karşılaştır")
+    parser.add_argument("--to-nrec", metavar="HEDEF", help="Okunan veriyi .nrec olarak yaz")
+    args = parser.parse_args(argv)
+
+    t = time.perf_counter()
+    df = read_csv_parallel(args.csv, args.columns, args.workers)
+    dt = time.perf_counter() - t
+    print(f"Paralel: {len(df)} kayıt, {len(df.columns)} sütun, {dt:.2f} sn "
+          f"({args.workers or os.cpu_count()} işçi)")
+    if args.compare:
+        t = time.perf_counter()
+        read_recording(args.csv, columns=args.columns)
+        print(f"Tek süreç: {time.perf_counter() - t:.2f} sn")
+    if args.to_nrec:
+        from BinaryRecording import RecordingWriter, infer_schema as rec_schema
+        with RecordingWriter(args.to_nrec, rec_schema(df)) as w:
+            w.write(df)
+        print(f"Yazıldı: {args.to_nrec}")
+
+if __name__ == "__main__":
+    sys.exit(main())
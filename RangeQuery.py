@@ -0,0 +1,180 @@
+import sys
+import math
+import argparse
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+BLOCK = 64                    # Seyrek tablo blok boyu (blok içi düz taranır)
+
+# Kayıt değişmediği için güncellenebilir ağaç (segment tree) gerekmez:
+#   min / max: blok seyrek tablo -> O(1) sorgu, bellek n/B * log2(n/B)
+#   toplam / ortalama / sayı: önek toplamları -> O(1) sorgu
+# NaN değerler yok sayılır; boş veya tamamı NaN aralık -> NaN.
+
+_OPS = {"max": (np.fmax, max, -math.inf), "min": (np.fmin, min, math.inf)}
+
+
+class SparseTable:
+    # Blok max'ları (veya min'leri) üzerinde 2^k atlamalı tablo; uçlardaki yarım
+    # bloklar taranır (en fazla 2B eleman). leaf(i, j) verilirse [i, j) değerleri
+    # ondan alınır ve dizi saklanmaz (ör. |x| için ayrı kopya tutulmaz).
+    def __init__(self, values, op="max", block=BLOCK, leaf=None):
+        v = np.asarray(values, dtype=np.float64)
+        self.n = len(v)
+        self.block = block
+        self.values = v if leaf is None else None
+        self.leaf = leaf
+        self.reduce, self.pick, self.empty = _OPS[op]
+        nb = -(-self.n // block)
+        padded = np.full(nb * block, np.nan)
+        padded[:self.n] = v
+        level = self.reduce.reduce(padded.reshape(nb, block), axis=1) if nb else np.zeros(0)
+        self.levels = [np.where(np.isnan(level), self.empty, level)]
+        span = 1
+        while 2 * span <= nb:
+            self.levels.append(self.reduce(self.levels[-1][:-span], self.levels[-1][span:]))
+            span *= 2
+
+    def nbytes(self):
+        return sum(a.nbytes for a in self.levels)
+
+    def _scan(self, i, j):
+        m = self.reduce.reduce(self.values[i:j] if self.leaf is None else self.leaf(i, j))
+        return float(m) if m == m else self.empty
+
+    def query(self, i, j):
+        i, j = max(0, int(i)), min(self.n, int(j))
+        if j <= i:
+            return math.nan
+        B = self.block
+        bi, bj = -(-i // B), j // B               # tam blok aralığı [bi, bj)
+        if bj <= bi:
+            m = self._scan(i, j)
+        else:
+            k = (bj - bi).bit_length() - 1
+            lv = self.levels[k]
+            m = self.pick(float(lv[bi]), float(lv[bj - (1 << k)]))
+            if i < bi * B: m = self.pick(m, self._scan(i, bi * B))
+            if bj * B < j: m = self.pick(m, self._scan(bj * B, j))
+        return m if m != self.empty else math.nan
+
+
+class SparseMax(SparseTable):
+    def __init__(self, values, block=BLOCK, leaf=None):
+        super().__init__(values, "max", block, leaf)
+
+    def max(self, i, j):
+        return self.query(i, j)
+
+
+class RangeQuery:
+    # Tek kanal: herhangi bir [i, j) aralığında min, max, toplam, ortalama, geçerli örnek sayısı
+    def __init__(self, values, block=BLOCK):
+        v = np.asarray(values, dtype=np.float64)
+        self.n = len(v)
+        self.max_table = SparseTable(v, "max", block)
+        self.min_table = SparseTable(v, "min", block)
+        ok = ~np.isnan(v)
+        self.csum = np.concatenate(([0.0], np.cumsum(np.where(ok, v, 0.0))))
+        self.ccount = np.concatenate(([0], np.cumsum(ok)))
+
+    def nbytes(self):
+        return self.max_table.nbytes() + self.min_table.nbytes() + self.csum.nbytes + self.ccount.nbytes
+
+    def _clip(self, i, j):
+        i, j = min(max(0, int(i)), self.n), min(max(0, int(j)), self.n)
+        return i, max(i, j)
+
+    def max(self, i, j):
+        return self.max_table.query(i, j)
+
+    def min(self, i, j):
+        return self.min_table.query(i, j)
+
+    def count(self, i, j):
+        i, j = self._clip(i, j)
+        return int(self.ccount[j] - self.ccount[i])
+
+    def sum(self, i, j):
+        i, j = self._clip(i, j)
+        return float(self.csum[j] - self.csum[i])
+
+    def mean(self, i, j):
+        c = self.count(i, j)
+        return self.sum(i, j) / c if c else math.nan
+
+    def limits(self, i, j, margin=0.1, min_margin=0.01):
+        # Eksen otomatik ölçek: (alt, üst); aralık boşsa None
+        lo, hi = self.min(i, j), self.max(i, j)
+        if not (lo == lo and hi == hi):
+            return None
+        pad = max((hi - lo) * margin, min_margin)
+        return lo - pad, hi + pad
+
+    def stats(self, i, j):
+        return {"rows": max(0, min(self.n, j) - max(0, i)), "valid": self.count(i, j),
+                "min": self.min(i, j), "max": self.max(i, j),
+                "mean": self.mean(i, j), "sum": self.sum(i, j)}
+
+
+def frame_queries(df, columns=None):
+    # Sütun -> RangeQuery; sütun verilmezse tamamen sayısal olmayanlar atlanır
+    out = {}
+    for c in columns or df.columns:
+        vals = pd.to_numeric(df[c], errors='coerce')
+        if columns or vals.notna().any():
+            out[c] = RangeQuery(vals.values)
+    return out
+
+
+def section_stats(queries, i, j):
+    return pd.DataFrame({c: q.stats(i, j) for c, q in queries.items()}).T
+
+
+def _row_range(text, times=None):
+    # "a:b" satır, "a-b" saniye (s son eki), "HH:MM:SS-HH:MM:SS" zaman
+    if times is not None and text.count(":") >= 4:
+        t0, t1 = text.split("-", 1)
+        day = str(times[0]).split(" ")[0]
+        t = pd.to_datetime(pd.Series(times), errors='coerce').values
+        a = int(np.searchsorted(t, np.datetime64(pd.Timestamp(f"{day} {t0}")), side='left'))
+        b = int(np.searchsorted(t, np.datetime64(pd.Timestamp(f"{day} {t1}")), side='right'))
+        return a, b
+    if text.endswith("s"):
+        a, b = text[:-1].split("-")
+        return int(float(a) * SAMPLE_RATE), int(float(b) * SAMPLE_RATE)
+    a, b = text.split(":")
+    return int(a or 0), int(b) if b else None
+
+
+def main(argv=None):
+    from BinaryRecording import load_recording
+    parser = argparse.ArgumentParser(description="Kayıt bölümü istatistikleri (min/max/ortalama) - O(1) aralık sorgusu")
+    parser.add_argument("recording")
+    parser.add_argument("ranges", nargs="+",
+                        help="Satır '1000:5000', saniye '60-120s' veya zaman '07:31:00-07:35:00'")
+    parser.add_argument("--columns", nargs="*", help="Varsayılan: tüm sayısal sütunlar")
+    parser.add_argument("--scale", type=float, default=1.0, help="Değerler bu çarpanla (ör. 180: derece)")
+    args = parser.parse_args(argv)
+
+    cols = (["TimeMarker"] + args.columns) if args.columns else None
+    df = load_recording(args.recording, columns=cols)
+    times = df["TimeMarker"].astype(str).values if "TimeMarker" in df.columns else None
+    data = df.drop(columns=["TimeMarker"], errors='ignore')
+    if args.scale != 1.0:
+        data = data.apply(pd.to_numeric, errors='coerce') * args.scale
+    queries = frame_queries(data)
+    for text in args.ranges:
+        a, b = _row_range(text, times)
+        b = len(df) if b is None else min(b, len(df))
+        span = f"{times[a]} - {times[b - 1]}" if times is not None and b > a else ""
+        print(f"\n[{a}:{b}) {(b - a) / SAMPLE_RATE:.1f} sn {span}")
+        with pd.option_context('display.width', 160, 'display.max_rows', 100):
+            print(section_stats(queries, a, b).round(4))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import sys
+import math
+import argparse
+from collections import deque
+import numpy as np
+from RangeQuery import SparseMax
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20
+WINDOW_S = 10.0               # "Son N sn" en büyük değeri
+PEAK_HOLD_S = 2.0             # Tepe değeri bu kadar sabit kalır...
+PEAK_DECAY = 10.0             # ...sonra saniyede bu kadar düşer (birim/sn)
+HIST_BIN = 1.0                # Histogram kutu genişliği (derece/sn)
+HIST_MAX = 200.0              # Üstü son kutuya yazılır
+
+# Aynı istatistikler iki yoldan, aynı sonuçla hesaplanır:
+#   Canlı (LiveRateStats): her örnekte O(1) güncelleme, bellek pencere boyuyla sınırlı
+#   Kayıt (SeekRateStats): yükte bir kez seyrek tablo (RangeQuery), her konumda O(1) sorgu
+# Böylece "şimdiye kadarki max" için kayıt uzunluğunda ek sütun tutulmaz.
+# Tepe tutma tanımı: t anındaki değer = max_k f_k(t), f_k = |x_k| (t - t_k <= tutma),
+# sonrasında |x_k| - düşüş * (t - t_k - tutma).
+
+
+# ---------------------------------------------------------
+# 1. CANLI (ÖRNEK ÖRNEK)
+# ---------------------------------------------------------
+class RunningExtrema:
+    def __init__(self):
+        self.max = -math.inf
+        self.min = math.inf
+        self.count = 0
+
+    def update(self, x):
+        if x == x:                          # NaN atlanır
+            if x > self.max: self.max = x
+            if x < self.min: self.min = x
+            self.count += 1
+        return self.max
+
+
+class WindowedMax:
+    # Son n örneğin en büyüğü: azalan sıralı kuyruk (amortize O(1))
+    def __init__(self, n):
+        self.n = n
+        self.i = 0
+        self.q = deque()                    # (indeks, değer), değerler azalan
+
+    def update(self, x):
+        q = self.q
+        if x == x:
+            while q and q[-1][1] <= x:
+                q.pop()
+            q.append((self.i, x))
+        while q and q[0][0] <= self.i - self.n:
+            q.popleft()
+        self.i += 1
+        return q[0][1] if q else math.nan
+
+
+class PeakHold:
+    # Tutma penceresi içi: WindowedMax; pencereden çıkan örnekler |x| + düşüş*t
+    # olarak tek bir koşan max'ta tutulur (yukarıdaki tanımla birebir aynı)
+    def __init__(self, hold_s=PEAK_HOLD_S, decay=PEAK_DECAY, sample_rate=SAMPLE_RATE):
+        self.hold_n = int(round(hold_s * sample_rate))
+        self.hold_s = hold_s
+        self.decay = decay
+        self.dt = 1.0 / sample_rate
+        self.window = WindowedMax(self.hold_n + 1)
+        self.recent = deque(maxlen=self.hold_n + 1)
+        self.old = -math.inf
+        self.i = 0
+
+    def update(self, x):
+        if len(self.recent) == self.recent.maxlen:
+            k, v = self.i - self.hold_n - 1, self.recent[0]
+            if v == v:
+                self.old = max(self.old, v + self.decay * k * self.dt)
+        self.recent.append(x)
+        held = self.window.update(x)
+        t = self.i * self.dt
+        self.i += 1
+        decayed = self.old - self.decay * (t - self.hold_s)
+        return held if not decayed > held else decayed
+
+
+class RateHistogram:
+    def __init__(self, bin_width=HIST_BIN, max_value=HIST_MAX):
+        self.bin_width = bin_width
+        self.counts = np.zeros(int(math.ceil(max_value / bin_width)) + 1, dtype=np.int64)
+
+    def add(self, x):
+        if x == x:
+            self.counts[min(int(x / self.bin_width), len(self.counts) - 1)] += 1
+
+    def add_many(self, values):
+        v = np.asarray(values, dtype=np.float64)
+        v = v[np.isfinite(v)]
+        idx = np.minimum((v / self.bin_width).astype(np.int64), len(self.counts) - 1)
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+
+    def percentile(self, q):
+        total = self.counts.sum()
+        if total == 0:
+            return math.nan
+        k = int(np.searchsorted(np.cumsum(self.counts), q / 100.0 * total))
+        return (k + 1) * self.bin_width     # kutunun üst sınırı
+
+    def total(self):
+        return int(self.counts.sum())
+
+
+class LiveRateStats:
+    # Akış için: |rate| örnekleri geldikçe
+    def __init__(self, window_s=WINDOW_S, hold_s=PEAK_HOLD_S, decay=PEAK_DECAY, sample_rate=SAMPLE_RATE):
+        self.extrema = RunningExtrema()
+        self.window = WindowedMax(int(round(window_s * sample_rate)))
+        self.peak = PeakHold(hold_s, decay, sample_rate)
+        self.hist = RateHistogram()
+        self.last = (math.nan,) * 4
+
+    def update(self, x):
+        a = abs(x)
+        self.hist.add(a)
+        self.last = (x, self.extrema.update(a), self.window.update(a), self.peak.update(a))
+        return self.last
+
+
+# ---------------------------------------------------------
+# 2. KAYIT (HERHANGİ BİR KONUMDA)
+# ---------------------------------------------------------
+class SeekRateStats:
+    # Kayıt için: |rate| dizisi bir kez işlenir, her konumda LiveRateStats ile aynı değerler
+    def __init__(self, values, window_s=WINDOW_S, hold_s=PEAK_HOLD_S, decay=PEAK_DECAY,
+                 sample_rate=SAMPLE_RATE):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.window_n = int(round(window_s * sample_rate))
+        self.hold_n = int(round(hold_s * sample_rate))
+        self.hold_s, self.decay, self.dt = hold_s, decay, 1.0 / sample_rate
+        # Tablolar kurulurken geçici |x| dizisi kullanılır; sorgularda sadece ham dizi okunur
+        x, k_dt = self.values, decay * self.dt
+        a = np.abs(x)
+        self.table = SparseMax(a, leaf=lambda i, j: np.abs(x[i:j]))
+        self.decay_table = SparseMax(a + k_dt * np.arange(len(a)),
+                                     leaf=lambda i, j: np.abs(x[i:j]) + k_dt * np.arange(i, j))
+        self.hist = RateHistogram()
+        self.hist.add_many(a)
+
+    def nbytes(self):
+        return self.table.nbytes() + self.decay_table.nbytes() + self.hist.counts.nbytes
+
+    def at(self, idx):
+        # -> (anlık, şimdiye kadar max, son N sn max, tepe tutma)
+        idx = int(idx)
+        held = self.table.max(idx - self.hold_n, idx + 1)
+        decayed = self.decay_table.max(0, idx - self.hold_n) - self.decay * (idx * self.dt - self.hold_s)
+        return (float(self.values[idx]), self.table.max(0, idx + 1),
+                self.table.max(idx - self.window_n + 1, idx + 1),
+                held if not decayed > held else decayed)
+
+
+def main(argv=None):
+    # Kayıt ve canlı yolun aynı sonucu verdiğini ve sorgu süresini gösterir
+    import time
+    from BinaryRecording import load_recording
+    parser = argparse.ArgumentParser(description="Açısal hız istatistikleri (max, son N sn, tepe tutma, histogram)")
+    parser.add_argument("recording")
+    parser.add_argument("--channels", nargs="*", default=["RollRate", "PitchRate", "YawRate"])
+    args = parser.parse_args(argv)
+
+    df = load_recording(args.recording, columns=args.channels)
+    missing = [c for c in args.channels if c not in df.columns]
+    if missing:
+        print(f"Kayıtta yok, atlanıyor: {', '.join(missing)}")
+    channels = [c for c in args.channels if c in df.columns]
+    if not channels:
+        parser.error(f"{args.recording}: istenen kanalların hiçbiri yok ({', '.join(args.channels)}); "
+                     "--channels ile mevcut kanalları verin")
+    for c in channels:
+        x = df[c].values.astype(np.float64) * 180.0       # Normalize -> derece/sn
+        t = time.perf_counter()
+        seek = SeekRateStats(x)
+        t_build = time.perf_counter() - t
+        live = LiveRateStats()
+        t = time.perf_counter()
+        rows = [live.update(v) for v in x]
+        t_live = (time.perf_counter() - t) / len(x) * 1e6
+        probe = np.linspace(0, len(x) - 1, 2000).astype(int)
+        t = time.perf_counter()
+        got = [seek.at(i) for i in probe]
+        t_seek = (time.perf_counter() - t) / len(probe) * 1e6
+        diff = max(abs(a - b) for i, g in zip(probe, got) for a, b in zip(g[1:], rows[i][1:]))
+        h = seek.hist
+        print(f"{c:<10} max {seek.table.max(0, len(x)):7.1f}  p50/p95/p99 {h.percentile(50):.0f}/"
+              f"{h.percentile(95):.0f}/{h.percentile(99):.0f} °/s | tablo {t_build * 1000:.1f} ms "
+              f"{seek.nbytes() / 1e3:.0f} kB, sorgu {t_seek:.1f} µs, canlı {t_live:.1f} µs/örnek, "
+              f"fark {diff:.2g}")
+
+if __name__ == "__main__":
+    sys.exit(main())
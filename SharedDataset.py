@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import struct
+import hashlib
+import argparse
+import subprocess
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from BinaryRecording import load_recording
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+ENV_NAME = 'NAV_SHARED_DATASET'   # Görünüm süreçlerine paylaşılan bloğun adı bu ortam değişkeniyle geçer
+NAME_PREFIX = 'navrec_'
+ALIGN = 64                        # Sütunlar bu sınıra hizalanır
+TIME_COLUMN = 'TimeMarker'
+
+# Blok düzeni: [4 bayt başlık uzunluğu][JSON başlık][hizalama][sütun 1][sütun 2]...
+# Başlık her sütunun tipini/ofsetini tutar; bağlanan süreç numpy görünümlerini
+# doğrudan paylaşılan belleğin üzerine kurar (kopya ve CSV ayrıştırma yok).
+# Görünümler salt okunurdur; türetilmiş sütunlar her süreçte yeni dizilere yazılır.
+
+
+def dataset_name(path):
+    # Aynı dosya (yol + boyut + zaman) için her süreçte aynı isim
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime}"
+    return NAME_PREFIX + hashlib.sha1(key.encode()).hexdigest()[:16]
+
+def _attach_shm(name):
+    # Bağlanan süreç bloğu silmesin (3.13 öncesinde resource_tracker çıkışta siliyor)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+def _column_array(series):
+    # Paylaşılacak tip: zaman -> datetime64[s], tamsayı -> int64, diğerleri -> float64
+    if series.name == TIME_COLUMN:
+        t = pd.to_datetime(series, errors='coerce')
+        return t.values.astype('datetime64[s]')
+    if pd.api.types.is_integer_dtype(series):
+        return series.values.astype(np.int64)
+    vals = pd.to_numeric(series, errors='coerce')
+    if vals.isna().all() and series.notna().any():
+        return None                              # sayısal olmayan sütun paylaşılmaz
+    return vals.values.astype(np.float64)
+
+
+class SharedDataset:
+    def __init__(self, shm, header, owner):
+        self.shm = shm
+        self.header = header
+        self.owner = owner
+        self.name = shm.name
+        self.n_rows = header["n_rows"]
+        self.source = header.get("source")
+        self.arrays = {}
+        for c in header["columns"]:
+            a = np.ndarray((self.n_rows,), dtype=np.dtype(c["dtype"]), buffer=shm.buf, offset=c["offset"])
+            a.flags.writeable = False
+            self.arrays[c["name"]] = a
+
+    @classmethod
+    def create(cls, path, columns=None, name=None):
+        # Kaydı bir kez okuyup paylaşılan belleğe yazar; bu süreç sahibidir (unlink)
+        df = load_recording(path, columns=columns)
+        arrays = {}
+        for c in df.columns:
+            a = _column_array(df[c])
+            if a is not None:
+                arrays[c] = a
+        del df
+
+        cols, offset = [], 0
+        for c, a in arrays.items():
+            cols.append({"name": c, "dtype": a.dtype.str, "offset": offset})
+            offset += -(-a.nbytes // ALIGN) * ALIGN
+        header = {"n_rows": len(next(iter(arrays.values()))) if arrays else 0,
+                  "source": os.path.abspath(path), "created": time.time(), "columns": cols}
+        # Başlık boyu sütun ofsetlerine bağlı: önce ölç, sonra ofsetleri kaydır
+        raw = json.dumps(header).encode()
+        data_start = -(-(4 + len(raw) + 64 * len(cols) + 64) // ALIGN) * ALIGN
+        for c in cols:
+            c["offset"] += data_start
+        raw = json.dumps(header).encode()
+        assert 4 + len(raw) <= data_start
+
+        shm = shared_memory.SharedMemory(name=name or dataset_name(path), create=True,
+                                         size=max(1, data_start + offset))
+        shm.buf[:4] = struct.pack('<I', len(raw))
+        shm.buf[4:4 + len(raw)] = raw
+        for c in cols:
+            a = arrays[c["name"]]
+            np.ndarray(a.shape, a.dtype, buffer=shm.buf, offset=c["offset"])[:] = a
+        return cls(shm, header, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        shm = _attach_shm(name)
+        (hlen,) = struct.unpack('<I', bytes(shm.buf[:4]))
+        header = json.loads(bytes(shm.buf[4:4 + hlen]).decode())
+        return cls(shm, header, owner=False)
+
+    @classmethod
+    def open(cls, path, columns=None):
+        # Başka süreç yüklediyse bağlan, yoksa yükle (o zaman sahibi bu süreç olur)
+        try:
+            return cls.attach(dataset_name(path))
+        except FileNotFoundError:
+            return cls.create(path, columns)
+
+    def frame(self, columns=None):
+        # Kopyasız DataFrame (sütunlar paylaşılan bellek görünümü)
+        names = [c for c in (columns or self.arrays) if c in self.arrays]
+        return pd.DataFrame({c: self.arrays[c] for c in names}, copy=False)
+
+    def nbytes(self):
+        return sum(a.nbytes for a in self.arrays.values())
+
+    def close(self):
+        self.arrays = {}
+        try:
+            self.shm.close()
+        except BufferError:
+            pass            # dışarıda hâlâ görünüm var; süreç çıkışında serbest kalır
+        if self.owner:
+            try: self.shm.unlink()
+            except FileNotFoundError: pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_frame(path, columns=None):
+    # Analiz betikleri için: ENV_NAME ile verilmiş (veya bu dosya için açık) paylaşılan
+    # kayıt varsa kopyasız görünüm, yoksa normal okuma.
+    # Dönüş: (DataFrame, SharedDataset veya None) - görünüm kullanıldığı sürece ikincisi tutulmalı
+    name = os.environ.get(ENV_NAME)
+    try:
+        ds = SharedDataset.attach(name) if name else SharedDataset.attach(dataset_name(path))
+    except (FileNotFoundError, OSError):
+        return load_recording(path, columns=columns), None
+    if ds.source != os.path.abspath(path):
+        # Paylaşılan blok başka bir kayda ait: yanlış veriyle çalışmak yerine dosyayı oku
+        print(f"Paylaşılan kayıt ({ds.source}) {path} değil; dosyadan okunuyor")
+        ds.close()
+        return load_recording(path, columns=columns), None
+    return ds.frame(columns), ds
+
+
+# ---------------------------------------------------------
+# ÇOK SÜREÇLİ ÇALIŞTIRMA
+# ---------------------------------------------------------
+def run_views(path, scripts, columns=None):
+    # Kayıt bir kez yüklenir; her görünüm ayrı süreçte başlar ve aynı belleğe bağlanır
+    t = time.perf_counter()
+    with SharedDataset.create(path, columns) as ds:
+        print(f"{ds.name}: {ds.n_rows} satır, {len(ds.arrays)} sütun, "
+              f"{ds.nbytes() / 1e6:.1f} MB, {time.perf_counter() - t:.2f} sn")
+        env = dict(os.environ, **{ENV_NAME: ds.name})
+        procs = [subprocess.Popen([sys.executable] + script.split(), env=env) for script in scripts]
+        for p in procs:
+            p.wait()
+    return [p.returncode for p in procs]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydı paylaşılan belleğe bir kez yükle, görünümleri bağla")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("serve", help="Kaydı yükle ve kapatılana kadar paylaş")
+    p.add_argument("recording")
+    p.add_argument("--columns", nargs="*")
+    p = sub.add_parser("run", help="Kaydı yükle, verilen betikleri ayrı süreçlerde çalıştır")
+    p.add_argument("recording")
+    p.add_argument("scripts", nargs="+", help="Örn: main.py GreatCircleRaw.py 3DTrajectory.py")
+    p.add_argument("--columns", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "run":
+        codes = run_views(args.recording, args.scripts, args.columns)
+        return max(codes) if codes else 0
+
+    t = time.perf_counter()
+    with SharedDataset.create(args.recording, args.columns) as ds:
+        print(f"{ds.name}: {ds.n_rows} satır, {len(ds.arrays)} sütun, "
+              f"{ds.nbytes() / 1e6:.1f} MB, {time.perf_counter() - t:.2f} sn")
+        print(f"Betikler aynı dosyayı açınca bağlanır ({ENV_NAME}={ds.name}). Çıkış: Ctrl+C")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    sys.exit(main())
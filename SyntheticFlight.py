@@ -0,0 +1,176 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+SAMPLE_RATE = 20              # 20 Hz
+CHUNK_SECONDS = 1800          # Diske yarım saatlik bloklar halinde yazılır
+DEFAULT_SEED = 1234
+START_TIME = '2025-08-01 07:30:06'
+FT_PER_NM = 6076.12
+ROLL_TARGETS = [-45, -25, 0, 0, 0, 25, 45]   # Manevra hedef yatış açıları (derece)
+
+# DetailToAnalyse.csv ile aynı 22 sütunlu düzen
+BASE_COLUMNS = [
+    "TimeMarker", "Id", "VelocityX", "VelocityY", "VelocityZ", "PlatformAzimuth",
+    "RollAngle", "PitchAngle", "PresentTrueHeading", "PresentMagneticHeading",
+    "GreatCircleSteeringError", "ComputedCourseDeviation", "TimeToSteerpoint",
+    "DistanceToSteerpoint", "RelativeBearingToSteerpoint",
+    "RelativeBearingToNthWaypoint_Markpoint", "TimeToNthWaypoint_Markpoint",
+    "DistanceToNthWaypoint_Markpoint", "MagneticHeadingToNthWaypoint_Markpoint",
+    "TrueAirSpeed", "PresentMagneticGroundTrack", "PresentDriftAngle",
+]
+# FlightDashboard_3D.py'nin beklediği ek sütunlar
+EXTENDED_COLUMNS = BASE_COLUMNS + [
+    "BlendedLatitude", "BlendedLongitude", "BlendedEllipsoidHeight",
+    "RollRate", "PitchRate", "YawRate",
+]
+LAYOUTS = {"base": BASE_COLUMNS, "extended": EXTENDED_COLUMNS}
+
+
+class FlightSimulator:
+    # Basit bir uçuş modeli: rastgele dönüşler, tırmanış/alçalmalar ve
+    # rastgele uzunlukta steerpoint bacakları. Durum bloklar arasında taşınır,
+    # böylece çok saatlik kayıtlar sabit bellekle üretilebilir.
+    # Açılar dosyadaki gibi normalize (derece / 180) yazılır; yatış gerçek kayıtlar gibi
+    # işaretsiz [0, 2) (0..360°): -10° yatış 1.944 olarak görünür.
+    def __init__(self, seed=DEFAULT_SEED):
+        self.rng = np.random.default_rng(seed)
+        self.t = 0                       # toplam örnek sayısı
+        self.heading = 30.0              # derece
+        self.roll = 0.0
+        self.alt = 12000.0               # ft
+        self.lat, self.lon = 39.9, 32.8  # derece
+        self.leg_left = 0.0              # sn
+        self.leg_len = 1.0
+
+    def _turn_profile(self, n, dt):
+        # Parça parça sabit hedef yatış açısı; her parçada ~2 sn'lik birinci derece tepki
+        alpha = 1.0 - np.exp(-dt / 2.0)
+        roll = np.empty(n)
+        r = self.roll
+        i = 0
+        while i < n:
+            m = min(int(self.rng.integers(20, 90)) * SAMPLE_RATE, n - i)
+            target = self.rng.choice(ROLL_TARGETS)
+            k = np.arange(1, m + 1)
+            roll[i:i + m] = target + (r - target) * (1 - alpha) ** k
+            r = roll[i + m - 1]
+            i += m
+        self.roll = r
+        return roll + self.rng.normal(0, 0.05, n)
+
+    def chunk(self, n):
+        dt = 1.0 / SAMPLE_RATE
+        rng = self.rng
+        idx = self.t + np.arange(n)
+
+        roll = self._turn_profile(n, dt)
+        speed_kt = 420 + 15 * np.sin(idx / (SAMPLE_RATE * 600.0)) + rng.normal(0, 0.3, n)
+        speed_fts = speed_kt / 0.592484
+        yaw_rate = 1091.0 * np.tan(np.radians(roll)) / speed_kt      # koordineli dönüş (deg/s)
+        heading = (self.heading + np.cumsum(yaw_rate) * dt) % 360.0
+        self.heading = heading[-1]
+
+        vs = 20 * np.sin(idx / (SAMPLE_RATE * 300.0)) + rng.normal(0, 0.2, n)  # ft/s
+        alt = self.alt + np.cumsum(vs) * dt
+        self.alt = alt[-1]
+        pitch = np.degrees(np.arctan2(vs, speed_fts)) + rng.normal(0, 0.02, n)
+
+        hdg_rad = np.radians(heading)
+        vn, ve = speed_fts * np.cos(hdg_rad), speed_fts * np.sin(hdg_rad)
+        lat = self.lat + np.cumsum(vn) * dt / (FT_PER_NM * 60.0)
+        lon = self.lon + np.cumsum(ve) * dt / (FT_PER_NM * 60.0 * np.cos(np.radians(lat)))
+        self.lat, self.lon = lat[-1], lon[-1]
+
+        # Steerpoint bacakları: mesafe azalır, bacak bitince sıçrar
+        dist = np.empty(n)
+        left = self.leg_left
+        for i in range(0, n, SAMPLE_RATE):
+            if left <= 0:
+                self.leg_len = float(rng.integers(300, 900))
+                left = self.leg_len
+            m = min(SAMPLE_RATE, n - i)
+            dist[i:i + m] = (left - np.arange(m) * dt) * speed_kt[i:i + m] / 3600.0
+            left -= m * dt
+        self.leg_left = left
+        tts = dist / (speed_kt / 3600.0)
+
+        drift = rng.normal(0, 1.0, n)
+        track = (heading + drift) % 360.0
+        mag_var = 5.5
+        steer_err = rng.normal(0, 2.0, n)
+        course_dev = steer_err * 0.5
+
+        times = pd.Timestamp(START_TIME) + pd.to_timedelta(idx // SAMPLE_RATE, unit='s')
+        self.t += n
+
+        norm = lambda deg: np.asarray(deg) / 180.0
+        data = {
+            "TimeMarker": times.strftime('%Y-%m-%d %H:%M:%S'),
+            "Id": rng.integers(10**9, 10**12, n),
+            "VelocityX": ve, "VelocityY": vn, "VelocityZ": vs,
+            "PlatformAzimuth": norm(heading),
+            "RollAngle": norm(roll) % 2.0, "PitchAngle": norm(pitch),
+            "PresentTrueHeading": norm(heading),
+            "PresentMagneticHeading": norm((heading - mag_var) % 360.0),
+            "GreatCircleSteeringError": norm(steer_err),
+            "ComputedCourseDeviation": norm(course_dev),
+            "TimeToSteerpoint": np.round(tts), "DistanceToSteerpoint": np.round(dist * 10),
+            "RelativeBearingToSteerpoint": norm(steer_err),
+            "RelativeBearingToNthWaypoint_Markpoint": norm(steer_err),
+            "TimeToNthWaypoint_Markpoint": np.round(tts),
+            "DistanceToNthWaypoint_Markpoint": np.round(dist * 10),
+            "MagneticHeadingToNthWaypoint_Markpoint": norm((track - mag_var) % 360.0),
+            "TrueAirSpeed": np.round(speed_kt),
+            "PresentMagneticGroundTrack": norm((track - mag_var) % 360.0),
+            "PresentDriftAngle": norm(drift),
+            "BlendedLatitude": norm(lat), "BlendedLongitude": norm(lon),
+            "BlendedEllipsoidHeight": alt,
+            "RollRate": norm(np.gradient(roll, dt)), "PitchRate": norm(np.gradient(pitch, dt)),
+            "YawRate": norm(yaw_rate),
+        }
+        return pd.DataFrame(data)
+
+
+def generate(path, seconds, layout="extended", seed=DEFAULT_SEED):
+    cols = LAYOUTS[layout]
+    sim = FlightSimulator(seed)
+    total = int(seconds * SAMPLE_RATE)
+    with open(path, 'w', newline='') as f:
+        f.write(",".join(f'"{c}"' for c in cols) + "\n")
+        done = 0
+        while done < total:
+            n = min(CHUNK_SECONDS * SAMPLE_RATE, total - done)
+            sim.chunk(n)[cols].to_csv(f, header=False, index=False, float_format='%.15g')
+            done += n
+    return total
+
+
+def cached_path(directory, seconds, layout="extended", seed=DEFAULT_SEED):
+    # Aynı parametrelerle üretilen dosya tekrar kullanılır (karşılaştırılabilir ölçümler)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"synthetic_{layout}_{int(seconds)}s_seed{seed}.csv")
+    if not os.path.exists(path):
+        tmp = path + '.tmp'
+        generate(tmp, seconds, layout, seed)
+        os.replace(tmp, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik 20 Hz uçuş kaydı üretici")
+    parser.add_argument("output")
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default="extended")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+    n = generate(args.output, args.hours * 3600, args.layout, args.seed)
+    print(f"{args.output}: {n} kayıt ({args.layout}, seed={args.seed})")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import sys
+import math
+import time
+import argparse
+import numpy as np
+from LayoutViewer import ChannelStore, read_layout, LAYOUT_DIR
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+FILE_NAME = 'DetailToAnalyse.csv'
+SAMPLE_RATE = 20
+DEFAULT_CHANNELS = ["VelocityX", "VelocityY", "VelocityZ", "RollAngle", "PitchAngle", "PresentTrueHeading"]
+FANOUT = 4                # Piramitte her seviye bir öncekinin 4 kutusunu birleştirir
+TOP_BINS = 256            # En kaba seviye bundan küçük olunca durulur
+BINS_PER_PIXEL = 2        # Piksel başına en az bu kadar kutu istenir (ekstremler kaybolmasın)
+ZOOM_STEP = 1.5           # Fare tekerleği / +,- ile yakınlaştırma oranı
+PAN_STEP = 0.25           # Ok tuşları: görünür aralığın bu kadarı kadar kaydır
+
+# Her kanal için min/max piramidi bir kez kurulur (O(n), ham verinin ~2/3'ü kadar bellek).
+# Her yeniden çizimde görünür aralık ve eksen genişliği (piksel) ile uygun seviye
+# seçilir; çizilen nokta sayısı kayıt uzunluğundan değil ekran genişliğinden bağımsızdır.
+# En yakın seviyede ham 20 Hz örnekler döner.
+
+
+class MinMaxPyramid:
+    def __init__(self, values, fanout=FANOUT, top_bins=TOP_BINS):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.fanout = fanout
+        self.levels = []            # [(kutu boyu, min, max)] ; kutu boyu = fanout ** k
+        mins = maxs = self.values
+        size = 1
+        while len(mins) > top_bins:
+            pad = -len(mins) % fanout
+            if pad:
+                # Son yarım kutu NaN ile tamamlanır (fmin/fmax NaN'ı yok sayar)
+                mins = np.concatenate((mins, np.full(pad, np.nan)))
+                maxs = np.concatenate((maxs, np.full(pad, np.nan)))
+            mins = np.fmin.reduce(mins.reshape(-1, fanout), axis=1)
+            maxs = np.fmax.reduce(maxs.reshape(-1, fanout), axis=1)
+            size *= fanout
+            self.levels.append((size, mins, maxs))
+
+    def __len__(self):
+        return len(self.values)
+
+    def nbytes(self):
+        return sum(a.nbytes + b.nbytes for _, a, b in self.levels)
+
+    def query(self, lo, hi, width):
+        # [lo, hi) satır aralığı, width piksel -> (x satır, y, kutu boyu)
+        lo, hi = max(0, int(lo)), min(len(self.values), int(math.ceil(hi)))
+        if hi <= lo:
+            return np.zeros(0), np.zeros(0), 1
+        want = max(1, int(width) * BINS_PER_PIXEL)
+        if hi - lo <= want or not self.levels:
+            return np.arange(lo, hi, dtype=np.float64), self.values[lo:hi], 1
+        # En kaba ama hâlâ en az `want` kutu veren seviye (kutu boyu <= satır / want)
+        k = min(len(self.levels), math.floor(math.log((hi - lo) / want, self.fanout)))
+        if k < 1:
+            return np.arange(lo, hi, dtype=np.float64), self.values[lo:hi], 1
+        size, mins, maxs = self.levels[k - 1]
+        b0, b1 = lo // size, -(-hi // size)
+        # Her kutu için (min, max) çifti aynı x'e yazılır -> dikey çizgi; zarf korunur
+        x = np.repeat(np.arange(b0, b1, dtype=np.float64) * size + size / 2.0, 2)
+        y = np.empty(2 * (b1 - b0))
+        y[0::2], y[1::2] = mins[b0:b1], maxs[b0:b1]
+        return x, y, size
+
+
+# ---------------------------------------------------------
+# GEZGİN
+# ---------------------------------------------------------
+class TimeSeriesExplorer:
+    # Fare tekerleği: imleç etrafında yakınlaştır, sürükle/araç çubuğu: kaydır,
+    # ok tuşları: kaydır, +/-: yakınlaştır, a veya home: tüm uçuş
+    def __init__(self, channels, pyramids, title=""):
+        import matplotlib.pyplot as plt
+        self.plt = plt
+        # Ok tuşları araç çubuğunun geri/ileri geçmişine bağlı; kaydırma için boşalt
+        for km in ('keymap.back', 'keymap.forward'):
+            plt.rcParams[km] = [k for k in plt.rcParams[km] if k not in ('left', 'right')]
+        self.names = channels
+        self.pyramids = pyramids
+        self.n_rows = max(len(p) for p in pyramids)
+        self.fig, axes = plt.subplots(len(channels), 1, sharex=True, squeeze=False,
+                                      figsize=(16, max(6, 2.2 * len(channels))))
+        self.axes = axes[:, 0]
+        self.fig.suptitle(title, fontsize=14)
+        self.lines = []
+        for ax, name in zip(self.axes, channels):
+            line, = ax.plot([], [], color='#1f77b4', lw=1.0)
+            ax.set_ylabel(name, rotation=0, ha='right', fontsize=9)
+            ax.grid(True, alpha=0.3)
+            self.lines.append(line)
+        self.axes[-1].set_xlabel("Zaman (sn)")
+        self.status = self.fig.text(0.01, 0.005, "", fontsize=9, family='monospace')
+        self.busy = False
+
+        self.axes[0].callbacks.connect('xlim_changed', self.on_xlim)
+        self.fig.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self.fig.canvas.mpl_connect('key_press_event', self.on_key)
+        self.fig.canvas.mpl_connect('resize_event', lambda e: self.refresh())
+        self.fig.tight_layout(rect=[0, 0.02, 1, 0.97])
+        self.set_range(0, self.n_rows / SAMPLE_RATE)
+
+    def set_range(self, t0, t1):
+        # Kaydın dışına taşma; en az 10 örnek görünsün
+        span = min(max(t1 - t0, 10.0 / SAMPLE_RATE), self.n_rows / SAMPLE_RATE)
+        t0 = min(max(0.0, t0), self.n_rows / SAMPLE_RATE - span)
+        self.axes[0].set_xlim(t0, t0 + span)
+
+    def on_xlim(self, ax):
+        if not self.busy:
+            self.refresh()
+
+    def refresh(self):
+        self.busy = True
+        t = time.perf_counter()
+        t0, t1 = self.axes[0].get_xlim()
+        lo, hi = math.floor(t0 * SAMPLE_RATE), math.ceil(t1 * SAMPLE_RATE) + 1
+        points, size = 0, 1
+        for ax, line, pyr in zip(self.axes, self.lines, self.pyramids):
+            x, y, s = pyr.query(lo, hi, ax.bbox.width)
+            size = max(size, s)
+            line.set_data(x / SAMPLE_RATE, y)
+            points += len(x)
+            ok = y[np.isfinite(y)]
+            if len(ok):
+                y_min, y_max = ok.min(), ok.max()
+                margin = max((y_max - y_min) * 0.1, 1e-6)
+                ax.set_ylim(y_min - margin, y_max + margin)
+        ms = (time.perf_counter() - t) * 1000
+        step = "ham 20 Hz" if size == 1 else f"1:{size} min/max"
+        self.status.set_text(f"{t0:9.2f} - {t1:9.2f} sn | {max(0, hi - lo)} satır -> {points} nokta "
+                             f"({step}) | {ms:.1f} ms")
+        self.busy = False
+        self.fig.canvas.draw_idle()
+
+    def zoom(self, factor, center=None):
+        t0, t1 = self.axes[0].get_xlim()
+        c = (t0 + t1) / 2 if center is None else center
+        self.set_range(c - (c - t0) * factor, c + (t1 - c) * factor)
+
+    def on_scroll(self, event):
+        if event.inaxes is None:
+            return
+        self.zoom(1 / ZOOM_STEP if event.button == 'up' else ZOOM_STEP, event.xdata)
+
+    def on_key(self, event):
+        t0, t1 = self.axes[0].get_xlim()
+        if event.key in ('left', 'right'):
+            d = (t1 - t0) * PAN_STEP * (-1 if event.key == 'left' else 1)
+            self.set_range(t0 + d, t1 + d)
+        elif event.key in ('+', '='):
+            self.zoom(1 / ZOOM_STEP)
+        elif event.key == '-':
+            self.zoom(ZOOM_STEP)
+        elif event.key in ('a', 'home'):
+            self.set_range(0, self.n_rows / SAMPLE_RATE)
+
+    def run(self):
+        self.plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yakınlaştır/kaydır zaman serisi gezgini (piksel başına min/max)")
+    parser.add_argument("channels", nargs="*", help=f"Sütunlar (varsayılan: {' '.join(DEFAULT_CHANNELS)})")
+    parser.add_argument("-f", "--file", default=FILE_NAME, help="Kayıt (.csv / .nrec)")
+    parser.add_argument("--layout", help="Kanalları bir yerleşim dosyasından al (LayoutViewer)")
+    parser.add_argument("--layout-dir", default=LAYOUT_DIR)
+    args = parser.parse_args(argv)
+
+    store = ChannelStore(args.file)
+    t = time.perf_counter()
+    if args.layout:
+        layout = read_layout(args.layout, args.layout_dir)
+        arrays = store.panels(layout)
+        names = [p.get("title") or p.get("channel") or p.get("ref", "") for p in layout["panels"]]
+    else:
+        names = args.channels or DEFAULT_CHANNELS
+        store.load_columns(names)
+        arrays = [store.raw[c] for c in names]
+    t_load = time.perf_counter() - t
+    t = time.perf_counter()
+    pyramids = [MinMaxPyramid(a) for a in arrays]
+    print(f"{args.file}: {len(arrays[0])} satır, {len(names)} kanal | yükleme {t_load:.2f} sn, "
+          f"piramit {time.perf_counter() - t:.2f} sn ({sum(p.nbytes() for p in pyramids) / 1e6:.1f} MB)")
+    TimeSeriesExplorer(names, pyramids, title=args.file).run()
+
+if __name__ == "__main__":
+    sys.exit(main())
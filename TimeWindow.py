@@ -0,0 +1,236 @@
+import io
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from HeaderParser import sniff_header, read_recording
+from BinaryRecording import REC_EXT, RecordingReader, RecordingWriter, infer_schema, load_recording
+from Derivatives import central_rate, unwrap_angle
+
+# ---------------------------------------------------------
+# AYARLAR
+# ---------------------------------------------------------
+INDEX_SUFFIX = '.tidx.npz'
+SAMPLE_RATE = 20
+INDEX_EVERY = 20              # Her 20 satırda (~1 sn) bir indeks noktası
+SCAN_BLOCK = 16 * 1024 ** 2   # Satır sonu taramasında okunan blok
+TIME_COLUMN = 'TimeMarker'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_PAD = 10.0            # Olay çevresinde +- saniye
+# Normalize (0..2 = 0..360°) sarmalı açı kanalları; değişim hesabından önce açılır
+WRAPPED_ANGLES = ["RollAngle", "PitchAngle", "PlatformAzimuth", "PresentTrueHeading",
+                  "PresentMagneticHeading"]
+
+# Zaman indeksi: her INDEX_EVERY satırda bir (zaman, satır no, bayt ofseti).
+# [t0, t1] aralığı için ikili arama ile sadece ilgili bayt aralığı okunur.
+
+
+class TimeIndex:
+    def __init__(self, times, rows, offsets, data_start, size):
+        self.times = times        # int64 epoch sn
+        self.rows = rows
+        self.offsets = offsets
+        self.data_start = data_start
+        self.size = size
+
+    @classmethod
+    def build(cls, path):
+        header = sniff_header(path)
+        t = pd.to_datetime(read_recording(path, columns=[TIME_COLUMN], header=header)[TIME_COLUMN],
+                           format=TIME_FORMAT, errors='coerce')
+        # Eksik zamanlar bir öncekiyle doldurulur (arama için artan dizi gerekir)
+        secs = t.ffill().bfill().values.astype('datetime64[s]').astype(np.int64)
+
+        # Satır başlarının bayt ofsetleri (sadece her INDEX_EVERY'inci satır tutulur)
+        size = os.path.getsize(path)
+        offsets = []
+        with open(path, 'rb') as f:
+            f.readline()
+            data_start = pos = f.tell()
+            line = 0
+            while True:
+                buf = f.read(SCAN_BLOCK)
+                if not buf: break
+                nl = np.flatnonzero(np.frombuffer(buf, np.uint8) == 10)
+                # Bu bloktaki satır başları: ilk satır (pos) + her '\n' sonrası
+                head = np.array([pos] if line == 0 else [], dtype=np.int64)
+                starts = np.concatenate((head, pos + nl.astype(np.int64) + 1))
+                starts = starts[starts < size]
+                sel = (np.arange(len(starts)) + line) % INDEX_EVERY == 0
+                offsets.append(starts[sel])
+                line += len(starts)
+                pos += len(buf)
+        offsets = np.concatenate(offsets) if offsets else np.zeros(0, np.int64)
+        rows = np.arange(len(offsets), dtype=np.int64) * INDEX_EVERY
+        n = min(len(rows), (len(secs) + INDEX_EVERY - 1) // INDEX_EVERY)
+        rows, offsets = rows[:n], offsets[:n]
+        return cls(secs[rows], rows, offsets, data_start, size)
+
+    @classmethod
+    def load(cls, path, rebuild=False):
+        # Yan dosya (<kayıt>.tidx.npz) dosya boyutu/zamanı değişmediyse kullanılır
+        ipath = path + INDEX_SUFFIX
+        st = os.stat(path)
+        if not rebuild and os.path.exists(ipath):
+            z = np.load(ipath)
+            if int(z["size"]) == st.st_size and float(z["mtime"]) == st.st_mtime:
+                return cls(z["times"], z["rows"], z["offsets"], int(z["data_start"]), int(z["size"]))
+        idx = cls.build(path)
+        tmp = ipath + '.tmp.npz'
+        np.savez(tmp, times=idx.times, rows=idx.rows, offsets=idx.offsets,
+                 data_start=idx.data_start, size=st.st_size, mtime=st.st_mtime)
+        os.replace(tmp, ipath)
+        return idx
+
+    def byte_range(self, t0, t1):
+        # t0..t1 (epoch sn, dahil) aralığındaki tüm satırları kapsayan bayt aralığı
+        a = max(0, int(np.searchsorted(self.times, t0, side='left')) - 1)
+        b = int(np.searchsorted(self.times, t1, side='right'))
+        start = int(self.offsets[a]) if len(self.offsets) else self.data_start
+        end = int(self.offsets[b]) if b < len(self.offsets) else self.size
+        row0 = int(self.rows[a]) if len(self.rows) else 0
+        return start, end, row0
+
+
+def first_time(path):
+    # Kaydın ilk zaman damgası (epoch sn)
+    if path.lower().endswith(REC_EXT):
+        with RecordingReader(path) as rec:
+            return int(rec.t_first[0]) if len(rec.t_first) else None
+    t = TimeIndex.load(path).times
+    return int(t[0]) if len(t) else None
+
+def to_epoch(value, reference=None):
+    # "2025-08-01 07:30:20" veya sadece "07:30:20" (kaydın tarihi kullanılır)
+    text = str(value).strip()
+    if reference is not None and len(text) <= 8 and ':' in text:
+        day = pd.Timestamp(int(reference), unit='s').strftime('%Y-%m-%d')
+        text = f"{day} {text}"
+    return int(pd.Timestamp(text).floor('s').value // 10 ** 9)
+
+
+# ---------------------------------------------------------
+# 1. ARALIK ÇIKARMA
+# ---------------------------------------------------------
+def _csv_window(path, t0, t1, columns=None):
+    # -> (DataFrame, ham satır baytları)
+    header = sniff_header(path)
+    idx = TimeIndex.load(path)
+    start, end, row0 = idx.byte_range(t0, t1)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        buf = f.read(end - start)
+
+    wanted = None if columns is None else [TIME_COLUMN] + list(columns)
+    indices, names = header.projection(wanted)
+    df = pd.read_csv(io.BytesIO(buf), header=None, usecols=indices, sep=header.delimiter)
+    df.columns = names
+    df.index = pd.RangeIndex(row0, row0 + len(df))
+    secs = pd.to_datetime(df[TIME_COLUMN], format=TIME_FORMAT, errors='coerce') \
+             .values.astype('datetime64[s]').astype(np.int64)
+    keep = np.flatnonzero((secs >= t0) & (secs <= t1))
+    if len(keep) == 0:
+        return df.iloc[0:0], b''
+
+    # Ham satırlar (zaman artan olduğundan tutulan satırlar ardışıktır)
+    nl = np.flatnonzero(np.frombuffer(buf, np.uint8) == 10)
+    line_starts = np.concatenate(([0], nl + 1))
+    a = int(line_starts[keep[0]])
+    b = int(line_starts[keep[-1] + 1]) if keep[-1] + 1 < len(line_starts) else len(buf)
+    return df.iloc[keep[0]:keep[-1] + 1], buf[a:b]
+
+def _rec_window(path, t0, t1, columns=None):
+    with RecordingReader(path) as rec:
+        hit = np.flatnonzero((rec.t_last >= t0) & (rec.t_first <= t1))
+        if len(hit) == 0:
+            return rec.to_dataframe(columns, 0, 0)
+        start, stop = int(rec.row_starts[hit[0]]), int(rec.row_starts[hit[-1] + 1])
+        cols = None if columns is None else list(dict.fromkeys([TIME_COLUMN] + list(columns)))
+        df = rec.to_dataframe(cols, start, stop)
+    secs = df[TIME_COLUMN].values.astype('datetime64[s]').astype(np.int64)
+    return df[(secs >= t0) & (secs <= t1)]
+
+def extract(path, t0, t1, columns=None):
+    # Çizime hazır DataFrame; index = orijinal satır numarası
+    if path.lower().endswith(REC_EXT):
+        return _rec_window(path, t0, t1, columns)
+    return _csv_window(path, t0, t1, columns)[0]
+
+def write_window(path, t0, t1, out_path):
+    # Kırpılmış kayıt. CSV -> CSV: satırlar bayt bayt kopyalanır (yeniden biçimlenmez)
+    if not path.lower().endswith(REC_EXT) and not out_path.lower().endswith(REC_EXT):
+        df, raw = _csv_window(path, t0, t1)
+        with open(path, 'rb') as f:
+            header_line = f.readline()
+        with open(out_path, 'wb') as f:
+            f.write(header_line)
+            f.write(raw)
+        return len(df)
+    df = extract(path, t0, t1)
+    if out_path.lower().endswith(REC_EXT):
+        with RecordingWriter(out_path, infer_schema(df)) as w:
+            w.write(df.reset_index(drop=True))
+    else:
+        df = df.copy()
+        df[TIME_COLUMN] = df[TIME_COLUMN].dt.strftime(TIME_FORMAT)
+        with open(out_path, 'w', newline='') as f:
+            f.write(",".join(f'"{c}"' for c in df.columns) + "\n")
+            df.to_csv(f, header=False, index=False, float_format='%.9g')
+    return len(df)
+
+
+# ---------------------------------------------------------
+# 2. OLAYLAR (MaxPitchRollChg.py ile aynı tanım)
+# ---------------------------------------------------------
+def event_row(df, channel):
+    # *Rate kanalları: en büyük mutlak değer; açılar: en büyük 1 sn'lik değişim
+    if channel not in df.columns:
+        raise KeyError(f"Kanal bulunamadı: {channel}")
+    val = pd.to_numeric(df[channel], errors='coerce').values.astype(np.float64)
+    if channel.endswith('Rate'):
+        score = np.abs(val)
+    else:
+        # Merkezli 1 sn değişim: x[i+10] - x[i-10]
+        if channel in WRAPPED_ANGLES:
+            val = unwrap_angle(val, period=2.0)
+        score = np.abs(central_rate(val, 1.0 / SAMPLE_RATE, window=SAMPLE_RATE + 1))
+    return int(np.nanargmax(score)) if np.isfinite(score).any() else 0
+
+def event_time(path, channel):
+    df = load_recording(path, columns=[TIME_COLUMN, channel])
+    i = event_row(df, channel)
+    t = pd.to_datetime(df[TIME_COLUMN].iloc[i:i + 1])
+    return int(t.values.astype('datetime64[s]').astype(np.int64)[0]), i
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıttan zaman aralığı çıkarma")
+    parser.add_argument("recording")
+    parser.add_argument("--t0", help="Başlangıç (örn: 07:30:20 veya tam tarih)")
+    parser.add_argument("--t1", help="Bitiş")
+    parser.add_argument("--event", metavar="KANAL", help="Örn: RollRate, PitchAngle")
+    parser.add_argument("--pad", type=float, default=DEFAULT_PAD, help="Olay çevresi (sn)")
+    parser.add_argument("--columns", nargs="*")
+    parser.add_argument("-o", "--output", help="Kırpılmış kayıt (.csv veya .nrec)")
+    args = parser.parse_args(argv)
+
+    if args.event:
+        t, row = event_time(args.recording, args.event)
+        t0, t1 = t - int(args.pad), t + int(np.ceil(args.pad))
+        print(f"Olay ({args.event}): satır {row}, {pd.Timestamp(t, unit='s')}")
+    elif args.t0 and args.t1:
+        ref = first_time(args.recording)
+        t0, t1 = to_epoch(args.t0, ref), to_epoch(args.t1, ref)
+    else:
+        parser.error("--t0/--t1 veya --event gerekli")
+
+    if args.output:
+        n = write_window(args.recording, t0, t1, args.output)
+        print(f"{args.output}: {n} kayıt yazıldı")
+    else:
+        df = extract(args.recording, t0, t1, args.columns)
+        print(df)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,13 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from DerivedCache import DerivedCache
+from Derivatives import savgol_rate
+from SharedDataset import load_frame
 
 # 1. Veriyi Yükle
-df = pd.read_csv('DetailToAnalyse.csv')
+FILE_NAME = 'DetailToAnalyse.csv'
+df, shared = load_frame(FILE_NAME)   # SharedDataset.py ile paylaşıldıysa kopyasız bağlanır
 
 # Sütun isimlerini temizle (Eğer hala gerekiyorsa)
 df.columns = [col.strip().replace('"', '') for col in df.columns]
@@ -13,6 +17,11 @@ df.columns = [col.strip().replace('"', '') for col in df.columns]
 # Veri 20Hz olduğu için her satır arası sabit 0.05 sn kabul ediyoruz 
 # (Zaman damgaları 0 göründüğü için en sağlıklı yöntem budur)
 fixed_dt = 0.05 
+RATE_WINDOW = 9    # Savitzky-Golay penceresi (tek sayı, ~0.45 sn)
+RATE_ORDER = 2
+
+# Rate sütunları önbellekten gelir; dt veya pencere değişirse yeniden hesaplanır
+cache = DerivedCache(FILE_NAME)
 
 columns_to_analyze = [
     "VelocityX", "VelocityY", "VelocityZ", 
@@ -27,10 +36,14 @@ for col in columns_to_analyze:
         rate_col_name = f"{col}_Rate"
         # Sayısal veriye zorla
         df[col] = pd.to_numeric(df[col], errors='coerce')
-        # Değişim hızı = (Fark / 0.05)
-        # Gürültüyü azaltmak için 5 örnekli hareketli ortalama (rolling mean) ekledik
-        df[rate_col_name] = (df[col].diff() / fixed_dt).rolling(window=5, center=True).mean()
+        # Değişim hızı: Savitzky-Golay 1. türevi (fark + hareketli ortalama yerine tek geçiş,
+        # gürültü bastırması daha iyi; karşılaştırma için: python Derivatives.py)
+        cache.source(col, df[col].values)
+        df[rate_col_name] = cache.channel(rate_col_name, [col],
+                                          {"dt": fixed_dt, "window": RATE_WINDOW, "order": RATE_ORDER},
+                                          savgol_rate)
         rate_cols.append(rate_col_name)
+print(cache.summary())
 
 # NaN değerleri temizle (başlangıçtaki boşluklar için)
 df = df.fillna(0)
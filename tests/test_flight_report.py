@@ -0,0 +1,33 @@
+import os
+import numpy as np
+import pandas as pd
+from FlightReport import report_recording
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _roll_row(report):
+    return next(r for r in report["channels"] if r["channel"] == "RollAngle")
+
+
+def test_level_flight_has_no_bank_exceedance(tmp_path):
+    # -10° yatış kayıtta 349.8° (normalize 1.943) olarak durur
+    n = 2000
+    path = tmp_path / "level.csv"
+    pd.DataFrame({
+        "TimeMarker": pd.date_range("2025-08-01 07:30:00", periods=n, freq="50ms").strftime("%Y-%m-%d %H:%M:%S"),
+        "RollAngle": np.full(n, (-10.0 / 180.0) % 2.0),
+        "PitchAngle": np.full(n, 0.004),
+    }).to_csv(path, index=False)
+    report = report_recording(str(path))
+    roll = _roll_row(report)
+    assert roll["time_above_s"] == 0 and roll["excursions"] == 0
+    assert abs(roll["min"] + 10.0) < 1e-3 and abs(roll["max"] + 10.0) < 1e-3
+    _, _, under, over = report["histograms"]["RollAngle"]
+    assert under == 0 and over == 0
+
+
+def test_sample_recording_is_level():
+    roll = _roll_row(report_recording(os.path.join(ROOT, "DetailToAnalyse.csv")))
+    assert roll["time_above_s"] == 0
+    assert -20.0 < roll["min"] <= roll["max"] < 20.0
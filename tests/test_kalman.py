@@ -0,0 +1,27 @@
+import numpy as np
+from KalmanSmooth import fused_attitude, StreamingFuser, ATT_RATE_NOISE, ATT_MEAS_NOISE
+
+DT = 0.05
+
+
+def _roll_through_zero():
+    # -2° -> +2° yatış, kayıttaki gibi normalize 0..2 sarmalı
+    deg = np.linspace(-2.0, 2.0, 200)
+    rate = np.full(len(deg), 4.0 / (len(deg) * DT))
+    return deg, rate
+
+
+def test_fused_attitude_crosses_zero():
+    deg, rate = _roll_through_zero()
+    out = fused_attitude((deg / 180.0) % 2.0, rate / 180.0, DT) * 180.0
+    assert np.all(np.abs(out) <= 180.0)
+    assert np.max(np.abs(out - deg)) < 0.5
+
+
+def test_streaming_matches_batch_across_zero():
+    deg, rate = _roll_through_zero()
+    f = StreamingFuser(DT, ATT_RATE_NOISE, ATT_MEAS_NOISE, period=360.0, centered=True)
+    live = np.array([f.step(z, r) for z, r in zip(deg % 360.0, rate)])
+    batch = fused_attitude(deg % 360.0, rate, DT, period=360.0)
+    assert np.max(np.abs(live - deg)) < 0.5
+    assert np.allclose(live, batch)
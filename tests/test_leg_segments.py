@@ -0,0 +1,27 @@
+import numpy as np
+from LegSegments import leg_starts, SAMPLE_RATE, MIN_LEG_S
+
+
+def _distance(starts, n, length=5000.0):
+    # Her bacak başında kalan mesafe sıçrar, sonra satır başına 1 birim azalır
+    d = np.empty(n)
+    for a, b in zip(starts, list(starts[1:]) + [n]):
+        d[a:b] = length - np.arange(b - a)
+    return d
+
+
+def test_short_bounce_merges_into_previous_leg():
+    # 0: bacak, 1000: 3 sn'lik seçici oynaması, 1060: gerçek bacak
+    assert 60 < MIN_LEG_S * SAMPLE_RATE
+    d = _distance([0, 1000, 1060], 3000)
+    assert leg_starts(d).tolist() == [0, 1060]
+
+
+def test_repeated_bounces_and_short_tail():
+    d = _distance([0, 1000, 1030, 1060, 2950], 3000)
+    assert leg_starts(d).tolist() == [0, 1060]
+
+
+def test_legs_longer_than_min_are_kept():
+    d = _distance([0, 1000, 2000], 3000)
+    assert leg_starts(d).tolist() == [0, 1000, 2000]